@@ -2,6 +2,7 @@ import { useEffect } from 'react';
 import { useAppStore } from './stores/app-store';
 import { useSessionId } from './hooks/use-session-id';
 import { useIsMobile } from './hooks/use-is-mobile';
+import { useSessionEvents } from './hooks/use-session-events';
 import { motion, AnimatePresence, MotionConfig } from 'motion/react';
 import { PanelLeft } from 'lucide-react';
 import { PermissionBanner } from './components/layout/PermissionBanner';
@@ -12,6 +13,7 @@ export function App() {
   const { sidebarOpen, setSidebarOpen, toggleSidebar } = useAppStore();
   const [activeSessionId] = useSessionId();
   const isMobile = useIsMobile();
+  useSessionEvents();
 
   // Escape key closes mobile overlay
   useEffect(() => {
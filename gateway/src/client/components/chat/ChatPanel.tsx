@@ -5,6 +5,7 @@ import { useCommands } from '../../hooks/use-commands';
 import { MessageList } from './MessageList';
 import { ChatInput } from './ChatInput';
 import { CommandPalette } from '../commands/CommandPalette';
+import { createCommandSearch } from '../../lib/command-search';
 import type { CommandEntry } from '@shared/types';
 
 interface ChatPanelProps {
@@ -12,23 +13,32 @@ interface ChatPanelProps {
 }
 
 export function ChatPanel({ sessionId }: ChatPanelProps) {
-  const { messages, input, setInput, handleSubmit, status, error, stop, isLoadingHistory } =
-    useChatSession(sessionId);
+  const {
+    messages,
+    input,
+    setInput,
+    handleSubmit,
+    status,
+    error,
+    stop,
+    isLoadingHistory,
+    hasOlder,
+    loadOlder,
+  } = useChatSession(sessionId);
   const [showCommands, setShowCommands] = useState(false);
   const [commandQuery, setCommandQuery] = useState('');
   const [selectedIndex, setSelectedIndex] = useState(0);
 
   const { data: registry } = useCommands();
-  const allCommands = registry?.commands ?? [];
-
-  const filteredCommands = useMemo(() => {
-    if (!commandQuery) return allCommands;
-    const q = commandQuery.toLowerCase();
-    return allCommands.filter((cmd) => {
-      const searchText = `${cmd.fullCommand} ${cmd.description}`.toLowerCase();
-      return searchText.includes(q);
-    });
-  }, [allCommands, commandQuery]);
+  // Index is built once per registry; each keystroke only narrows it
+  const searchCommands = useMemo(
+    () => createCommandSearch(registry?.commands ?? []),
+    [registry]
+  );
+  const filteredCommands = useMemo(
+    () => searchCommands(commandQuery),
+    [searchCommands, commandQuery]
+  );
 
   // Reset selectedIndex when filter changes or palette opens/closes
   useEffect(() => {
@@ -107,7 +117,12 @@ export function ChatPanel({ sessionId }: ChatPanelProps) {
           </div>
         </div>
       ) : (
-        <MessageList messages={messages} status={status} />
+        <MessageList
+          messages={messages}
+          status={status}
+          hasOlder={hasOlder}
+          onLoadOlder={loadOlder}
+        />
       )}
 
       {error && (
@@ -1,3 +1,4 @@
+import { memo } from 'react';
 import { motion } from 'motion/react';
 import { ChevronRight } from 'lucide-react';
 import type { ChatMessage, MessageGrouping } from '../../hooks/use-chat-session';
@@ -20,7 +21,24 @@ function formatTime(timestamp: string): string {
   }
 }
 
-export function MessageItem({ message, grouping, isNew = false, isStreaming = false }: MessageItemProps) {
+// Skip re-rendering settled messages while another message streams in;
+// groupings are recomputed each update, so compare them by value.
+function areMessageItemPropsEqual(prev: MessageItemProps, next: MessageItemProps): boolean {
+  return (
+    prev.message === next.message &&
+    prev.grouping.position === next.grouping.position &&
+    prev.grouping.groupIndex === next.grouping.groupIndex &&
+    prev.isNew === next.isNew &&
+    prev.isStreaming === next.isStreaming
+  );
+}
+
+export const MessageItem = memo(function MessageItem({
+  message,
+  grouping,
+  isNew = false,
+  isStreaming = false,
+}: MessageItemProps) {
   const isUser = message.role === 'user';
   const { position, groupIndex } = grouping;
   const showIndicator = position === 'only' || position === 'first';
@@ -70,4 +88,4 @@ export function MessageItem({ message, grouping, isNew = false, isStreaming = fa
       </div>
     </motion.div>
   );
-}
+}, areMessageItemPropsEqual);
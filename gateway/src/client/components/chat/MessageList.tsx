@@ -1,4 +1,4 @@
-import { useRef, useEffect, useState, useCallback, useMemo } from 'react';
+import { useRef, useEffect, useLayoutEffect, useState, useCallback, useMemo } from 'react';
 import { motion, AnimatePresence } from 'motion/react';
 import { ArrowDown } from 'lucide-react';
 import { useVirtualizer } from '@tanstack/react-virtual';
@@ -28,10 +28,16 @@ export function computeGrouping(messages: ChatMessage[]): MessageGrouping[] {
 interface MessageListProps {
   messages: ChatMessage[];
   status?: 'idle' | 'streaming' | 'error';
+  hasOlder?: boolean;
+  onLoadOlder?: () => void;
 }
 
-export function MessageList({ messages, status }: MessageListProps) {
+/** Distance from the top (px) at which older history starts loading. */
+const LOAD_OLDER_THRESHOLD = 200;
+
+export function MessageList({ messages, status, hasOlder, onLoadOlder }: MessageListProps) {
   const parentRef = useRef<HTMLDivElement>(null);
+  const firstIdRef = useRef<string | undefined>(undefined);
   const [historyCount, setHistoryCount] = useState<number | null>(null);
   const [showScrollButton, setShowScrollButton] = useState(false);
   const groupings = useMemo(() => computeGrouping(messages), [messages]);
@@ -58,7 +64,10 @@ export function MessageList({ messages, status }: MessageListProps) {
     const isNearBottom =
       container.scrollHeight - container.scrollTop - container.clientHeight < threshold;
     setShowScrollButton(!isNearBottom);
-  }, []);
+    if (hasOlder && onLoadOlder && container.scrollTop < LOAD_OLDER_THRESHOLD) {
+      onLoadOlder();
+    }
+  }, [hasOlder, onLoadOlder]);
 
   useEffect(() => {
     const container = parentRef.current;
@@ -67,6 +76,26 @@ export function MessageList({ messages, status }: MessageListProps) {
     return () => container.removeEventListener('scroll', handleScroll);
   }, [handleScroll]);
 
+  // When older history is prepended, keep the previously first message in place
+  useLayoutEffect(() => {
+    const prevFirstId = firstIdRef.current;
+    firstIdRef.current = messages[0]?.id;
+    if (prevFirstId && messages[0]?.id !== prevFirstId) {
+      const prepended = messages.findIndex(m => m.id === prevFirstId);
+      if (prepended > 0) {
+        setHistoryCount(count => (count === null ? count : count + prepended));
+        virtualizer.scrollToIndex(prepended, { align: 'start' });
+      }
+    }
+
+    // A page shorter than the viewport has no scrollbar, so no scroll event
+    // would ever load more; keep loading until the list overflows
+    const container = parentRef.current;
+    if (container && hasOlder && onLoadOlder && container.scrollHeight <= container.clientHeight) {
+      onLoadOlder();
+    }
+  }, [messages, virtualizer, hasOlder, onLoadOlder]);
+
   // Auto-scroll to bottom on new messages (only if near bottom)
   useEffect(() => {
     if (messages.length > 0 && !showScrollButton) {
@@ -171,4 +171,52 @@ describe('MessageList', () => {
     const scrollContainer = container.querySelector('.overflow-y-auto');
     expect(scrollContainer).not.toBeNull();
   });
+
+  describe('loading older history', () => {
+    const messages: ChatMessage[] = [
+      { id: '1', role: 'user', content: 'Hello', timestamp: '' },
+      { id: '2', role: 'assistant', content: 'Hi there', timestamp: '' },
+    ];
+
+    afterEach(() => {
+      vi.restoreAllMocks();
+    });
+
+    function mockContainerSize(scrollHeight: number, clientHeight: number) {
+      vi.spyOn(HTMLElement.prototype, 'scrollHeight', 'get').mockReturnValue(scrollHeight);
+      vi.spyOn(HTMLElement.prototype, 'clientHeight', 'get').mockReturnValue(clientHeight);
+    }
+
+    it('loads older pages when the first page does not fill the viewport', () => {
+      mockContainerSize(160, 600);
+      const onLoadOlder = vi.fn();
+
+      render(<MessageList messages={messages} hasOlder onLoadOlder={onLoadOlder} />);
+
+      expect(onLoadOlder).toHaveBeenCalledTimes(1);
+    });
+
+    it('keeps loading after each short page until none remain', () => {
+      mockContainerSize(160, 600);
+      const onLoadOlder = vi.fn();
+      const older: ChatMessage = { id: '0', role: 'user', content: 'Earlier', timestamp: '' };
+      const oldest: ChatMessage = { id: '-1', role: 'assistant', content: 'First', timestamp: '' };
+
+      const { rerender } = render(<MessageList messages={messages} hasOlder onLoadOlder={onLoadOlder} />);
+      rerender(<MessageList messages={[older, ...messages]} hasOlder onLoadOlder={onLoadOlder} />);
+      expect(onLoadOlder).toHaveBeenCalledTimes(2);
+
+      rerender(<MessageList messages={[oldest, older, ...messages]} hasOlder={false} onLoadOlder={onLoadOlder} />);
+      expect(onLoadOlder).toHaveBeenCalledTimes(2);
+    });
+
+    it('waits for a scroll once the list overflows', () => {
+      mockContainerSize(2000, 600);
+      const onLoadOlder = vi.fn();
+
+      render(<MessageList messages={messages} hasOlder onLoadOlder={onLoadOlder} />);
+
+      expect(onLoadOlder).not.toHaveBeenCalled();
+    });
+  });
 });
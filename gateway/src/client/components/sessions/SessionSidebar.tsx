@@ -1,7 +1,8 @@
 import { useState, useMemo, useCallback } from 'react';
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '../../lib/api';
 import { useSessionId } from '../../hooks/use-session-id';
+import { useSessionList } from '../../hooks/use-sessions';
 import { useAppStore } from '../../stores/app-store';
 import { useIsMobile } from '../../hooks/use-is-mobile';
 import { SessionItem } from './SessionItem';
@@ -17,10 +18,7 @@ export function SessionSidebar() {
   const [permissionMode, setPermissionMode] = useState<'default' | 'dangerously-skip'>('default');
   const [justCreatedId, setJustCreatedId] = useState<string | null>(null);
 
-  const { data: sessions = [] } = useQuery({
-    queryKey: ['sessions'],
-    queryFn: api.listSessions,
-  });
+  const { sessions, hasMore, isLoadingMore, loadMore } = useSessionList();
 
   const createMutation = useMutation({
     mutationFn: api.createSession,
@@ -110,6 +108,15 @@ export function SessionSidebar() {
                 </div>
               </div>
             ))}
+            {hasMore && (
+              <button
+                onClick={loadMore}
+                disabled={isLoadingMore}
+                className="w-full rounded px-3 py-1.5 text-xs text-muted-foreground hover:bg-secondary/50 transition-colors duration-150 disabled:opacity-50"
+              >
+                {isLoadingMore ? 'Loading...' : 'Load older chats'}
+              </button>
+            )}
           </div>
         ) : (
           <div className="flex items-center justify-center h-32">
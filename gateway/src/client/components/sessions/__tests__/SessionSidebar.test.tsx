@@ -16,7 +16,7 @@ vi.mock('motion/react', () => ({
 // Mock api
 vi.mock('../../../lib/api', () => ({
   api: {
-    listSessions: vi.fn(),
+    listSessionsPage: vi.fn(),
     createSession: vi.fn(),
   },
 }));
@@ -51,6 +51,7 @@ vi.mock('../../../lib/session-utils', () => ({
     return groups;
   },
   formatRelativeTime: (iso: string) => iso >= '2026-02-07' ? '1h ago' : 'Jan 1',
+  SESSION_LIST_LIMIT: 200,
 }));
 
 function makeSession(overrides: Partial<Session> = {}): Session {
@@ -76,7 +77,7 @@ function renderWithQuery(ui: React.ReactElement) {
 describe('SessionSidebar', () => {
   beforeEach(() => {
     vi.clearAllMocks();
-    vi.mocked(api.listSessions).mockResolvedValue([]);
+    vi.mocked(api.listSessionsPage).mockResolvedValue({ sessions: [], nextCursor: null });
     mockSetSidebarOpen.mockClear();
   });
   afterEach(() => {
@@ -107,10 +108,13 @@ describe('SessionSidebar', () => {
   });
 
   it('renders sessions grouped by time', async () => {
-    vi.mocked(api.listSessions).mockResolvedValue([
-      makeSession({ id: 's1', title: 'Today session', updatedAt: '2026-02-07T12:00:00Z' }),
-      makeSession({ id: 's2', title: 'Old session', updatedAt: '2025-06-01T10:00:00Z' }),
-    ]);
+    vi.mocked(api.listSessionsPage).mockResolvedValue({
+      sessions: [
+        makeSession({ id: 's1', title: 'Today session', updatedAt: '2026-02-07T12:00:00Z' }),
+        makeSession({ id: 's2', title: 'Old session', updatedAt: '2025-06-01T10:00:00Z' }),
+      ],
+      nextCursor: null,
+    });
 
     renderWithQuery(<SessionSidebar />);
 
@@ -161,4 +165,25 @@ describe('SessionSidebar', () => {
       expect(vi.mocked(api.createSession).mock.calls[0][0]).toEqual({ permissionMode: 'dangerously-skip' });
     });
   });
+
+  it('loads older sessions from the next cursor', async () => {
+    vi.mocked(api.listSessionsPage)
+      .mockResolvedValueOnce({
+        sessions: [makeSession({ id: 's1', title: 'Recent session' })],
+        nextCursor: 'cursor-1',
+      })
+      .mockResolvedValueOnce({
+        sessions: [makeSession({ id: 's2', title: 'Old session', updatedAt: '2025-06-01T10:00:00Z' })],
+        nextCursor: null,
+      });
+
+    renderWithQuery(<SessionSidebar />);
+    fireEvent.click(await screen.findByText('Load older chats'));
+
+    await waitFor(() => {
+      expect(screen.getByText('Old session')).toBeDefined();
+    });
+    expect(api.listSessionsPage).toHaveBeenLastCalledWith({ limit: 200, cursor: 'cursor-1' });
+    expect(screen.queryByText('Load older chats')).toBeNull();
+  });
 });
@@ -0,0 +1,95 @@
+// @vitest-environment jsdom
+/**
+ * Replays a recorded SSE stream through useChatSession and reports how many
+ * React commits it caused and how long they took.
+ *
+ *   npm run bench                              # synthetic recording
+ *   SSE_RECORDING=./stream.sse npm run bench   # replay a captured stream
+ */
+import { bench, describe, afterAll, expect, vi } from 'vitest';
+import { renderHook, act, waitFor } from '@testing-library/react';
+import React, { Profiler } from 'react';
+import fs from 'fs';
+import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
+import { useChatSession } from '../use-chat-session';
+import {
+  synthesizeSSERecording,
+  chunkSSERecording,
+  createPacedStream,
+} from '../../../test-utils/sse-recording';
+
+const recording = process.env.SSE_RECORDING
+  ? fs.readFileSync(process.env.SSE_RECORDING, 'utf-8')
+  : synthesizeSSERecording();
+const chunks = chunkSSERecording(recording);
+const eventCount = (recording.match(/^event: /gm) ?? []).length;
+
+const commitDurations: number[] = [];
+const commitsPerRun: number[] = [];
+
+vi.stubGlobal('fetch', async (_url: string, opts?: RequestInit) => {
+  if (opts?.method === 'POST') {
+    return new Response(createPacedStream(chunks), { status: 200 });
+  }
+  return new Response(JSON.stringify({ messages: [], nextCursor: null }), {
+    status: 200,
+    headers: { 'Content-Type': 'application/json' },
+  });
+});
+
+async function replay() {
+  let commits = 0;
+  const queryClient = new QueryClient({ defaultOptions: { queries: { retry: false } } });
+  const wrapper = ({ children }: { children: React.ReactNode }) => (
+    <QueryClientProvider client={queryClient}>
+      <Profiler
+        id="chat"
+        onRender={(_id, _phase, actualDuration) => {
+          commits++;
+          commitDurations.push(actualDuration);
+        }}
+      >
+        {children}
+      </Profiler>
+    </QueryClientProvider>
+  );
+
+  const { result, unmount } = renderHook(() => useChatSession('bench-session'), { wrapper });
+  await waitFor(() => expect(result.current.isLoadingHistory).toBe(false));
+
+  await act(async () => {
+    result.current.setInput('go');
+  });
+  const commitsBefore = commits;
+  await act(async () => {
+    await result.current.handleSubmit();
+  });
+
+  commitsPerRun.push(commits - commitsBefore);
+  unmount();
+  queryClient.clear();
+}
+
+function percentile(values: number[], p: number): number {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] ?? 0;
+}
+
+describe('useChatSession stream rendering', () => {
+  bench('replay recorded SSE stream', replay, { iterations: 10, time: 0 });
+
+  afterAll(() => {
+    if (commitsPerRun.length === 0) return;
+    const meanCommits = commitsPerRun.reduce((a, b) => a + b, 0) / commitsPerRun.length;
+    const meanDuration = commitDurations.reduce((a, b) => a + b, 0) / commitDurations.length;
+
+    console.log(
+      [
+        '',
+        `SSE replay: ${eventCount} events in ${chunks.length} chunks, ${commitsPerRun.length} runs`,
+        `  renders per stream: ${meanCommits.toFixed(1)} (${(eventCount / meanCommits).toFixed(1)} events/render)`,
+        `  commit time: mean ${meanDuration.toFixed(2)}ms, p95 ${percentile(commitDurations, 0.95).toFixed(2)}ms, max ${Math.max(...commitDurations).toFixed(2)}ms`,
+      ].join('\n')
+    );
+  });
+});
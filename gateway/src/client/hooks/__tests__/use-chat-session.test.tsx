@@ -258,6 +258,59 @@ describe('useChatSession', () => {
     expect(assistantMsg?.content).toBe('chunk1chunk2');
   });
 
+  it('coalesces a burst of deltas into a handful of renders', async () => {
+    const sseText =
+      Array.from({ length: 200 }, (_, i) => formatSSE('text_delta', { text: `${i} ` })).join('') +
+      formatSSE('done', { sessionId: 's1' });
+    const stream = createMockReadableStream([sseText]);
+    fetchSpy.mockResolvedValueOnce(new Response(stream, { status: 200 }));
+
+    let renders = 0;
+    const { result } = renderHook(
+      () => {
+        renders++;
+        return useChatSession('s1');
+      },
+      { wrapper: createWrapper() }
+    );
+
+    await waitFor(() => expect(result.current.status).toBe('idle'));
+
+    await act(async () => {
+      result.current.setInput('Hi');
+    });
+    const rendersBefore = renders;
+    await act(async () => {
+      await result.current.handleSubmit();
+    });
+
+    const assistantMsg = result.current.messages.find(m => m.role === 'assistant');
+    expect(assistantMsg?.content).toBe(Array.from({ length: 200 }, (_, i) => `${i} `).join(''));
+    expect(renders - rendersBefore).toBeLessThan(10);
+  });
+
+  it('parses multi-line data fields', async () => {
+    const sseText =
+      'event: text_delta\ndata: {"text":\ndata: "multi"}\n\n' +
+      formatSSE('done', { sessionId: 's1' });
+    const stream = createMockReadableStream([sseText]);
+    fetchSpy.mockResolvedValueOnce(new Response(stream, { status: 200 }));
+
+    const { result } = renderHook(() => useChatSession('s1'), { wrapper: createWrapper() });
+
+    await waitFor(() => expect(result.current.status).toBe('idle'));
+
+    await act(async () => {
+      result.current.setInput('Hi');
+    });
+    await act(async () => {
+      await result.current.handleSubmit();
+    });
+
+    const assistantMsg = result.current.messages.find(m => m.role === 'assistant');
+    expect(assistantMsg?.content).toBe('multi');
+  });
+
   it('stop() aborts the fetch controller', async () => {
     // Create a stream that never ends
     let controllerRef: ReadableStreamDefaultController<Uint8Array> | null = null;
@@ -293,6 +346,36 @@ describe('useChatSession', () => {
     controllerRef?.close();
   });
 
+  it('aborts the stream when unmounted mid-stream', async () => {
+    let signal: AbortSignal | undefined;
+    fetchSpy.mockImplementationOnce(async (_url, init) => {
+      signal = init?.signal ?? undefined;
+      const stream = new ReadableStream<Uint8Array>({
+        start(controller) {
+          controller.enqueue(new TextEncoder().encode(formatSSE('text_delta', { text: 'partial' })));
+          signal?.addEventListener('abort', () => controller.error(new DOMException('Aborted', 'AbortError')));
+        },
+      });
+      return new Response(stream, { status: 200 });
+    });
+
+    const { result, unmount } = renderHook(() => useChatSession('s1'), { wrapper: createWrapper() });
+
+    await waitFor(() => expect(result.current.status).toBe('idle'));
+
+    await act(async () => {
+      result.current.setInput('test');
+    });
+    act(() => {
+      void result.current.handleSubmit();
+    });
+    await waitFor(() => expect(signal).toBeDefined());
+
+    unmount();
+
+    expect(signal?.aborted).toBe(true);
+  });
+
   it('handles HTTP error responses', async () => {
     fetchSpy.mockResolvedValueOnce(new Response('Not Found', { status: 404 }));
 
@@ -371,4 +454,34 @@ describe('useChatSession', () => {
     expect(result.current.messages[3].role).toBe('assistant');
     expect(result.current.messages[3].content).toBe('New reply');
   });
+
+  it('loads the newest history page and fetches older pages on demand', async () => {
+    (api.getMessages as ReturnType<typeof vi.fn>)
+      .mockResolvedValueOnce({
+        messages: [{ id: 'h3', role: 'user', content: 'Newest' }],
+        nextCursor: '100',
+      })
+      .mockResolvedValueOnce({
+        messages: [
+          { id: 'h1', role: 'user', content: 'Oldest' },
+          { id: 'h2', role: 'assistant', content: 'Older' },
+        ],
+        nextCursor: null,
+      });
+
+    const { result } = renderHook(() => useChatSession('s1'), { wrapper: createWrapper() });
+
+    await waitFor(() => {
+      expect(result.current.hasOlder).toBe(true);
+    });
+    expect(api.getMessages).toHaveBeenCalledWith('s1', { limit: 50 });
+
+    await act(async () => {
+      await result.current.loadOlder();
+    });
+
+    expect(api.getMessages).toHaveBeenLastCalledWith('s1', { limit: 50, before: '100' });
+    expect(result.current.messages.map(m => m.id)).toEqual(['h1', 'h2', 'h3']);
+    expect(result.current.hasOlder).toBe(false);
+  });
 });
@@ -0,0 +1,135 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { renderHook, act } from '@testing-library/react';
+import React from 'react';
+import { QueryClient, QueryClientProvider, type InfiniteData } from '@tanstack/react-query';
+import type { Session, SessionPage } from '@shared/types';
+import { useSessionEvents } from '../use-session-events';
+
+class FakeEventSource {
+  static instances: FakeEventSource[] = [];
+  listeners = new Map<string, Array<(e: MessageEvent) => void>>();
+  close = vi.fn();
+
+  constructor(public url: string) {
+    FakeEventSource.instances.push(this);
+  }
+
+  addEventListener(type: string, listener: (e: MessageEvent) => void) {
+    this.listeners.set(type, [...(this.listeners.get(type) ?? []), listener]);
+  }
+
+  emit(type: string, data?: unknown) {
+    const event = new MessageEvent(type, { data: JSON.stringify(data) });
+    for (const listener of this.listeners.get(type) ?? []) listener(event);
+  }
+}
+
+function makeSession(id: string, updatedAt: string): Session {
+  return { id, title: id, createdAt: updatedAt, updatedAt, permissionMode: 'default' };
+}
+
+function setSessionPages(queryClient: QueryClient, pages: Session[][]) {
+  queryClient.setQueryData<InfiniteData<SessionPage, string | undefined>>(['sessions'], {
+    pages: pages.map((sessions, i) => ({ sessions, nextCursor: i < pages.length - 1 ? `c${i}` : null })),
+    pageParams: pages.map((_, i) => (i === 0 ? undefined : `c${i - 1}`)),
+  });
+}
+
+function getSessionPages(queryClient: QueryClient): string[][] {
+  const data = queryClient.getQueryData<InfiniteData<SessionPage, string | undefined>>(['sessions'])!;
+  return data.pages.map((page) => page.sessions.map((s) => s.id));
+}
+
+describe('useSessionEvents', () => {
+  let queryClient: QueryClient;
+
+  function renderWithClient() {
+    const wrapper = ({ children }: { children: React.ReactNode }) => (
+      <QueryClientProvider client={queryClient}>{children}</QueryClientProvider>
+    );
+    return renderHook(() => useSessionEvents(), { wrapper });
+  }
+
+  beforeEach(() => {
+    FakeEventSource.instances = [];
+    vi.stubGlobal('EventSource', FakeEventSource);
+    queryClient = new QueryClient({ defaultOptions: { queries: { retry: false } } });
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('connects to the session events endpoint and closes on unmount', () => {
+    const { unmount } = renderWithClient();
+    const source = FakeEventSource.instances[0];
+
+    expect(source.url).toBe('/api/sessions/events');
+    unmount();
+    expect(source.close).toHaveBeenCalled();
+  });
+
+  it('moves updated sessions to the top of the cached list', () => {
+    setSessionPages(queryClient, [[
+      makeSession('a', '2024-01-03'),
+      makeSession('b', '2024-01-02'),
+    ]]);
+    renderWithClient();
+
+    act(() => {
+      FakeEventSource.instances[0].emit('session_updated', makeSession('b', '2024-01-04'));
+    });
+
+    expect(getSessionPages(queryClient)).toEqual([['b', 'a']]);
+    const data = queryClient.getQueryData<InfiniteData<SessionPage>>(['sessions'])!;
+    expect(data.pages[0].sessions[0].updatedAt).toBe('2024-01-04');
+  });
+
+  it('moves a session from an older page to the first page when it changes', () => {
+    setSessionPages(queryClient, [
+      [makeSession('a', '2024-01-03')],
+      [makeSession('b', '2024-01-02'), makeSession('c', '2024-01-01')],
+    ]);
+    renderWithClient();
+
+    act(() => {
+      FakeEventSource.instances[0].emit('session_updated', makeSession('c', '2024-01-04'));
+    });
+
+    expect(getSessionPages(queryClient)).toEqual([['c', 'a'], ['b']]);
+  });
+
+  it('adds created sessions to the cached list', () => {
+    setSessionPages(queryClient, [[makeSession('a', '2024-01-03')]]);
+    renderWithClient();
+
+    act(() => {
+      FakeEventSource.instances[0].emit('session_created', makeSession('c', '2024-01-05'));
+    });
+
+    expect(getSessionPages(queryClient)).toEqual([['c', 'a']]);
+  });
+
+  it('marks cached history stale when a transcript is appended', () => {
+    queryClient.setQueryData(['messages', 'a'], { messages: [], nextCursor: null });
+    renderWithClient();
+
+    act(() => {
+      FakeEventSource.instances[0].emit('transcript_appended', { sessionId: 'a', size: 100 });
+    });
+
+    expect(queryClient.getQueryState(['messages', 'a'])!.isInvalidated).toBe(true);
+  });
+
+  it('resyncs the session list after a reconnect', () => {
+    const invalidate = vi.spyOn(queryClient, 'invalidateQueries');
+    renderWithClient();
+    const source = FakeEventSource.instances[0];
+
+    act(() => source.emit('open'));
+    expect(invalidate).not.toHaveBeenCalled();
+
+    act(() => source.emit('open'));
+    expect(invalidate).toHaveBeenCalledWith({ queryKey: ['sessions'] });
+  });
+});
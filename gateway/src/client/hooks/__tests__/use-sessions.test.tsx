@@ -6,7 +6,7 @@ import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 // Mock the api module
 vi.mock('../../lib/api', () => ({
   api: {
-    listSessions: vi.fn(),
+    listSessionsPage: vi.fn(),
     createSession: vi.fn(),
   },
 }));
@@ -45,7 +45,7 @@ describe('useSessions', () => {
     const sessions = [
       { id: 's1', title: 'Session 1', createdAt: '2024-01-01', updatedAt: '2024-01-01', permissionMode: 'default' },
     ];
-    vi.mocked(api.listSessions).mockResolvedValue(sessions);
+    vi.mocked(api.listSessionsPage).mockResolvedValue({ sessions, nextCursor: null });
 
     const { useSessions } = await import('../use-sessions');
     const { result } = renderHook(() => useSessions(), { wrapper: createWrapper() });
@@ -57,8 +57,29 @@ describe('useSessions', () => {
     expect(result.current.sessions[0].title).toBe('Session 1');
   });
 
+  it('appends older pages when loadMore is called', async () => {
+    const session = (id: string) => ({ id, title: id, createdAt: '2024-01-01', updatedAt: '2024-01-01', permissionMode: 'default' as const });
+    vi.mocked(api.listSessionsPage)
+      .mockResolvedValueOnce({ sessions: [session('s1')], nextCursor: 'cursor-1' })
+      .mockResolvedValueOnce({ sessions: [session('s2')], nextCursor: null });
+
+    const { useSessions } = await import('../use-sessions');
+    const { result } = renderHook(() => useSessions(), { wrapper: createWrapper() });
+
+    await waitFor(() => expect(result.current.hasMore).toBe(true));
+    act(() => {
+      result.current.loadMore();
+    });
+
+    await waitFor(() => {
+      expect(result.current.sessions.map((s) => s.id)).toEqual(['s1', 's2']);
+    });
+    expect(result.current.hasMore).toBe(false);
+    expect(api.listSessionsPage).toHaveBeenLastCalledWith({ limit: 200, cursor: 'cursor-1' });
+  });
+
   it('returns empty array while loading', async () => {
-    vi.mocked(api.listSessions).mockResolvedValue([]);
+    vi.mocked(api.listSessionsPage).mockResolvedValue({ sessions: [], nextCursor: null });
 
     const { useSessions } = await import('../use-sessions');
     const { result } = renderHook(() => useSessions(), { wrapper: createWrapper() });
@@ -70,7 +91,7 @@ describe('useSessions', () => {
   it('createSession mutation sets active session on success', async () => {
     const newSession = { id: 'new-1', title: 'New Session', createdAt: '2024-01-01', updatedAt: '2024-01-01', permissionMode: 'default' as const };
     vi.mocked(api.createSession).mockResolvedValue(newSession);
-    vi.mocked(api.listSessions).mockResolvedValue([newSession]);
+    vi.mocked(api.listSessionsPage).mockResolvedValue({ sessions: [newSession], nextCursor: null });
 
     const { useSessions } = await import('../use-sessions');
     const { result } = renderHook(() => useSessions(), { wrapper: createWrapper() });
@@ -87,7 +108,7 @@ describe('useSessions', () => {
   });
 
   it('exposes setActiveSession', async () => {
-    vi.mocked(api.listSessions).mockResolvedValue([]);
+    vi.mocked(api.listSessionsPage).mockResolvedValue({ sessions: [], nextCursor: null });
 
     const { useSessions } = await import('../use-sessions');
     const { result } = renderHook(() => useSessions(), { wrapper: createWrapper() });
@@ -1,7 +1,9 @@
 import { useState, useCallback, useRef, useEffect } from 'react';
 import { useQuery } from '@tanstack/react-query';
-import type { TextDelta, ToolCallEvent, ErrorEvent } from '@shared/types';
+import type { TextDelta, ToolCallEvent, ErrorEvent, HistoryMessage } from '@shared/types';
 import { api } from '../lib/api';
+import { createSSEParser } from '../lib/sse-parser';
+import { StreamBuffer } from '../lib/stream-buffer';
 
 export interface ChatMessage {
   id: string;
@@ -28,21 +30,61 @@ export interface ToolCallState {
 
 type ChatStatus = 'idle' | 'streaming' | 'error';
 
+/** Number of history messages loaded per page (newest page first). */
+const HISTORY_PAGE_SIZE = 50;
+
+/**
+ * Replace one message by id. The in-flight message is almost always last,
+ * so search from the end and leave every other message object untouched.
+ */
+function replaceMessage(
+  messages: ChatMessage[],
+  id: string,
+  update: (message: ChatMessage) => ChatMessage
+): ChatMessage[] {
+  for (let i = messages.length - 1; i >= 0; i--) {
+    if (messages[i].id === id) {
+      const next = messages.slice();
+      next[i] = update(messages[i]);
+      return next;
+    }
+  }
+  return messages;
+}
+
+function toChatMessage(m: HistoryMessage): ChatMessage {
+  return {
+    id: m.id,
+    role: m.role,
+    content: m.content,
+    toolCalls: m.toolCalls?.map(tc => ({
+      toolCallId: tc.toolCallId,
+      toolName: tc.toolName,
+      input: '',
+      status: 'complete' as const,
+    })),
+    timestamp: m.timestamp || '',
+  };
+}
+
 export function useChatSession(sessionId: string) {
   const [messages, setMessages] = useState<ChatMessage[]>([]);
   const [input, setInput] = useState('');
   const [status, setStatus] = useState<ChatStatus>('idle');
   const [error, setError] = useState<string | null>(null);
   const abortRef = useRef<AbortController | null>(null);
-  const currentAssistantRef = useRef<string>('');
-  const currentToolCallsRef = useRef<ToolCallState[]>([]);
+  const streamBufferRef = useRef<StreamBuffer | null>(null);
   const historySeededRef = useRef(false);
+  const [olderCursor, setOlderCursor] = useState<string | null>(null);
+  const [isLoadingOlder, setIsLoadingOlder] = useState(false);
+  const loadingOlderRef = useRef(false);
 
-  // Load message history from SDK transcript via TanStack Query
+  // Load the newest page of message history from the SDK transcript.
+  // Cached history is marked stale by useSessionEvents when the transcript changes.
   const historyQuery = useQuery({
     queryKey: ['messages', sessionId],
-    queryFn: () => api.getMessages(sessionId),
-    staleTime: 5 * 60 * 1000,
+    queryFn: () => api.getMessages(sessionId, { limit: HISTORY_PAGE_SIZE }),
+    staleTime: Infinity,
     refetchOnWindowFocus: false,
   });
 
@@ -51,23 +93,39 @@ export function useChatSession(sessionId: string) {
     if (historyQuery.data && !historySeededRef.current) {
       historySeededRef.current = true;
       const history = historyQuery.data.messages;
+      setOlderCursor(historyQuery.data.nextCursor ?? null);
       if (history.length > 0) {
-        setMessages(history.map(m => ({
-          id: m.id,
-          role: m.role,
-          content: m.content,
-          toolCalls: m.toolCalls?.map(tc => ({
-            toolCallId: tc.toolCallId,
-            toolName: tc.toolName,
-            input: '',
-            status: 'complete' as const,
-          })),
-          timestamp: m.timestamp || '',
-        })));
+        setMessages(history.map(toChatMessage));
       }
     }
   }, [historyQuery.data]);
 
+  // Abort an in-flight stream on unmount so no frame flushes into dropped state
+  useEffect(() => () => {
+    streamBufferRef.current?.cancel();
+    abortRef.current?.abort();
+  }, []);
+
+  // Fetch the page of history preceding the oldest loaded message
+  const loadOlder = useCallback(async () => {
+    if (!olderCursor || loadingOlderRef.current) return;
+    loadingOlderRef.current = true;
+    setIsLoadingOlder(true);
+    try {
+      const page = await api.getMessages(sessionId, {
+        limit: HISTORY_PAGE_SIZE,
+        before: olderCursor,
+      });
+      setMessages(prev => [...page.messages.map(toChatMessage), ...prev]);
+      setOlderCursor(page.nextCursor ?? null);
+    } catch (err) {
+      setError((err as Error).message);
+    } finally {
+      loadingOlderRef.current = false;
+      setIsLoadingOlder(false);
+    }
+  }, [sessionId, olderCursor]);
+
   const handleSubmit = useCallback(async () => {
     if (!input.trim() || status === 'streaming') return;
 
@@ -82,8 +140,6 @@ export function useChatSession(sessionId: string) {
     setInput('');
     setStatus('streaming');
     setError(null);
-    currentAssistantRef.current = '';
-    currentToolCallsRef.current = [];
 
     const assistantId = crypto.randomUUID();
     setMessages(prev => [...prev, {
@@ -97,6 +153,15 @@ export function useChatSession(sessionId: string) {
     const abortController = new AbortController();
     abortRef.current = abortController;
 
+    // Deltas are buffered and rendered at most once per animation frame
+    const streamBuffer = new StreamBuffer(({ content, toolCalls }) => {
+      setMessages(prev => replaceMessage(prev, assistantId, m => ({ ...m, content, toolCalls })));
+    });
+    streamBufferRef.current = streamBuffer;
+    const parser = createSSEParser(({ event, data }) => {
+      handleStreamEvent(event, JSON.parse(data), streamBuffer);
+    });
+
     try {
       const response = await fetch(`/api/sessions/${sessionId}/messages`, {
         method: 'POST',
@@ -111,30 +176,22 @@ export function useChatSession(sessionId: string) {
 
       const reader = response.body!.getReader();
       const decoder = new TextDecoder();
-      let buffer = '';
 
       while (true) {
         const { done, value } = await reader.read();
         if (done) break;
-
-        buffer += decoder.decode(value, { stream: true });
-        const lines = buffer.split('\n');
-        buffer = lines.pop() || '';
-
-        let eventType = '';
-        for (const line of lines) {
-          if (line.startsWith('event: ')) {
-            eventType = line.slice(7).trim();
-          } else if (line.startsWith('data: ') && eventType) {
-            const data = JSON.parse(line.slice(6));
-            handleStreamEvent(eventType, data, assistantId);
-            eventType = '';
-          }
-        }
+        parser.push(decoder.decode(value, { stream: true }));
       }
+      parser.push(decoder.decode());
+      parser.end();
 
+      streamBuffer.flush();
       setStatus('idle');
     } catch (err) {
+      // Keep whatever streamed in before the failure or abort, then drop
+      // anything a late frame would publish
+      streamBuffer.flush();
+      streamBuffer.cancel();
       if ((err as Error).name !== 'AbortError') {
         setError((err as Error).message);
         setStatus('error');
@@ -142,80 +199,48 @@ export function useChatSession(sessionId: string) {
     }
   }, [input, status, sessionId]);
 
-  function handleStreamEvent(type: string, data: unknown, assistantId: string) {
+  function handleStreamEvent(type: string, data: unknown, streamBuffer: StreamBuffer) {
     switch (type) {
       case 'text_delta': {
         const { text } = data as TextDelta;
-        currentAssistantRef.current += text;
-        updateAssistantMessage(assistantId);
+        streamBuffer.appendText(text);
         break;
       }
       case 'tool_call_start': {
         const tc = data as ToolCallEvent;
-        currentToolCallsRef.current.push({
-          toolCallId: tc.toolCallId,
-          toolName: tc.toolName,
-          input: '',
-          status: 'running',
-        });
-        updateAssistantMessage(assistantId);
+        streamBuffer.startToolCall(tc.toolCallId, tc.toolName);
         break;
       }
       case 'tool_call_delta': {
         const tc = data as ToolCallEvent;
-        const existing = currentToolCallsRef.current.find(t => t.toolCallId === tc.toolCallId);
-        if (existing && tc.input) {
-          existing.input += tc.input;
-        }
-        updateAssistantMessage(assistantId);
+        if (tc.input) streamBuffer.appendToolInput(tc.toolCallId, tc.input);
         break;
       }
       case 'tool_call_end': {
         const tc = data as ToolCallEvent;
-        const existing = currentToolCallsRef.current.find(t => t.toolCallId === tc.toolCallId);
-        if (existing) {
-          existing.status = 'complete';
-        }
-        updateAssistantMessage(assistantId);
+        streamBuffer.completeToolCall(tc.toolCallId);
         break;
       }
       case 'tool_result': {
         const tc = data as ToolCallEvent;
-        const existing = currentToolCallsRef.current.find(t => t.toolCallId === tc.toolCallId);
-        if (existing) {
-          existing.result = tc.result;
-          existing.status = 'complete';
-        }
-        updateAssistantMessage(assistantId);
+        streamBuffer.completeToolCall(tc.toolCallId, tc.result);
         break;
       }
       case 'error': {
         const { message } = data as ErrorEvent;
+        streamBuffer.flush();
         setError(message);
         setStatus('error');
         break;
       }
       case 'done': {
+        streamBuffer.flush();
         setStatus('idle');
         break;
       }
     }
   }
 
-  function updateAssistantMessage(assistantId: string) {
-    setMessages(prev =>
-      prev.map(m =>
-        m.id === assistantId
-          ? {
-              ...m,
-              content: currentAssistantRef.current,
-              toolCalls: [...currentToolCallsRef.current],
-            }
-          : m
-      )
-    );
-  }
-
   const stop = useCallback(() => {
     abortRef.current?.abort();
     setStatus('idle');
@@ -223,5 +248,17 @@ export function useChatSession(sessionId: string) {
 
   const isLoadingHistory = historyQuery.isLoading;
 
-  return { messages, input, setInput, handleSubmit, status, error, stop, isLoadingHistory };
+  return {
+    messages,
+    input,
+    setInput,
+    handleSubmit,
+    status,
+    error,
+    stop,
+    isLoadingHistory,
+    hasOlder: olderCursor !== null,
+    isLoadingOlder,
+    loadOlder,
+  };
 }
@@ -0,0 +1,52 @@
+import { useEffect } from 'react';
+import { useQueryClient, type InfiniteData } from '@tanstack/react-query';
+import type { Session, SessionPage, TranscriptAppendedEvent } from '@shared/types';
+import { api } from '../lib/api';
+
+/**
+ * Subscribe to live session changes from the server and apply them to the
+ * query cache, so the session list and history stay fresh without polling.
+ */
+export function useSessionEvents() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = new EventSource(api.getSessionEventsUrl());
+    let hasConnected = false;
+
+    const upsertSession = (e: MessageEvent) => {
+      const session = JSON.parse(e.data) as Session;
+      queryClient.setQueryData<InfiniteData<SessionPage, string | undefined>>(['sessions'], (prev) => {
+        if (!prev || prev.pages.length === 0) return prev;
+        // Changed sessions are the most recent, so they move to the first page
+        const pages = prev.pages.map((page) => ({
+          ...page,
+          sessions: page.sessions.filter((s) => s.id !== session.id),
+        }));
+        const first = [session, ...pages[0].sessions];
+        first.sort((a, b) => b.updatedAt.localeCompare(a.updatedAt));
+        pages[0] = { ...pages[0], sessions: first };
+        return { ...prev, pages };
+      });
+    };
+
+    const markHistoryStale = (e: MessageEvent) => {
+      const { sessionId } = JSON.parse(e.data) as TranscriptAppendedEvent;
+      // Don't refetch an open chat mid-stream; it reloads on next mount
+      queryClient.invalidateQueries({ queryKey: ['messages', sessionId], refetchType: 'none' });
+    };
+
+    // Events may have been missed while disconnected, so resync on reconnect
+    const handleOpen = () => {
+      if (hasConnected) queryClient.invalidateQueries({ queryKey: ['sessions'] });
+      hasConnected = true;
+    };
+
+    source.addEventListener('session_created', upsertSession);
+    source.addEventListener('session_updated', upsertSession);
+    source.addEventListener('transcript_appended', markHistoryStale);
+    source.addEventListener('open', handleOpen);
+
+    return () => source.close();
+  }, [queryClient]);
+}
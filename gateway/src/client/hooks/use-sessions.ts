@@ -1,17 +1,45 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useCallback, useMemo } from 'react';
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '../lib/api';
 import { useSessionId } from './use-session-id';
+import { SESSION_LIST_LIMIT } from '../lib/session-utils';
 import type { CreateSessionRequest } from '@shared/types';
 
+/**
+ * The session list, newest first, fetched a page at a time. Older pages are
+ * loaded on demand with loadMore() while hasMore is true.
+ */
+export function useSessionList() {
+  const sessionsQuery = useInfiniteQuery({
+    queryKey: ['sessions'],
+    queryFn: ({ pageParam }) => api.listSessionsPage({ limit: SESSION_LIST_LIMIT, cursor: pageParam }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
+  });
+
+  const sessions = useMemo(
+    () => sessionsQuery.data?.pages.flatMap((page) => page.sessions) ?? [],
+    [sessionsQuery.data]
+  );
+
+  const { hasNextPage, isFetchingNextPage, fetchNextPage } = sessionsQuery;
+  const loadMore = useCallback(() => {
+    if (hasNextPage && !isFetchingNextPage) void fetchNextPage();
+  }, [hasNextPage, isFetchingNextPage, fetchNextPage]);
+
+  return {
+    sessions,
+    isLoading: sessionsQuery.isLoading,
+    hasMore: hasNextPage,
+    isLoadingMore: isFetchingNextPage,
+    loadMore,
+  };
+}
+
 export function useSessions() {
   const queryClient = useQueryClient();
   const [activeSessionId, setActiveSession] = useSessionId();
-
-  const sessionsQuery = useQuery({
-    queryKey: ['sessions'],
-    queryFn: api.listSessions,
-    refetchInterval: 30_000,
-  });
+  const { sessions, isLoading, hasMore, isLoadingMore, loadMore } = useSessionList();
 
   const createSession = useMutation({
     mutationFn: (opts: CreateSessionRequest) => api.createSession(opts),
@@ -22,8 +50,11 @@ export function useSessions() {
   });
 
   return {
-    sessions: sessionsQuery.data ?? [],
-    isLoading: sessionsQuery.isLoading,
+    sessions,
+    isLoading,
+    hasMore,
+    isLoadingMore,
+    loadMore,
     createSession,
     activeSessionId,
     setActiveSession,
@@ -29,6 +29,34 @@ describe('api client', () => {
     );
   });
 
+  it('listSessions passes limit as a query parameter', async () => {
+    fetchSpy.mockResolvedValueOnce(
+      new Response(JSON.stringify([]), {
+        status: 200,
+        headers: { 'Content-Type': 'application/json' },
+      })
+    );
+
+    const { api } = await import('../../lib/api');
+    await api.listSessions(50);
+    expect(fetchSpy).toHaveBeenCalledWith('/api/sessions?limit=50', expect.anything());
+  });
+
+  it('listSessionsPage returns the page and the X-Next-Cursor header', async () => {
+    const sessions = [{ id: 's1', title: 'S1' }];
+    fetchSpy.mockResolvedValueOnce(
+      new Response(JSON.stringify(sessions), {
+        status: 200,
+        headers: { 'Content-Type': 'application/json', 'X-Next-Cursor': 'next-1' },
+      })
+    );
+
+    const { api } = await import('../../lib/api');
+    const page = await api.listSessionsPage({ limit: 50, cursor: 'abc' });
+    expect(page).toEqual({ sessions, nextCursor: 'next-1' });
+    expect(fetchSpy).toHaveBeenCalledWith('/api/sessions?limit=50&cursor=abc', expect.anything());
+  });
+
   it('createSession sends POST /api/sessions with body', async () => {
     const session = { id: 's1', title: 'New Session', createdAt: '2024-01-01', updatedAt: '2024-01-01', permissionMode: 'default' };
     fetchSpy.mockResolvedValueOnce(
@@ -59,6 +87,22 @@ describe('api client', () => {
     await expect(api.getSession('missing')).rejects.toThrow('Not found');
   });
 
+  it('getMessages passes paging parameters', async () => {
+    fetchSpy.mockResolvedValueOnce(
+      new Response(JSON.stringify({ messages: [], nextCursor: null }), {
+        status: 200,
+        headers: { 'Content-Type': 'application/json' },
+      })
+    );
+
+    const { api } = await import('../../lib/api');
+    await api.getMessages('s1', { limit: 50, before: '1234' });
+    expect(fetchSpy).toHaveBeenCalledWith(
+      '/api/sessions/s1/messages?limit=50&before=1234',
+      expect.anything()
+    );
+  });
+
   it('getMessageStreamUrl returns correct URL', async () => {
     const { api } = await import('../../lib/api');
     expect(api.getMessageStreamUrl('s1')).toBe('/api/sessions/s1/messages');
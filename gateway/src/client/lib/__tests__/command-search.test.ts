@@ -0,0 +1,64 @@
+import { describe, it, expect } from 'vitest';
+import { createCommandSearch } from '../command-search';
+import type { CommandEntry } from '@shared/types';
+
+function makeCommand(namespace: string, command: string, description = ''): CommandEntry {
+  return {
+    namespace,
+    command,
+    fullCommand: `/${namespace}:${command}`,
+    description,
+    filePath: `.claude/commands/${namespace}/${command}.md`,
+  };
+}
+
+const commands = [
+  makeCommand('daily', 'note', 'Open daily note'),
+  makeCommand('daily', 'plan', 'Plan your day'),
+  makeCommand('system', 'review', 'Weekly system review'),
+  makeCommand('system', 'update', 'Update the vault'),
+];
+
+describe('createCommandSearch', () => {
+  it('returns every command for an empty query', () => {
+    const search = createCommandSearch(commands);
+    expect(search('')).toBe(commands);
+  });
+
+  it('matches substrings of the command and description', () => {
+    const search = createCommandSearch(commands);
+    expect(search('weekly').map(c => c.command)).toEqual(['review']);
+    expect(search('SYSTEM:').map(c => c.command)).toEqual(['review', 'update']);
+  });
+
+  it('matches in-order subsequences of the command', () => {
+    const search = createCommandSearch(commands);
+    expect(search('dpln').map(c => c.fullCommand)).toEqual(['/daily:plan']);
+  });
+
+  it('ranks name prefixes first while keeping namespaces together', () => {
+    const search = createCommandSearch(commands);
+    const result = search('u').map(c => c.fullCommand);
+
+    expect(result[0]).toBe('/system:update');
+    const namespaces = result.map(fc => fc.split(':')[0]);
+    expect(namespaces).toEqual([...namespaces].sort((a, b) =>
+      namespaces.indexOf(a) - namespaces.indexOf(b)
+    ));
+  });
+
+  it('gives the same results when narrowing as when searching from scratch', () => {
+    const search = createCommandSearch(commands);
+    search('p');
+    search('pl');
+    const narrowed = search('pla');
+
+    expect(narrowed).toEqual(createCommandSearch(commands)('pla'));
+  });
+
+  it('widens again when characters are deleted', () => {
+    const search = createCommandSearch(commands);
+    expect(search('plan')).toHaveLength(1);
+    expect(search('p').length).toBeGreaterThan(1);
+  });
+});
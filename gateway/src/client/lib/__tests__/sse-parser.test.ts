@@ -0,0 +1,52 @@
+import { describe, it, expect } from 'vitest';
+import { createSSEParser, type SSEMessage } from '../sse-parser';
+
+function parseAll(chunks: string[], end = false): SSEMessage[] {
+  const messages: SSEMessage[] = [];
+  const parser = createSSEParser(m => messages.push(m));
+  for (const chunk of chunks) parser.push(chunk);
+  if (end) parser.end();
+  return messages;
+}
+
+describe('createSSEParser', () => {
+  it('parses event and data fields', () => {
+    expect(parseAll(['event: text_delta\ndata: {"text":"hi"}\n\n'])).toEqual([
+      { event: 'text_delta', data: '{"text":"hi"}' },
+    ]);
+  });
+
+  it('joins multi-line data fields with newlines', () => {
+    expect(parseAll(['event: note\ndata: line one\ndata: line two\n\n'])).toEqual([
+      { event: 'note', data: 'line one\nline two' },
+    ]);
+  });
+
+  it('handles events split across chunks', () => {
+    expect(parseAll(['event: te', 'xt_delta\nda', 'ta: {"text":"a"}\n', '\n'])).toEqual([
+      { event: 'text_delta', data: '{"text":"a"}' },
+    ]);
+  });
+
+  it('handles CRLF line endings split between chunks', () => {
+    expect(parseAll(['event: done\r', '\ndata: {}\r\n\r\n'])).toEqual([
+      { event: 'done', data: '{}' },
+    ]);
+  });
+
+  it('ignores comment lines and defaults the event type to message', () => {
+    expect(parseAll([': keep-alive\n\ndata: x\n\n'])).toEqual([
+      { event: 'message', data: 'x' },
+    ]);
+  });
+
+  it('does not dispatch until the blank line arrives', () => {
+    expect(parseAll(['event: done\ndata: {}\n'])).toEqual([]);
+  });
+
+  it('dispatches a trailing event on end()', () => {
+    expect(parseAll(['event: done\ndata: {}'], true)).toEqual([
+      { event: 'done', data: '{}' },
+    ]);
+  });
+});
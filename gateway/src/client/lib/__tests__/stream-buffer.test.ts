@@ -0,0 +1,97 @@
+import { describe, it, expect, vi } from 'vitest';
+import { StreamBuffer, type StreamSnapshot } from '../stream-buffer';
+
+function createBuffer() {
+  const snapshots: StreamSnapshot[] = [];
+  let pendingFrame: (() => void) | null = null;
+  const schedule = vi.fn((callback: () => void) => {
+    pendingFrame = callback;
+    return () => {
+      pendingFrame = null;
+    };
+  });
+  const buffer = new StreamBuffer(s => snapshots.push(s), schedule);
+  const runFrame = () => {
+    const frame = pendingFrame;
+    pendingFrame = null;
+    frame?.();
+  };
+  return { buffer, snapshots, schedule, runFrame };
+}
+
+describe('StreamBuffer', () => {
+  it('coalesces deltas into one flush per frame', () => {
+    const { buffer, snapshots, schedule, runFrame } = createBuffer();
+
+    for (let i = 0; i < 100; i++) buffer.appendText('a');
+    expect(schedule).toHaveBeenCalledTimes(1);
+    expect(snapshots).toHaveLength(0);
+
+    runFrame();
+    expect(snapshots).toHaveLength(1);
+    expect(snapshots[0].content).toBe('a'.repeat(100));
+  });
+
+  it('accumulates tool call input by id', () => {
+    const { buffer, snapshots, runFrame } = createBuffer();
+
+    buffer.startToolCall('tc1', 'Read');
+    buffer.startToolCall('tc2', 'Write');
+    buffer.appendToolInput('tc1', '{"path":');
+    buffer.appendToolInput('tc1', '"/foo"}');
+    buffer.completeToolCall('tc2', 'done');
+    runFrame();
+
+    expect(snapshots[0].toolCalls).toEqual([
+      { toolCallId: 'tc1', toolName: 'Read', input: '{"path":"/foo"}', status: 'running' },
+      { toolCallId: 'tc2', toolName: 'Write', input: '', result: 'done', status: 'complete' },
+    ]);
+  });
+
+  it('keeps unchanged tool calls referentially stable between flushes', () => {
+    const { buffer, snapshots, runFrame } = createBuffer();
+
+    buffer.startToolCall('tc1', 'Read');
+    buffer.startToolCall('tc2', 'Write');
+    runFrame();
+    buffer.appendToolInput('tc2', '{}');
+    runFrame();
+
+    expect(snapshots[1].toolCalls[0]).toBe(snapshots[0].toolCalls[0]);
+    expect(snapshots[1].toolCalls[1]).not.toBe(snapshots[0].toolCalls[1]);
+    expect(snapshots[1].toolCalls).not.toBe(snapshots[0].toolCalls);
+  });
+
+  it('ignores deltas for unknown tool calls', () => {
+    const { buffer, schedule } = createBuffer();
+
+    buffer.appendToolInput('missing', 'x');
+    buffer.completeToolCall('missing');
+
+    expect(schedule).not.toHaveBeenCalled();
+  });
+
+  it('flush() publishes immediately and cancels the pending frame', () => {
+    const { buffer, snapshots, runFrame } = createBuffer();
+
+    buffer.appendText('hi');
+    buffer.flush();
+    runFrame();
+
+    expect(snapshots).toHaveLength(1);
+    expect(snapshots[0].content).toBe('hi');
+  });
+
+  it('cancel() drops the pending frame and publishes nothing further', () => {
+    const { buffer, snapshots, runFrame } = createBuffer();
+
+    buffer.appendText('hi');
+    buffer.cancel();
+    runFrame();
+    buffer.appendText(' there');
+    buffer.flush();
+    runFrame();
+
+    expect(snapshots).toHaveLength(0);
+  });
+});
@@ -2,12 +2,13 @@ import type {
   Session,
   CreateSessionRequest,
   CommandRegistry,
-  HistoryMessage,
+  HistoryPage,
+  SessionPage,
 } from '@shared/types';
 
 const BASE_URL = '/api';
 
-async function fetchJSON<T>(url: string, opts?: RequestInit): Promise<T> {
+async function fetchOk(url: string, opts?: RequestInit): Promise<Response> {
   const res = await fetch(`${BASE_URL}${url}`, {
     headers: { 'Content-Type': 'application/json' },
     ...opts,
@@ -16,6 +17,11 @@ async function fetchJSON<T>(url: string, opts?: RequestInit): Promise<T> {
     const error = await res.json().catch(() => ({ error: res.statusText }));
     throw new Error(error.error || `HTTP ${res.status}`);
   }
+  return res;
+}
+
+async function fetchJSON<T>(url: string, opts?: RequestInit): Promise<T> {
+  const res = await fetchOk(url, opts);
   return res.json();
 }
 
@@ -27,13 +33,30 @@ export const api = {
       body: JSON.stringify(body),
     }),
 
-  listSessions: () => fetchJSON<Session[]>('/sessions'),
+  listSessions: (limit?: number) =>
+    fetchJSON<Session[]>(`/sessions${limit ? `?limit=${limit}` : ''}`),
+
+  // One page of the session list; the next page's cursor comes in X-Next-Cursor
+  listSessionsPage: async (opts: { limit: number; cursor?: string }): Promise<SessionPage> => {
+    const params = new URLSearchParams({ limit: String(opts.limit) });
+    if (opts.cursor) params.set('cursor', opts.cursor);
+    const res = await fetchOk(`/sessions?${params}`);
+    const sessions: Session[] = await res.json();
+    return { sessions, nextCursor: res.headers.get('X-Next-Cursor') };
+  },
 
   getSession: (id: string) => fetchJSON<Session>(`/sessions/${id}`),
 
+  getSessionEventsUrl: () => `${BASE_URL}/sessions/events`,
+
   // Messages
-  getMessages: (sessionId: string) =>
-    fetchJSON<{ messages: HistoryMessage[] }>(`/sessions/${sessionId}/messages`),
+  getMessages: (sessionId: string, opts: { limit?: number; before?: string } = {}) => {
+    const params = new URLSearchParams();
+    if (opts.limit) params.set('limit', String(opts.limit));
+    if (opts.before) params.set('before', opts.before);
+    const qs = params.toString();
+    return fetchJSON<HistoryPage>(`/sessions/${sessionId}/messages${qs ? `?${qs}` : ''}`);
+  },
 
   getMessageStreamUrl: (sessionId: string) =>
     `${BASE_URL}/sessions/${sessionId}/messages`,
@@ -0,0 +1,97 @@
+import type { CommandEntry } from '@shared/types';
+
+interface IndexedCommand {
+  command: CommandEntry;
+  /** Original (alphabetical) position, used as the tie-breaker. */
+  order: number;
+  name: string;
+  fullCommand: string;
+  description: string;
+}
+
+interface Match {
+  entry: IndexedCommand;
+  score: number;
+}
+
+/**
+ * Score a command against a lowercased query, or -1 if it doesn't match.
+ * Anything the previous substring filter matched still matches; fuzzy
+ * (in-order subsequence) matches on the command name rank below those.
+ */
+function scoreCommand(entry: IndexedCommand, q: string): number {
+  if (entry.name.startsWith(q)) return 100;
+  const idx = entry.fullCommand.indexOf(q);
+  if (idx !== -1) return Math.max(50, 90 - idx);
+  if (`${entry.fullCommand} ${entry.description}`.includes(q)) return 40;
+
+  // Subsequence match on the full command, penalising gaps
+  let pos = 0;
+  let gaps = 0;
+  for (const ch of q) {
+    const next = entry.fullCommand.indexOf(ch, pos);
+    if (next === -1) return -1;
+    if (next !== pos) gaps++;
+    pos = next + 1;
+  }
+  return Math.max(1, 30 - gaps * 3);
+}
+
+/**
+ * Order matches by score while keeping each namespace contiguous, since
+ * CommandPalette groups by namespace and maps selection by flat index.
+ * Namespaces are ordered by their best match.
+ */
+function rankMatches(matches: Match[]): CommandEntry[] {
+  const byScore = (a: Match, b: Match) => b.score - a.score || a.entry.order - b.entry.order;
+  const groups = new Map<string, Match[]>();
+  for (const match of [...matches].sort(byScore)) {
+    const ns = match.entry.command.namespace;
+    const group = groups.get(ns);
+    if (group) group.push(match);
+    else groups.set(ns, [match]);
+  }
+  return [...groups.values()].flat().map(m => m.entry.command);
+}
+
+/**
+ * Build a search function over a command list. Lowercased search fields are
+ * computed once per registry, and when the query only grows (the user is
+ * typing) the search narrows the previous matches instead of rescanning.
+ */
+export function createCommandSearch(commands: CommandEntry[]): (query: string) => CommandEntry[] {
+  const index: IndexedCommand[] = commands.map((command, order) => ({
+    command,
+    order,
+    name: command.command.toLowerCase(),
+    fullCommand: command.fullCommand.toLowerCase(),
+    description: command.description.toLowerCase(),
+  }));
+
+  let lastQuery = '';
+  let lastMatches: Match[] = index.map(entry => ({ entry, score: 0 }));
+  let lastResult = commands;
+
+  return (query: string) => {
+    const q = query.toLowerCase();
+    if (q === lastQuery) return lastResult;
+    if (!q) {
+      lastQuery = '';
+      lastMatches = index.map(entry => ({ entry, score: 0 }));
+      lastResult = commands;
+      return lastResult;
+    }
+
+    const candidates = q.startsWith(lastQuery) ? lastMatches.map(m => m.entry) : index;
+    const matches: Match[] = [];
+    for (const entry of candidates) {
+      const score = scoreCommand(entry, q);
+      if (score >= 0) matches.push({ entry, score });
+    }
+
+    lastQuery = q;
+    lastMatches = matches;
+    lastResult = rankMatches(matches);
+    return lastResult;
+  };
+}
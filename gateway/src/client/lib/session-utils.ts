@@ -7,6 +7,9 @@ export interface GroupedSessions {
   sessions: Session[];
 }
 
+/** Number of sessions the sidebar fetches per page (newest page first). */
+export const SESSION_LIST_LIMIT = 200;
+
 const GROUP_ORDER: TimeGroup[] = ['Today', 'Yesterday', 'Previous 7 Days', 'Previous 30 Days', 'Older'];
 
 /**
@@ -0,0 +1,59 @@
+export interface SSEMessage {
+  event: string;
+  data: string;
+}
+
+/**
+ * Incremental parser for the text/event-stream wire format.
+ * Handles events split across chunks, multi-line `data:` fields,
+ * comment lines and CR/LF/CRLF line endings.
+ */
+export function createSSEParser(onMessage: (message: SSEMessage) => void) {
+  let buffer = '';
+  let eventType = '';
+  let dataLines: string[] = [];
+
+  function processLine(line: string) {
+    // A blank line dispatches the event accumulated so far
+    if (line === '') {
+      if (dataLines.length > 0) {
+        onMessage({ event: eventType || 'message', data: dataLines.join('\n') });
+      }
+      eventType = '';
+      dataLines = [];
+      return;
+    }
+    if (line.startsWith(':')) return;
+
+    const colon = line.indexOf(':');
+    const field = colon === -1 ? line : line.slice(0, colon);
+    let value = colon === -1 ? '' : line.slice(colon + 1);
+    if (value.startsWith(' ')) value = value.slice(1);
+
+    if (field === 'event') eventType = value;
+    else if (field === 'data') dataLines.push(value);
+  }
+
+  return {
+    push(chunk: string) {
+      buffer += chunk;
+      const lineBreak = /\r\n|\r|\n/g;
+      let start = 0;
+      let match: RegExpExecArray | null;
+      while ((match = lineBreak.exec(buffer))) {
+        // A trailing CR may be the first half of a CRLF split across chunks
+        if (match[0] === '\r' && match.index === buffer.length - 1) break;
+        processLine(buffer.slice(start, match.index));
+        start = lineBreak.lastIndex;
+      }
+      buffer = buffer.slice(start);
+    },
+
+    /** Dispatch anything left when the stream ends without a final blank line. */
+    end() {
+      if (buffer) processLine(buffer.replace(/\r$/, ''));
+      buffer = '';
+      processLine('');
+    },
+  };
+}
@@ -0,0 +1,97 @@
+import type { ToolCallState } from '../hooks/use-chat-session';
+
+export interface StreamSnapshot {
+  content: string;
+  toolCalls: ToolCallState[];
+}
+
+type FrameScheduler = (callback: () => void) => () => void;
+
+/**
+ * Schedule a callback for the next animation frame, falling back to a
+ * ~60fps timer where requestAnimationFrame isn't available.
+ * Returns a function that cancels the callback.
+ */
+export function scheduleFrame(callback: () => void): () => void {
+  if (typeof requestAnimationFrame === 'function') {
+    const id = requestAnimationFrame(callback);
+    return () => cancelAnimationFrame(id);
+  }
+  const id = setTimeout(callback, 16);
+  return () => clearTimeout(id);
+}
+
+/**
+ * Accumulates streamed text and tool-call deltas for the in-flight
+ * assistant message and publishes a snapshot at most once per frame,
+ * so a fast stream costs one render per frame rather than one per delta.
+ */
+export class StreamBuffer {
+  private content = '';
+  private toolCalls: ToolCallState[] = [];
+  private toolCallIndex = new Map<string, number>();
+  private cancelFrame: (() => void) | null = null;
+  private cancelled = false;
+
+  constructor(
+    private readonly onFlush: (snapshot: StreamSnapshot) => void,
+    private readonly schedule: FrameScheduler = scheduleFrame
+  ) {}
+
+  appendText(text: string): void {
+    this.content += text;
+    this.scheduleFlush();
+  }
+
+  startToolCall(toolCallId: string, toolName: string): void {
+    this.toolCallIndex.set(toolCallId, this.toolCalls.length);
+    this.toolCalls.push({ toolCallId, toolName, input: '', status: 'running' });
+    this.scheduleFlush();
+  }
+
+  appendToolInput(toolCallId: string, input: string): void {
+    this.updateToolCall(toolCallId, tc => ({ ...tc, input: tc.input + input }));
+  }
+
+  completeToolCall(toolCallId: string, result?: string): void {
+    this.updateToolCall(toolCallId, tc => ({
+      ...tc,
+      result: result ?? tc.result,
+      status: 'complete',
+    }));
+  }
+
+  /** Publish pending changes immediately (e.g. at the end of a stream). */
+  flush(): void {
+    if (this.cancelled) return;
+    this.cancelFrame?.();
+    this.cancelFrame = null;
+    this.onFlush({ content: this.content, toolCalls: this.toolCalls.slice() });
+  }
+
+  /**
+   * Drop any scheduled flush and publish nothing further, e.g. once the
+   * component that owns the snapshot has unmounted.
+   */
+  cancel(): void {
+    this.cancelled = true;
+    this.cancelFrame?.();
+    this.cancelFrame = null;
+  }
+
+  // Tool calls are replaced rather than mutated so changed cards get new props
+  private updateToolCall(toolCallId: string, update: (tc: ToolCallState) => ToolCallState): void {
+    const i = this.toolCallIndex.get(toolCallId);
+    if (i === undefined) return;
+    this.toolCalls[i] = update(this.toolCalls[i]);
+    this.scheduleFlush();
+  }
+
+  private scheduleFlush(): void {
+    if (this.cancelFrame || this.cancelled) return;
+    this.cancelFrame = this.schedule(() => {
+      this.cancelFrame = null;
+      this.flush();
+    });
+  }
+}
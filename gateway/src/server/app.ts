@@ -5,13 +5,16 @@ import { fileURLToPath } from 'url';
 import sessionRoutes from './routes/sessions';
 import commandRoutes from './routes/commands';
 import healthRoutes from './routes/health';
+import metricsRoutes from './routes/metrics';
 import { errorHandler } from './middleware/error-handler';
+import { requestTiming } from './middleware/request-timing';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
 export function createApp() {
   const app = express();
 
+  app.use(requestTiming);
   app.use(cors());
   app.use(express.json());
 
@@ -19,6 +22,7 @@ export function createApp() {
   app.use('/api/sessions', sessionRoutes);
   app.use('/api/commands', commandRoutes);
   app.use('/api/health', healthRoutes);
+  app.use('/api/metrics', metricsRoutes);
 
   // Error handler (must be after routes)
   app.use(errorHandler);
@@ -3,6 +3,7 @@ import path from 'path';
 import { fileURLToPath } from 'url';
 import { createApp } from './app';
 import { agentManager } from './services/agent-manager';
+import { metrics } from './services/metrics';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 dotenv.config({ path: path.join(__dirname, '../../.env') });
@@ -15,10 +16,16 @@ async function start() {
     console.log(`Gateway server running on http://localhost:${PORT}`);
   });
 
-  // Run session health check every 5 minutes
-  setInterval(() => {
-    agentManager.checkSessionHealth();
-  }, 5 * 60 * 1000);
+  // Feed event-loop lag and heap use into /api/metrics
+  metrics.startRuntimeSampling();
+
+  // Close warm agent sessions so their SDK processes exit with the server
+  for (const signal of ['SIGINT', 'SIGTERM'] as const) {
+    process.on(signal, () => {
+      agentManager.shutdown();
+      process.exit(0);
+    });
+  }
 }
 
 start();
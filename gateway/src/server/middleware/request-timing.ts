@@ -0,0 +1,32 @@
+import type { Request, Response, NextFunction } from 'express';
+import { metrics } from '../services/metrics';
+
+/**
+ * Label a request by its matched route pattern (e.g. "GET /api/sessions/:id")
+ * so per-session URLs don't each get their own histogram.
+ */
+export function routeLabel(req: Request): string {
+  if (!req.route) return `${req.method} unmatched`;
+  const routePath = req.route.path === '/' && req.baseUrl ? '' : req.route.path;
+  return `${req.method} ${req.baseUrl}${routePath}`;
+}
+
+/**
+ * Record each request's latency once the response has been fully sent or
+ * the client disconnected.
+ */
+export function requestTiming(req: Request, res: Response, next: NextFunction): void {
+  const start = process.hrtime.bigint();
+  let recorded = false;
+
+  const record = () => {
+    if (recorded) return;
+    recorded = true;
+    const elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+    metrics.observe('http_request_duration_ms', elapsedMs, routeLabel(req));
+  };
+
+  res.on('finish', record);
+  res.on('close', record);
+  next();
+}
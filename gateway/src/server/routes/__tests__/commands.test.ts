@@ -2,13 +2,16 @@ import { describe, it, expect, vi, beforeEach } from 'vitest';
 
 vi.mock('../../services/command-registry', () => {
   const mockGetCommands = vi.fn();
+  const mockGetEtag = vi.fn();
   const mockInvalidateCache = vi.fn();
   return {
     CommandRegistryService: vi.fn().mockImplementation(() => ({
       getCommands: mockGetCommands,
+      getEtag: mockGetEtag,
       invalidateCache: mockInvalidateCache,
     })),
     __mockGetCommands: mockGetCommands,
+    __mockGetEtag: mockGetEtag,
   };
 });
 
@@ -28,7 +31,6 @@ vi.mock('../../services/agent-manager', () => ({
     sendMessage: vi.fn(),
     approveTool: vi.fn(),
     hasSession: vi.fn(),
-    checkSessionHealth: vi.fn(),
     getSdkSessionId: vi.fn(),
   },
 }));
@@ -37,13 +39,17 @@ import request from 'supertest';
 import { createApp } from '../../app';
 
 // Get a reference to the mock function
-const { __mockGetCommands: mockGetCommands } = await import('../../services/command-registry') as any;
+const {
+  __mockGetCommands: mockGetCommands,
+  __mockGetEtag: mockGetEtag,
+} = await import('../../services/command-registry') as any;
 
 const app = createApp();
 
 describe('Commands Routes', () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    mockGetEtag.mockReturnValue('"abc"');
   });
 
   describe('GET /api/commands', () => {
@@ -78,5 +84,28 @@ describe('Commands Routes', () => {
       expect(res.status).toBe(200);
       expect(res.body.commands).toEqual([]);
     });
+
+    it('sends an ETag and answers 304 when it matches', async () => {
+      mockGetCommands.mockResolvedValue({ commands: [], lastScanned: '2024-01-01' });
+
+      const first = await request(app).get('/api/commands');
+      expect(first.headers.etag).toBe('"abc"');
+
+      const second = await request(app)
+        .get('/api/commands')
+        .set('If-None-Match', '"abc"');
+      expect(second.status).toBe(304);
+      expect(second.text).toBe('');
+    });
+
+    it('returns the registry when the ETag changed', async () => {
+      mockGetCommands.mockResolvedValue({ commands: [], lastScanned: '2024-01-01' });
+
+      const res = await request(app)
+        .get('/api/commands')
+        .set('If-None-Match', '"old"');
+      expect(res.status).toBe(200);
+      expect(res.body.commands).toEqual([]);
+    });
   });
 });
@@ -16,7 +16,6 @@ vi.mock('../../services/agent-manager', () => ({
     sendMessage: vi.fn(),
     approveTool: vi.fn(),
     hasSession: vi.fn(),
-    checkSessionHealth: vi.fn(),
     getSdkSessionId: vi.fn(),
   },
 }));
@@ -0,0 +1,71 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+
+// Mock dependencies that createApp imports
+vi.mock('../../services/transcript-reader', () => ({
+  transcriptReader: {
+    listSessions: vi.fn(),
+    getSession: vi.fn(),
+    readTranscript: vi.fn(),
+    listTranscripts: vi.fn(),
+  },
+}));
+
+vi.mock('../../services/agent-manager', () => ({
+  agentManager: {
+    ensureSession: vi.fn(),
+    sendMessage: vi.fn(),
+    approveTool: vi.fn(),
+    hasSession: vi.fn(),
+    getSdkSessionId: vi.fn(),
+    getPoolStats: vi.fn(() => ({ warm: 1, busy: 0, activeTurns: 0, queuedTurns: 0 })),
+  },
+}));
+
+vi.mock('../../services/session-watcher', () => ({
+  SessionWatcher: class {
+    subscribe = vi.fn(() => () => {});
+  },
+}));
+
+import request from 'supertest';
+import { createApp } from '../../app';
+import { metrics } from '../../services/metrics';
+import { transcriptReader } from '../../services/transcript-reader';
+
+const app = createApp();
+
+describe('Metrics Route', () => {
+  beforeEach(() => {
+    metrics.reset();
+  });
+
+  it('GET /api/metrics returns histograms, memory and agent pool stats', async () => {
+    const res = await request(app).get('/api/metrics');
+
+    expect(res.status).toBe(200);
+    expect(res.body.histograms.http_request_duration_ms.unit).toBe('ms');
+    expect(res.body.histograms.agent_ttft_ms).toBeDefined();
+    expect(res.body.memory.heapUsedMb).toBeGreaterThan(0);
+    expect(res.body.agent).toEqual({ warm: 1, busy: 0, activeTurns: 0, queuedTurns: 0 });
+  });
+
+  it('records request latency by route pattern', async () => {
+    vi.mocked(transcriptReader.getSession).mockResolvedValue(null);
+
+    await request(app).get('/api/health');
+    await request(app).get('/api/sessions/abc');
+    await request(app).get('/api/sessions/def');
+
+    const res = await request(app).get('/api/metrics');
+    const series = res.body.histograms.http_request_duration_ms.series;
+    expect(series['GET /api/health'].count).toBe(1);
+    expect(series['GET /api/sessions/:id'].count).toBe(2);
+  });
+
+  it('labels requests that match no route as unmatched', async () => {
+    await request(app).get('/api/nope');
+
+    const res = await request(app).get('/api/metrics');
+    expect(res.body.histograms.http_request_duration_ms.series['GET unmatched'].count).toBe(1);
+  });
+});
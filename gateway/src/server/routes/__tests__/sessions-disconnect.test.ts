@@ -0,0 +1,80 @@
+import { describe, it, expect, afterEach, vi } from 'vitest';
+
+// Real agent manager over a stub SDK whose turn only ends when aborted,
+// like an agent busy running a long tool
+const abortSignals: AbortSignal[] = [];
+
+vi.mock('@anthropic-ai/claude-agent-sdk', () => ({
+  query: vi.fn(({ prompt, options }: { prompt: AsyncIterable<unknown>; options: { abortController: AbortController } }) => {
+    abortSignals.push(options.abortController.signal);
+    return (async function* () {
+      for await (const _message of prompt) {
+        yield {
+          type: 'stream_event',
+          event: { type: 'content_block_delta', index: 0, delta: { type: 'text_delta', text: 'Working' } },
+        };
+        await new Promise((_resolve, reject) => {
+          options.abortController.signal.addEventListener('abort', () => reject(new Error('aborted')));
+        });
+      }
+    })();
+  }),
+}));
+
+vi.mock('../../services/transcript-reader', () => ({
+  transcriptReader: {
+    listSessions: vi.fn(),
+    getSession: vi.fn(),
+    readTranscript: vi.fn(),
+    listTranscripts: vi.fn(),
+  },
+}));
+
+vi.mock('../../services/session-watcher', () => ({
+  SessionWatcher: class {
+    subscribe = vi.fn(() => () => {});
+  },
+}));
+
+import request from 'supertest';
+import { createApp } from '../../app';
+import { agentManager } from '../../services/agent-manager';
+import { metrics } from '../../services/metrics';
+
+const app = createApp();
+
+describe('POST /api/sessions/:id/messages client disconnect', () => {
+  afterEach(() => {
+    agentManager.shutdown();
+  });
+
+  it('stops the agent and frees the turn when the client aborts mid-stream', async () => {
+    let test!: request.Test;
+    const firstChunk = new Promise<void>(resolve => {
+      test = request(app)
+        .post('/api/sessions/s1/messages')
+        .send({ content: 'hi' })
+        .buffer(true)
+        .parse((res, callback) => {
+          res.once('data', () => resolve());
+          res.on('end', () => callback(null, ''));
+          res.on('error', () => callback(null, ''));
+        });
+      test.end(() => {});
+    });
+
+    await firstChunk;
+    expect(agentManager.getPoolStats().activeTurns).toBe(1);
+
+    test.abort();
+
+    await vi.waitFor(() => {
+      expect(agentManager.getPoolStats()).toMatchObject({ activeTurns: 0, queuedTurns: 0, warm: 0 });
+    });
+    expect(abortSignals[0].aborted).toBe(true);
+    // Aborted streams still count towards the SSE event rate
+    await vi.waitFor(() => {
+      expect(metrics.snapshot().histograms.sse_events_per_second.series.all?.count).toBe(1);
+    });
+  });
+});
@@ -5,8 +5,10 @@ import type { StreamEvent } from '../../../shared/types';
 vi.mock('../../services/transcript-reader', () => ({
   transcriptReader: {
     listSessions: vi.fn(),
+    listSessionsPage: vi.fn(),
     getSession: vi.fn(),
     readTranscript: vi.fn(),
+    readTranscriptPage: vi.fn(),
     listTranscripts: vi.fn(),
   },
 }));
@@ -17,11 +19,16 @@ vi.mock('../../services/agent-manager', () => ({
     sendMessage: vi.fn(),
     approveTool: vi.fn(),
     hasSession: vi.fn(),
-    checkSessionHealth: vi.fn(),
     getSdkSessionId: vi.fn(),
   },
 }));
 
+vi.mock('../../services/session-watcher', () => ({
+  SessionWatcher: class {
+    subscribe = vi.fn(() => () => {});
+  },
+}));
+
 // Dynamically import after mocks are set up
 import request from 'supertest';
 import { createApp } from '../../app';
@@ -107,6 +114,27 @@ describe('Sessions Routes', () => {
       expect(res.status).toBe(200);
       expect(res.body).toEqual(sessions);
     });
+
+    it('returns a page and next cursor when limit is given', async () => {
+      const session = {
+        id: 's1', title: 'First question', createdAt: '2024-01-02',
+        updatedAt: '2024-01-02', permissionMode: 'default' as const,
+      };
+      vi.mocked(transcriptReader.listSessionsPage).mockResolvedValue({
+        sessions: [session],
+        nextCursor: 'abc',
+      });
+
+      const res = await request(app).get('/api/sessions?limit=1&cursor=xyz');
+      expect(res.status).toBe(200);
+      expect(res.body).toEqual([session]);
+      expect(res.headers['x-next-cursor']).toBe('abc');
+      expect(transcriptReader.listSessionsPage).toHaveBeenCalledWith(
+        expect.any(String),
+        { limit: 1, cursor: 'xyz' }
+      );
+      expect(transcriptReader.listSessions).not.toHaveBeenCalled();
+    });
   });
 
   // ---- GET /api/sessions/:id ----
@@ -131,6 +159,36 @@ describe('Sessions Routes', () => {
     });
   });
 
+  // ---- GET /api/sessions/:id/messages ----
+
+  describe('GET /api/sessions/:id/messages', () => {
+    it('returns the full transcript without a limit', async () => {
+      const messages = [{ id: 'u1', role: 'user' as const, content: 'Hi' }];
+      vi.mocked(transcriptReader.readTranscript).mockResolvedValue(messages);
+
+      const res = await request(app).get('/api/sessions/s1/messages');
+      expect(res.status).toBe(200);
+      expect(res.body).toEqual({ messages });
+    });
+
+    it('returns a page when limit is given', async () => {
+      const page = {
+        messages: [{ id: 'u1', role: 'user' as const, content: 'Hi' }],
+        nextCursor: '42',
+      };
+      vi.mocked(transcriptReader.readTranscriptPage).mockResolvedValue(page);
+
+      const res = await request(app).get('/api/sessions/s1/messages?limit=20&before=100');
+      expect(res.status).toBe(200);
+      expect(res.body).toEqual(page);
+      expect(transcriptReader.readTranscriptPage).toHaveBeenCalledWith(
+        expect.any(String),
+        's1',
+        { limit: 20, before: '100' }
+      );
+    });
+  });
+
   // ---- POST /api/sessions/:id/messages (SSE) ----
 
   describe('POST /api/sessions/:id/messages', () => {
@@ -9,9 +9,13 @@ const registry = new CommandRegistryService(vaultRoot);
 const router = Router();
 
 // GET /api/commands - List all commands (with optional refresh)
+// Revalidated with If-None-Match, so unchanged registries cost a 304
 router.get('/', async (req, res) => {
   const refresh = req.query.refresh === 'true';
   const commands = await registry.getCommands(refresh);
+  res.set('Cache-Control', 'no-cache');
+  res.set('ETag', registry.getEtag());
+  if (req.fresh) return res.status(304).end();
   res.json(commands);
 });
 
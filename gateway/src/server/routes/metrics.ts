@@ -0,0 +1,15 @@
+import { Router } from 'express';
+import { metrics } from '../services/metrics';
+import { agentManager } from '../services/agent-manager';
+
+const router = Router();
+
+// GET /api/metrics - Latency, throughput and runtime histograms plus the agent pool state
+router.get('/', (_req, res) => {
+  res.json({
+    ...metrics.snapshot(),
+    agent: agentManager.getPoolStats(),
+  });
+});
+
+export default router;
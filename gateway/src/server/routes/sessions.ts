@@ -3,10 +3,22 @@ import { fileURLToPath } from 'url';
 import { Router } from 'express';
 import { agentManager } from '../services/agent-manager';
 import { transcriptReader } from '../services/transcript-reader';
-import { initSSEStream, sendSSEEvent, endSSEStream } from '../services/stream-adapter';
+import { SessionWatcher } from '../services/session-watcher';
+import { metrics } from '../services/metrics';
+import {
+  initSSEStream,
+  CoalescingSSEWriter,
+  SSEEventWriter,
+  sseEventsPerSecond,
+} from '../services/stream-adapter';
+import type { Session, SessionEvent, TranscriptAppendedEvent } from '../../shared/types';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 const vaultRoot = path.resolve(__dirname, '../../../../');
+const sessionWatcher = new SessionWatcher(vaultRoot);
+
+// Interval for SSE comment lines that keep idle event connections open
+const KEEPALIVE_MS = 25_000;
 
 const router = Router();
 
@@ -32,10 +44,42 @@ router.post('/', async (req, res) => {
   });
 });
 
-// GET /api/sessions - List all sessions from SDK transcripts
-router.get('/', async (_req, res) => {
-  const sessions = await transcriptReader.listSessions(vaultRoot);
-  res.json(sessions);
+// GET /api/sessions - List sessions from SDK transcripts (most recent first)
+// With ?limit=N returns one page; the next page's cursor is sent in X-Next-Cursor
+// and can be passed back as ?cursor=...
+router.get('/', async (req, res) => {
+  const limit = parseInt(req.query.limit as string, 10);
+  if (!limit || limit < 1) {
+    const sessions = await transcriptReader.listSessions(vaultRoot);
+    return res.json(sessions);
+  }
+
+  const cursor = typeof req.query.cursor === 'string' ? req.query.cursor : undefined;
+  const page = await transcriptReader.listSessionsPage(vaultRoot, { limit, cursor });
+  if (page.nextCursor) res.setHeader('X-Next-Cursor', page.nextCursor);
+  res.json(page.sessions);
+});
+
+function eventKey(event: SessionEvent): string {
+  return event.type === 'transcript_appended'
+    ? `transcript:${(event.data as TranscriptAppendedEvent).sessionId}`
+    : `session:${(event.data as Session).id}`;
+}
+
+// GET /api/sessions/events - Live session changes (long-lived SSE stream)
+// Pushes session_created, session_updated and transcript_appended events.
+router.get('/events', (req, res) => {
+  initSSEStream(res);
+
+  // A slow client only ever has the latest pending event per session
+  const writer = new CoalescingSSEWriter(res, eventKey);
+  const unsubscribe = sessionWatcher.subscribe(event => writer.send(event));
+  const keepAlive = setInterval(() => writer.comment('keep-alive'), KEEPALIVE_MS);
+
+  req.on('close', () => {
+    clearInterval(keepAlive);
+    unsubscribe();
+  });
 });
 
 // GET /api/sessions/:id - Get session details
@@ -46,9 +90,21 @@ router.get('/:id', async (req, res) => {
 });
 
 // GET /api/sessions/:id/messages - Get message history from SDK transcript
+// With ?limit=N returns the newest N messages (or the N before ?before=<cursor>)
+// plus a nextCursor for the preceding page.
 router.get('/:id/messages', async (req, res) => {
-  const messages = await transcriptReader.readTranscript(vaultRoot, req.params.id);
-  res.json({ messages });
+  const limit = parseInt(req.query.limit as string, 10);
+  if (!limit || limit < 1) {
+    const messages = await transcriptReader.readTranscript(vaultRoot, req.params.id);
+    return res.json({ messages });
+  }
+
+  const before = typeof req.query.before === 'string' ? req.query.before : undefined;
+  const page = await transcriptReader.readTranscriptPage(vaultRoot, req.params.id, {
+    limit,
+    before,
+  });
+  res.json(page);
 });
 
 // POST /api/sessions/:id/messages - Send message (SSE stream response)
@@ -59,17 +115,27 @@ router.post('/:id/messages', async (req, res) => {
   const sessionId = req.params.id;
 
   initSSEStream(res);
+  const writer = new SSEEventWriter(res);
+
+  // When the client goes away (e.g. the Stop button), stop the agent so the
+  // turn's scheduler slots free up instead of running to completion unseen
+  const disconnect = new AbortController();
+  res.on('close', () => disconnect.abort());
 
   try {
-    for await (const event of agentManager.sendMessage(sessionId, content)) {
-      sendSSEEvent(res, event);
+    // Awaiting each send applies backpressure: the SDK stream isn't pulled
+    // while the client's socket buffer is full
+    const stream = agentManager.sendMessage(sessionId, content, { signal: disconnect.signal });
+    for await (const event of stream) {
+      if (disconnect.signal.aborted) break;
+      await writer.send(event);
 
       // If SDK assigned a different session ID, track it
       if (event.type === 'done') {
         const actualSdkId = agentManager.getSdkSessionId(sessionId);
         if (actualSdkId && actualSdkId !== sessionId) {
           // Send a redirect hint so the client can update its session ID
-          sendSSEEvent(res, {
+          await writer.send({
             type: 'done',
             data: { sessionId: actualSdkId },
           });
@@ -77,12 +143,14 @@ router.post('/:id/messages', async (req, res) => {
       }
     }
   } catch (err) {
-    sendSSEEvent(res, {
+    await writer.send({
       type: 'error',
       data: { message: err instanceof Error ? err.message : 'Unknown error' },
     });
   } finally {
-    endSSEStream(res);
+    // Recorded here rather than on 'close', which fires before this on a disconnect
+    const eventsPerSecond = sseEventsPerSecond(writer.end());
+    if (eventsPerSecond !== null) metrics.observe('sse_events_per_second', eventsPerSecond);
   }
 });
 
@@ -0,0 +1,114 @@
+// @vitest-environment node
+/**
+ * Gateway throughput on synthetic data: session listing and transcript
+ * parsing over a generated transcripts directory, and agent-to-SSE streaming
+ * against a stub SDK.
+ *
+ *   npm run bench
+ *   BENCH_SESSIONS=5000 BENCH_TRANSCRIPT_MB=20 npm run bench
+ */
+import { bench, describe, afterAll, vi } from 'vitest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { Writable } from 'stream';
+import type { Response } from 'express';
+import { TranscriptReader } from '../transcript-reader';
+import { agentManager } from '../agent-manager';
+import { SSEEventWriter, sseEventsPerSecond, type SSEStreamMetrics } from '../stream-adapter';
+import { metrics } from '../metrics';
+import { writeSyntheticTranscripts } from '../../../test-utils/synthetic-transcripts';
+
+vi.mock('@anthropic-ai/claude-agent-sdk', async () => {
+  const { createStubQuery } = await import('../../../test-utils/stub-sdk-query');
+  return { query: createStubQuery() };
+});
+
+const MB = 1024 * 1024;
+const SESSIONS = parseInt(process.env.BENCH_SESSIONS ?? '2000', 10);
+const TRANSCRIPT_MB = parseFloat(process.env.BENCH_TRANSCRIPT_MB ?? '5');
+
+// Transcripts are resolved under ~/.claude/projects, so point HOME at a scratch dir
+const root = await fs.mkdtemp(path.join(os.tmpdir(), 'gateway-bench-'));
+process.env.HOME = root;
+const vaultRoot = path.join(root, 'vault');
+const warmReader = new TranscriptReader();
+
+const synthetic = await writeSyntheticTranscripts(warmReader.getTranscriptsDir(vaultRoot), {
+  sessions: SESSIONS,
+  largeSessionBytes: TRANSCRIPT_MB * MB,
+});
+const largeSessionId = synthetic.largeSessionId!;
+await warmReader.listSessions(vaultRoot);
+
+const streamRuns: SSEStreamMetrics[] = [];
+
+async function streamTurn() {
+  // Discarding sink with a socket-sized buffer, so backpressure paths still run
+  const sink = new Writable({
+    highWaterMark: 64 * 1024,
+    write(_chunk, _encoding, callback) {
+      setImmediate(callback);
+    },
+  });
+  const writer = new SSEEventWriter(sink as unknown as Response);
+
+  for await (const event of agentManager.sendMessage('bench-session', 'go')) {
+    await writer.send(event);
+  }
+  streamRuns.push(writer.end());
+}
+
+function mean(values: number[]): number {
+  return values.reduce((a, b) => a + b, 0) / values.length;
+}
+
+describe('transcript reader', () => {
+  bench(`listSessions, cold index (${SESSIONS + 1} sessions)`, async () => {
+    await fs.rm(path.join(vaultRoot, 'state'), { recursive: true, force: true });
+    await new TranscriptReader().listSessions(vaultRoot);
+  }, { iterations: 5, time: 0 });
+
+  bench(`listSessions, warm index (${SESSIONS + 1} sessions)`, async () => {
+    await warmReader.listSessions(vaultRoot);
+  }, { iterations: 20, time: 0 });
+
+  bench(`readTranscript (${TRANSCRIPT_MB} MB)`, async () => {
+    await warmReader.readTranscript(vaultRoot, largeSessionId);
+  }, { iterations: 10, time: 0 });
+
+  bench(`readTranscriptPage, newest 50 (${TRANSCRIPT_MB} MB)`, async () => {
+    await warmReader.readTranscriptPage(vaultRoot, largeSessionId, { limit: 50 });
+  }, { iterations: 20, time: 0 });
+});
+
+describe('agent streaming', () => {
+  bench('stub SDK turn through SSEEventWriter', streamTurn, { iterations: 20, time: 0 });
+});
+
+afterAll(async () => {
+  agentManager.shutdown();
+  await fs.rm(root, { recursive: true, force: true });
+
+  const { histograms } = metrics.snapshot();
+  const parse = histograms.transcript_parse_ms_per_mb.series.all;
+  const lines = [
+    '',
+    `Synthetic data: ${synthetic.sessionIds.length} transcripts, ${(synthetic.totalBytes / MB).toFixed(1)} MB`,
+  ];
+  if (parse) {
+    lines.push(`  transcript parse: p50 ${parse.p50}ms/MB, p99 ${parse.p99}ms/MB (${parse.count} reads)`);
+  }
+  if (streamRuns.length > 0) {
+    const eventsPerSecond = mean(streamRuns.map(r => sseEventsPerSecond(r) ?? 0));
+    const ttft = histograms.agent_ttft_ms.series.all;
+    lines.push(
+      `  streaming: ${Math.round(eventsPerSecond)} events/s, ` +
+        `${mean(streamRuns.map(r => r.framesOut)).toFixed(0)} writes and ` +
+        `${(mean(streamRuns.map(r => r.bytesOut)) / 1024).toFixed(0)} KB per turn, ` +
+        `${mean(streamRuns.map(r => r.drainWaits)).toFixed(1)} drain waits`
+    );
+    if (ttft) lines.push(`  ttft: p50 ${ttft.p50}ms, p99 ${ttft.p99}ms`);
+  }
+  console.log(lines.join('\n'));
+});
@@ -1,4 +1,5 @@
-import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import type { StreamEvent } from '../../../shared/types';
 
 // Mock the SDK before importing agent-manager
 vi.mock('@anthropic-ai/claude-agent-sdk', () => ({
@@ -305,30 +306,154 @@ describe('AgentManager', () => {
     });
   });
 
-  describe('checkSessionHealth()', () => {
-    it('removes sessions older than 30 minutes', () => {
-      agentManager.ensureSession('old', { permissionMode: 'default' });
+  describe('session expiry', () => {
+    afterEach(() => {
+      vi.useRealTimers();
+    });
 
-      // Advance time by 31 minutes
+    it('removes sessions after 30 minutes without activity', () => {
       vi.useFakeTimers();
-      vi.advanceTimersByTime(31 * 60 * 1000);
+      agentManager.ensureSession('old', { permissionMode: 'default' });
 
-      agentManager.checkSessionHealth();
+      vi.advanceTimersByTime(31 * 60 * 1000);
       expect(agentManager.hasSession('old')).toBe(false);
-
-      vi.useRealTimers();
     });
 
     it('keeps fresh sessions', () => {
+      vi.useFakeTimers();
       agentManager.ensureSession('fresh', { permissionMode: 'default' });
 
-      vi.useFakeTimers();
       vi.advanceTimersByTime(5 * 60 * 1000); // 5 minutes
-
-      agentManager.checkSessionHealth();
       expect(agentManager.hasSession('fresh')).toBe(true);
+    });
+  });
 
+  describe('warm query pool', () => {
+    /**
+     * Streaming-input query that answers every user message with one
+     * text delta and a result, staying alive until its prompt closes.
+     */
+    async function mockStreamingQuery() {
+      const { query: mockedQuery } = await import('@anthropic-ai/claude-agent-sdk');
+      const mock = mockedQuery as ReturnType<typeof vi.fn>;
+      mock.mockReset();
+      mock.mockImplementation(({ prompt }: { prompt: AsyncIterable<any> }) =>
+        (async function* () {
+          for await (const msg of prompt) {
+            yield {
+              type: 'stream_event',
+              event: {
+                type: 'content_block_delta',
+                index: 0,
+                delta: { type: 'text_delta', text: `echo: ${msg.message.content}` },
+              },
+            };
+            yield { type: 'result', subtype: 'success', session_id: msg.session_id };
+          }
+        })()
+      );
+      return mock;
+    }
+
+    async function collect(stream: AsyncGenerator<StreamEvent>) {
+      const events: StreamEvent[] = [];
+      for await (const event of stream) events.push(event);
+      return events;
+    }
+
+    afterEach(() => {
+      agentManager.shutdown();
       vi.useRealTimers();
     });
+
+    it('reuses one live query across turns of a session', async () => {
+      const mock = await mockStreamingQuery();
+
+      await collect(agentManager.sendMessage('s1', 'one'));
+      const second = await collect(agentManager.sendMessage('s1', 'two'));
+
+      expect(mock).toHaveBeenCalledTimes(1);
+      expect(typeof mock.mock.calls[0][0].prompt).not.toBe('string');
+      expect(second.find(e => e.type === 'text_delta')!.data).toEqual({ text: 'echo: two' });
+      expect(second.filter(e => e.type === 'done')).toHaveLength(1);
+      expect(agentManager.getPoolStats()).toMatchObject({ warm: 1, busy: 0 });
+    });
+
+    it('starts a fresh query when the warm one has exited', async () => {
+      const { query: mockedQuery } = await import('@anthropic-ai/claude-agent-sdk');
+      const mock = mockedQuery as ReturnType<typeof vi.fn>;
+      mock.mockReset();
+      // One-shot query: ends after answering the first message
+      mock.mockImplementation(({ prompt }: { prompt: AsyncIterable<any> }) =>
+        (async function* () {
+          for await (const msg of prompt) {
+            yield {
+              type: 'stream_event',
+              event: {
+                type: 'content_block_delta',
+                index: 0,
+                delta: { type: 'text_delta', text: msg.message.content },
+              },
+            };
+            yield { type: 'result', subtype: 'success', session_id: msg.session_id };
+            return;
+          }
+        })()
+      );
+
+      await collect(agentManager.sendMessage('s1', 'one'));
+      const second = await collect(agentManager.sendMessage('s1', 'two'));
+
+      expect(mock).toHaveBeenCalledTimes(2);
+      expect(second.find(e => e.type === 'text_delta')!.data).toEqual({ text: 'two' });
+    });
+
+    it('evicts the least recently used idle query when the pool is full', async () => {
+      const mock = await mockStreamingQuery();
+
+      for (const id of ['s1', 's2', 's3', 's4', 's5']) {
+        await collect(agentManager.sendMessage(id, 'hi'));
+      }
+      expect(agentManager.getPoolStats().warm).toBe(4);
+
+      // s5 is still warm, s1 was evicted
+      await collect(agentManager.sendMessage('s5', 'again'));
+      expect(mock).toHaveBeenCalledTimes(5);
+      await collect(agentManager.sendMessage('s1', 'again'));
+      expect(mock).toHaveBeenCalledTimes(6);
+    });
+
+    it('closes queries that stay idle', async () => {
+      vi.useFakeTimers();
+      await mockStreamingQuery();
+
+      await collect(agentManager.sendMessage('s1', 'hi'));
+      expect(agentManager.getPoolStats().warm).toBe(1);
+
+      vi.advanceTimersByTime(10 * 60 * 1000);
+      expect(agentManager.getPoolStats().warm).toBe(0);
+      expect(agentManager.hasSession('s1')).toBe(true);
+    });
+
+    it('closes the query when the consumer stops mid-turn', async () => {
+      await mockStreamingQuery();
+
+      for await (const event of agentManager.sendMessage('s1', 'hi')) {
+        if (event.type === 'text_delta') break;
+      }
+
+      expect(agentManager.getPoolStats()).toMatchObject({ warm: 0, activeTurns: 0 });
+    });
+
+    it('records time to first token and turn duration', async () => {
+      await mockStreamingQuery();
+      const { metrics } = await import('../../services/metrics');
+
+      await collect(agentManager.sendMessage('s1', 'hi'));
+
+      const { histograms } = metrics.snapshot();
+      expect(histograms.agent_ttft_ms.series.all.count).toBe(1);
+      expect(histograms.agent_turn_duration_ms.series.all.count).toBe(1);
+    });
   });
 });
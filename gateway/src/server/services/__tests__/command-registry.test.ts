@@ -1,15 +1,24 @@
-import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import fs from 'fs/promises';
-import type { Dirent } from 'fs';
+import { watch, type Dirent } from 'fs';
 
 vi.mock('fs/promises');
+vi.mock('fs', () => ({
+  watch: vi.fn(),
+}));
 
 describe('CommandRegistryService', () => {
   let CommandRegistryService: typeof import('../../services/command-registry').CommandRegistryService;
+  let onChange: () => void;
 
   beforeEach(async () => {
     vi.resetModules();
     vi.clearAllMocks();
+    vi.mocked(fs.stat).mockResolvedValue({ mtimeMs: 1000, size: 100 } as any);
+    vi.mocked(watch).mockImplementation(((_dir: string, _opts: unknown, cb: () => void) => {
+      onChange = cb;
+      return { on: vi.fn(), close: vi.fn(), unref: vi.fn() };
+    }) as any);
     const mod = await import('../../services/command-registry');
     CommandRegistryService = mod.CommandRegistryService;
   });
@@ -160,4 +169,148 @@ describe('CommandRegistryService', () => {
 
     expect(result.commands[0].allowedTools).toEqual(['Read', 'Write', 'Bash']);
   });
+
+  describe('incremental rescans', () => {
+    function mockTree(files: string[]) {
+      vi.mocked(fs.readdir)
+        .mockResolvedValueOnce([makeDirent('daily', true)] as any)
+        .mockResolvedValueOnce(files as any);
+    }
+
+    it('re-parses only files whose mtime or size changed', async () => {
+      mockTree(['plan.md', 'note.md']);
+      vi.mocked(fs.readFile)
+        .mockResolvedValueOnce('---\ndescription: Plan\n---\n')
+        .mockResolvedValueOnce('---\ndescription: Note\n---\n');
+
+      const registry = new CommandRegistryService('/vault');
+      await registry.getCommands();
+      expect(fs.readFile).toHaveBeenCalledTimes(2);
+
+      mockTree(['plan.md', 'note.md']);
+      vi.mocked(fs.stat).mockImplementation((async (p: string) =>
+        p.endsWith('plan.md') ? { mtimeMs: 2000, size: 120 } : { mtimeMs: 1000, size: 100 }
+      ) as any);
+      vi.mocked(fs.readFile).mockResolvedValueOnce('---\ndescription: Plan v2\n---\n');
+
+      const result = await registry.getCommands(true);
+      expect(fs.readFile).toHaveBeenCalledTimes(3);
+      expect(result.commands.map(c => c.description)).toEqual(['Note', 'Plan v2']);
+    });
+
+    it('keeps the parsed entry when a file is touched but not edited', async () => {
+      mockTree(['plan.md']);
+      vi.mocked(fs.readFile).mockResolvedValue('---\ndescription: Plan\n---\n');
+
+      const registry = new CommandRegistryService('/vault');
+      const first = await registry.getCommands();
+      const etag = registry.getEtag();
+
+      mockTree(['plan.md']);
+      vi.mocked(fs.stat).mockResolvedValue({ mtimeMs: 2000, size: 100 } as any);
+      const second = await registry.getCommands(true);
+
+      expect(second.commands[0]).toBe(first.commands[0]);
+      expect(second).toBe(first);
+      expect(registry.getEtag()).toBe(etag);
+    });
+
+    it('drops deleted files and changes the ETag', async () => {
+      mockTree(['plan.md', 'note.md']);
+      vi.mocked(fs.readFile).mockResolvedValue('---\ndescription: X\n---\n');
+
+      const registry = new CommandRegistryService('/vault');
+      await registry.getCommands();
+      const etag = registry.getEtag();
+
+      mockTree(['plan.md']);
+      const result = await registry.getCommands(true);
+
+      expect(result.commands.map(c => c.command)).toEqual(['plan']);
+      expect(registry.getEtag()).not.toBe(etag);
+    });
+
+    it('rescans after the watcher reports a change', async () => {
+      mockTree(['plan.md']);
+      vi.mocked(fs.readFile).mockResolvedValue('---\ndescription: Plan\n---\n');
+
+      const registry = new CommandRegistryService('/vault');
+      await registry.getCommands();
+      expect(watch).toHaveBeenCalledWith('/vault/.claude/commands', { recursive: true }, expect.any(Function));
+
+      onChange();
+      mockTree(['plan.md', 'review.md']);
+      const result = await registry.getCommands();
+
+      expect(result.commands).toHaveLength(2);
+      expect(watch).toHaveBeenCalledTimes(1);
+    });
+
+    describe('while the directory is missing or unwatchable', () => {
+      beforeEach(() => {
+        vi.useFakeTimers();
+      });
+
+      afterEach(() => {
+        vi.useRealTimers();
+      });
+
+      it('serves the cache until the retry, then rescans and retries the watch', async () => {
+        vi.mocked(watch).mockImplementationOnce(() => {
+          throw new Error('ERR_FEATURE_UNAVAILABLE_ON_PLATFORM');
+        });
+        mockTree(['plan.md']);
+        vi.mocked(fs.readFile).mockResolvedValue('---\ndescription: Plan\n---\n');
+
+        const registry = new CommandRegistryService('/vault');
+        const first = await registry.getCommands();
+        expect(await registry.getCommands()).toBe(first);
+        expect(fs.readdir).toHaveBeenCalledTimes(2);
+
+        vi.advanceTimersByTime(30_000);
+        mockTree(['plan.md', 'review.md']);
+        const result = await registry.getCommands();
+
+        expect(result.commands).toHaveLength(2);
+        expect(watch).toHaveBeenCalledTimes(2);
+      });
+
+      it('warns once and picks up the directory when it appears', async () => {
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+        vi.mocked(watch).mockImplementation(() => {
+          throw new Error('ENOENT');
+        });
+        vi.mocked(fs.readdir).mockRejectedValue(new Error('ENOENT'));
+        vi.mocked(fs.readFile).mockResolvedValue('---\ndescription: Plan\n---\n');
+
+        const registry = new CommandRegistryService('/vault');
+        expect((await registry.getCommands()).commands).toEqual([]);
+        await registry.getCommands();
+        vi.advanceTimersByTime(30_000);
+        await registry.getCommands();
+
+        expect(fs.readdir).toHaveBeenCalledTimes(2);
+        expect(warn).toHaveBeenCalledTimes(1);
+
+        vi.mocked(fs.readdir).mockReset();
+        mockTree(['plan.md']);
+        vi.advanceTimersByTime(30_000);
+        const result = await registry.getCommands();
+
+        expect(result.commands.map(c => c.command)).toEqual(['plan']);
+        warn.mockRestore();
+      });
+    });
+
+    it('shares one scan between concurrent callers', async () => {
+      mockTree(['plan.md']);
+      vi.mocked(fs.readFile).mockResolvedValue('---\ndescription: Plan\n---\n');
+
+      const registry = new CommandRegistryService('/vault');
+      const [a, b] = await Promise.all([registry.getCommands(), registry.getCommands()]);
+
+      expect(a).toBe(b);
+      expect(fs.readdir).toHaveBeenCalledTimes(2);
+    });
+  });
 });
@@ -0,0 +1,87 @@
+import { describe, it, expect, afterEach, vi } from 'vitest';
+import { Histogram, MetricsRegistry } from '../../services/metrics';
+
+describe('Histogram', () => {
+  it('summarises count, sum, extremes and mean', () => {
+    const histogram = new Histogram([10, 100]);
+    for (const value of [5, 20, 50]) histogram.observe(value);
+
+    expect(histogram.summary()).toMatchObject({
+      count: 3,
+      sum: 75,
+      min: 5,
+      max: 50,
+      mean: 25,
+    });
+  });
+
+  it('reports cumulative bucket counts including +Inf', () => {
+    const histogram = new Histogram([10, 100]);
+    for (const value of [1, 10, 11, 500]) histogram.observe(value);
+
+    expect(histogram.summary().buckets).toEqual({ '10': 2, '100': 3, '+Inf': 4 });
+  });
+
+  it('estimates quantiles within the observed range', () => {
+    const histogram = new Histogram([1, 2, 5, 10, 25, 50, 100]);
+    for (let i = 1; i <= 100; i++) histogram.observe(i);
+
+    const { p50, p99 } = histogram.summary();
+    expect(p50).toBeGreaterThanOrEqual(25);
+    expect(p50).toBeLessThanOrEqual(75);
+    expect(p99).toBeGreaterThan(p50);
+    expect(p99).toBeLessThanOrEqual(100);
+  });
+
+  it('ignores non-finite values and summarises empty histograms as zero', () => {
+    const histogram = new Histogram([10]);
+    histogram.observe(NaN);
+    histogram.observe(Infinity);
+
+    expect(histogram.summary()).toMatchObject({ count: 0, min: 0, max: 0, p50: 0 });
+  });
+});
+
+describe('MetricsRegistry', () => {
+  const registry = new MetricsRegistry();
+
+  afterEach(() => {
+    registry.stopRuntimeSampling();
+    registry.reset();
+    vi.useRealTimers();
+  });
+
+  it('keeps one series per label', () => {
+    registry.define('latency', { help: 'Request latency', unit: 'ms', buckets: [10, 100] });
+    registry.observe('latency', 5, 'GET /a');
+    registry.observe('latency', 50, 'GET /a');
+    registry.observe('latency', 500, 'GET /b');
+
+    const { histograms } = registry.snapshot();
+    expect(histograms.latency.help).toBe('Request latency');
+    expect(histograms.latency.series['GET /a'].count).toBe(2);
+    expect(histograms.latency.series['GET /b'].count).toBe(1);
+  });
+
+  it('creates unknown metrics on first observation', () => {
+    registry.observe('adhoc', 3);
+    expect(registry.snapshot().histograms.adhoc.series.all.count).toBe(1);
+  });
+
+  it('includes current memory use in snapshots', () => {
+    const { memory } = registry.snapshot();
+    expect(memory.heapUsedMb).toBeGreaterThan(0);
+    expect(memory.rssMb).toBeGreaterThan(0);
+  });
+
+  it('samples event-loop lag and heap use on an interval', () => {
+    vi.useFakeTimers();
+    registry.startRuntimeSampling(1000);
+
+    vi.advanceTimersByTime(3000);
+
+    const { histograms } = registry.snapshot();
+    expect(histograms.event_loop_lag_ms.series.all.count).toBe(3);
+    expect(histograms.heap_used_mb.series.all.count).toBe(3);
+  });
+});
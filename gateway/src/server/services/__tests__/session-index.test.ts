@@ -0,0 +1,134 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+
+vi.mock('fs/promises');
+
+import fs from 'fs/promises';
+import type { SessionIndexEntry } from '../../services/session-index';
+
+const entry: SessionIndexEntry = {
+  firstUserMessage: 'Hello',
+  lastUserMessage: 'Bye',
+  firstTimestamp: '2024-01-01T00:00:00Z',
+  permissionMode: 'default',
+  size: 100,
+  mtimeMs: 1000,
+  birthtime: '2024-01-01T00:00:00.000Z',
+  offset: 100,
+};
+
+describe('SessionIndex', () => {
+  let SessionIndex: typeof import('../../services/session-index').SessionIndex;
+
+  beforeEach(async () => {
+    vi.resetModules();
+    vi.clearAllMocks();
+    const mod = await import('../../services/session-index');
+    SessionIndex = mod.SessionIndex;
+  });
+
+  it('loads entries from disk', async () => {
+    vi.mocked(fs.readFile).mockResolvedValueOnce(
+      JSON.stringify({ version: 1, entries: { 'abc.jsonl': entry } })
+    );
+
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    await index.load();
+
+    expect(index.get('abc.jsonl')).toEqual(entry);
+  });
+
+  it('starts empty when the index file is missing or from another version', async () => {
+    vi.mocked(fs.readFile).mockResolvedValueOnce(
+      JSON.stringify({ version: 0, entries: { 'abc.jsonl': entry } })
+    );
+
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    await index.load();
+
+    expect(index.get('abc.jsonl')).toBeUndefined();
+  });
+
+  it('only loads once', async () => {
+    vi.mocked(fs.readFile).mockRejectedValue(new Error('ENOENT'));
+
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    await index.load();
+    await index.load();
+
+    expect(fs.readFile).toHaveBeenCalledTimes(1);
+  });
+
+  it('saves atomically via a temp file and rename', async () => {
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    index.set('abc.jsonl', entry);
+    await index.save();
+
+    expect(fs.mkdir).toHaveBeenCalledWith('/vault/state/gateway', { recursive: true });
+    const [tmpPath, content] = vi.mocked(fs.writeFile).mock.calls[0];
+    expect(JSON.parse(content as string)).toEqual({
+      version: 1,
+      entries: { 'abc.jsonl': entry },
+    });
+    expect(fs.rename).toHaveBeenCalledWith(tmpPath, '/vault/state/gateway/session-index.json');
+  });
+
+  it('skips saving when nothing changed', async () => {
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    index.set('abc.jsonl', entry);
+    await index.save();
+    await index.save();
+
+    expect(fs.writeFile).toHaveBeenCalledTimes(1);
+  });
+
+  it('never runs two writes at once and folds saves made mid-write into one', async () => {
+    let active = 0;
+    let maxActive = 0;
+    vi.mocked(fs.writeFile).mockImplementation(async () => {
+      active++;
+      maxActive = Math.max(maxActive, active);
+      await new Promise(resolve => setTimeout(resolve, 5));
+      active--;
+    });
+
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    index.set('abc.jsonl', entry);
+    const first = index.save();
+    index.set('def.jsonl', entry);
+    const second = index.save();
+    index.set('ghi.jsonl', entry);
+    const third = index.save();
+    await Promise.all([first, second, third]);
+
+    expect(maxActive).toBe(1);
+    expect(fs.writeFile).toHaveBeenCalledTimes(2);
+    const [, content] = vi.mocked(fs.writeFile).mock.calls[1];
+    expect(Object.keys(JSON.parse(content as string).entries)).toEqual([
+      'abc.jsonl',
+      'def.jsonl',
+      'ghi.jsonl',
+    ]);
+  });
+
+  it('keeps changes dirty after a failed write', async () => {
+    vi.spyOn(console, 'warn').mockImplementation(() => {});
+    vi.mocked(fs.writeFile).mockRejectedValueOnce(new Error('EACCES'));
+
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    index.set('abc.jsonl', entry);
+    await index.save();
+    await index.save();
+
+    expect(fs.writeFile).toHaveBeenCalledTimes(2);
+  });
+
+  it('prunes entries for deleted transcripts', async () => {
+    const index = new SessionIndex('/vault/state/gateway/session-index.json');
+    index.set('abc.jsonl', entry);
+    index.set('def.jsonl', entry);
+    index.prune(['def.jsonl']);
+
+    expect(index.get('abc.jsonl')).toBeUndefined();
+    expect(index.get('def.jsonl')).toEqual(entry);
+  });
+});
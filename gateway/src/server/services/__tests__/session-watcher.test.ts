@@ -0,0 +1,120 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+
+vi.mock('fs', () => ({
+  watch: vi.fn(),
+}));
+vi.mock('fs/promises');
+vi.mock('../../services/transcript-reader', () => ({
+  transcriptReader: {
+    getTranscriptsDir: vi.fn(() => '/home/.claude/projects/-vault'),
+    getSession: vi.fn(),
+  },
+}));
+
+import { watch } from 'fs';
+import fs from 'fs/promises';
+import { transcriptReader } from '../../services/transcript-reader';
+import type { SessionEvent } from '../../../shared/types';
+
+const session = {
+  id: 'abc',
+  title: 'Hello',
+  createdAt: '2024-01-01T00:00:00Z',
+  updatedAt: '2024-01-02T00:00:00Z',
+  permissionMode: 'default' as const,
+};
+
+describe('SessionWatcher', () => {
+  let SessionWatcher: typeof import('../../services/session-watcher').SessionWatcher;
+  let onChange: (eventType: string, filename: string | null) => void;
+  const close = vi.fn();
+
+  beforeEach(async () => {
+    vi.useFakeTimers();
+    vi.clearAllMocks();
+    vi.mocked(watch).mockImplementation(((_dir: string, cb: typeof onChange) => {
+      onChange = cb;
+      return { on: vi.fn(), close };
+    }) as any);
+    vi.mocked(fs.readdir).mockResolvedValue(['abc.jsonl'] as any);
+    vi.mocked(fs.stat).mockResolvedValue({ size: 10 } as any);
+    vi.mocked(transcriptReader.getSession).mockResolvedValue(session);
+
+    const mod = await import('../../services/session-watcher');
+    SessionWatcher = mod.SessionWatcher;
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  async function subscribe(watcher: InstanceType<typeof SessionWatcher>) {
+    const events: SessionEvent[] = [];
+    const unsubscribe = watcher.subscribe(e => events.push(e));
+    await vi.waitFor(() => expect(watch).toHaveBeenCalled());
+    return { events, unsubscribe };
+  }
+
+  it('emits session_updated and transcript_appended when a transcript grows', async () => {
+    const watcher = new SessionWatcher('/vault');
+    const { events } = await subscribe(watcher);
+
+    vi.mocked(fs.stat).mockResolvedValue({ size: 20 } as any);
+    onChange('change', 'abc.jsonl');
+    await vi.advanceTimersByTimeAsync(300);
+
+    expect(events).toEqual([
+      { type: 'session_updated', data: session },
+      { type: 'transcript_appended', data: { sessionId: 'abc', size: 20 } },
+    ]);
+  });
+
+  it('emits session_created for a new transcript', async () => {
+    const watcher = new SessionWatcher('/vault');
+    const { events } = await subscribe(watcher);
+
+    onChange('rename', 'new.jsonl');
+    await vi.advanceTimersByTimeAsync(300);
+
+    expect(transcriptReader.getSession).toHaveBeenCalledWith('/vault', 'new', { persist: false });
+    expect(events).toEqual([{ type: 'session_created', data: session }]);
+  });
+
+  it('coalesces bursts of changes into one check per file', async () => {
+    const watcher = new SessionWatcher('/vault');
+    const { events } = await subscribe(watcher);
+
+    vi.mocked(fs.stat).mockResolvedValue({ size: 20 } as any);
+    for (let i = 0; i < 10; i++) onChange('change', 'abc.jsonl');
+    await vi.advanceTimersByTimeAsync(300);
+
+    expect(transcriptReader.getSession).toHaveBeenCalledTimes(1);
+    expect(events).toHaveLength(2);
+  });
+
+  it('ignores unchanged sizes and non-transcript files', async () => {
+    const watcher = new SessionWatcher('/vault');
+    const { events } = await subscribe(watcher);
+
+    onChange('change', 'abc.jsonl');
+    onChange('change', 'notes.txt');
+    await vi.advanceTimersByTimeAsync(300);
+
+    expect(events).toEqual([]);
+  });
+
+  it('shares one watcher between subscribers and closes it after the last leaves', async () => {
+    const watcher = new SessionWatcher('/vault');
+    const first = await subscribe(watcher);
+    const second = watcher.subscribe(() => {});
+
+    expect(watch).toHaveBeenCalledTimes(1);
+    expect(watcher.subscriberCount).toBe(2);
+
+    first.unsubscribe();
+    expect(close).not.toHaveBeenCalled();
+    second();
+    expect(close).toHaveBeenCalled();
+    expect(watcher.subscriberCount).toBe(0);
+  });
+});
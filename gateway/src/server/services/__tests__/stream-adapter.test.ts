@@ -1,5 +1,13 @@
-import { describe, it, expect, vi } from 'vitest';
-import { initSSEStream, sendSSEEvent, endSSEStream } from '../../services/stream-adapter';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { EventEmitter } from 'events';
+import {
+  initSSEStream,
+  sendSSEEvent,
+  endSSEStream,
+  SSEEventWriter,
+  CoalescingSSEWriter,
+  sseEventsPerSecond,
+} from '../../services/stream-adapter';
 import type { StreamEvent } from '../../../shared/types';
 
 function createMockResponse() {
@@ -29,15 +37,14 @@ describe('Stream Adapter', () => {
       data: { text: 'hello' },
     };
     sendSSEEvent(res, event);
-    expect(res.write).toHaveBeenCalledWith('event: text_delta\n');
-    expect(res.write).toHaveBeenCalledWith('data: {"text":"hello"}\n\n');
+    expect(res.write).toHaveBeenCalledWith('event: text_delta\ndata: {"text":"hello"}\n\n');
   });
 
   it('multiple events produce correct format', () => {
     const res = createMockResponse();
     sendSSEEvent(res, { type: 'text_delta', data: { text: 'a' } });
     sendSSEEvent(res, { type: 'done', data: { sessionId: '1' } });
-    expect(res.write).toHaveBeenCalledTimes(4); // 2 calls per event
+    expect(res.write).toHaveBeenCalledTimes(2); // 1 call per event
   });
 
   it('endSSEStream calls res.end()', () => {
@@ -46,3 +53,235 @@ describe('Stream Adapter', () => {
     expect(res.end).toHaveBeenCalled();
   });
 });
+
+function createStreamingResponse() {
+  const res = new EventEmitter() as any;
+  res.write = vi.fn(() => true);
+  res.end = vi.fn();
+  res.writableLength = 0;
+  return res;
+}
+
+function written(res: any): string {
+  return res.write.mock.calls.map((c: [string]) => c[0]).join('');
+}
+
+describe('SSEEventWriter', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.restoreAllMocks();
+  });
+
+  it('merges adjacent text deltas into one event per window', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    for (const text of ['Hel', 'lo', ' world']) {
+      writer.send({ type: 'text_delta', data: { text } });
+    }
+    expect(res.write).not.toHaveBeenCalled();
+
+    vi.advanceTimersByTime(16);
+    expect(res.write).toHaveBeenCalledTimes(1);
+    expect(written(res)).toBe('event: text_delta\ndata: {"text":"Hello world"}\n\n');
+  });
+
+  it('only merges tool call deltas for the same tool call', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+    const delta = (toolCallId: string, input: string): StreamEvent => ({
+      type: 'tool_call_delta',
+      data: { toolCallId, toolName: 'Write', input, status: 'running' },
+    });
+
+    writer.send(delta('t1', '{"a"'));
+    writer.send(delta('t1', ':1}'));
+    writer.send(delta('t2', '{}'));
+    writer.flush();
+
+    expect(res.write).toHaveBeenCalledTimes(1);
+    const inputs = written(res)
+      .split('\n')
+      .filter(line => line.startsWith('data: '))
+      .map(line => JSON.parse(line.slice(6)).input);
+    expect(inputs).toEqual(['{"a":1}', '{}']);
+  });
+
+  it('flushes pending deltas together with the next non-delta event, in order', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    writer.send({ type: 'text_delta', data: { text: 'a' } });
+    writer.send({ type: 'text_delta', data: { text: 'b' } });
+    writer.send({ type: 'done', data: { sessionId: 's1' } });
+
+    expect(res.write).toHaveBeenCalledTimes(1);
+    expect(written(res)).toBe(
+      'event: text_delta\ndata: {"text":"ab"}\n\n' +
+      'event: done\ndata: {"sessionId":"s1"}\n\n'
+    );
+  });
+
+  it('writes early once the byte window is full', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res, { maxBytes: 10 });
+
+    writer.send({ type: 'text_delta', data: { text: '12345' } });
+    expect(res.write).not.toHaveBeenCalled();
+    writer.send({ type: 'text_delta', data: { text: '67890' } });
+    expect(res.write).toHaveBeenCalledTimes(1);
+  });
+
+  it('counts the byte window in UTF-8 bytes, not characters', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res, { maxBytes: 10 });
+
+    // Four UTF-16 code units, ten bytes
+    writer.send({ type: 'text_delta', data: { text: '😀€€' } });
+    expect(res.write).toHaveBeenCalledTimes(1);
+    expect(writer.metrics.bytesOut).toBe(Buffer.byteLength(written(res)));
+  });
+
+  it('waits for drain when the response buffer is full', async () => {
+    const res = createStreamingResponse();
+    res.write.mockReturnValueOnce(false);
+    res.writableLength = 65536;
+    const writer = new SSEEventWriter(res);
+
+    let resolved = false;
+    writer.send({ type: 'tool_call_start', data: { toolCallId: 't1', toolName: 'Read', status: 'running' } })
+      .then(() => { resolved = true; });
+
+    await Promise.resolve();
+    expect(resolved).toBe(false);
+
+    res.emit('drain');
+    await Promise.resolve();
+    expect(resolved).toBe(true);
+    expect(writer.metrics.drainWaits).toBe(1);
+    expect(writer.metrics.maxBufferedBytes).toBe(65536);
+  });
+
+  it('stops writing once the client disconnects', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    writer.send({ type: 'text_delta', data: { text: 'a' } });
+    res.emit('close');
+    writer.send({ type: 'done', data: { sessionId: 's1' } });
+    vi.advanceTimersByTime(16);
+
+    expect(res.write).not.toHaveBeenCalled();
+  });
+
+  it('reports metrics and ends the response', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    for (let i = 0; i < 100; i++) {
+      writer.send({ type: 'text_delta', data: { text: 'x' } });
+    }
+    writer.send({ type: 'done', data: { sessionId: 's1' } });
+    const metrics = writer.end();
+
+    expect(res.end).toHaveBeenCalled();
+    expect(metrics).toMatchObject({ eventsIn: 101, eventsOut: 2, framesOut: 1 });
+    expect(metrics.bytesOut).toBe(Buffer.byteLength(written(res)));
+  });
+
+  it('measures the event rate from the first frame, not from the request start', () => {
+    const now = vi.spyOn(performance, 'now').mockReturnValue(1000);
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    // Queueing and time to first token happen before anything is written
+    now.mockReturnValue(5000);
+    writer.send({ type: 'tool_call_start', data: { toolCallId: 't1', toolName: 'Read' } });
+    for (let i = 0; i < 9; i++) {
+      writer.send({ type: 'text_delta', data: { text: 'x' } });
+    }
+    now.mockReturnValue(5500);
+    const metrics = writer.end();
+
+    expect(metrics).toMatchObject({ firstFrameAt: 5000, endedAt: 5500 });
+    expect(sseEventsPerSecond(metrics)).toBe(20);
+  });
+
+  it('ends the rate window when the client disconnects', () => {
+    const now = vi.spyOn(performance, 'now').mockReturnValue(1000);
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    writer.send({ type: 'done', data: { sessionId: 's1' } });
+    now.mockReturnValue(1250);
+    res.emit('close');
+    now.mockReturnValue(9000);
+    const metrics = writer.end();
+
+    expect(metrics.endedAt).toBe(1250);
+    expect(sseEventsPerSecond(metrics)).toBe(4);
+  });
+
+  it('reports no rate for a stream that wrote nothing', () => {
+    const res = createStreamingResponse();
+    const writer = new SSEEventWriter(res);
+
+    expect(sseEventsPerSecond(writer.end())).toBeNull();
+  });
+});
+
+describe('CoalescingSSEWriter', () => {
+  const keyOf = (event: any) => event.data.id ?? event.data.sessionId;
+  const session = (id: string, title: string) => ({
+    type: 'session_updated' as const,
+    data: { id, title, createdAt: '', updatedAt: '', permissionMode: 'default' as const },
+  });
+
+  it('writes events straight through while the client keeps up', () => {
+    const res = createStreamingResponse();
+    const writer = new CoalescingSSEWriter(res, keyOf);
+
+    writer.send(session('a', 'one'));
+    writer.send(session('b', 'two'));
+
+    expect(res.write).toHaveBeenCalledTimes(2);
+  });
+
+  it('coalesces events by key while waiting for drain', () => {
+    const res = createStreamingResponse();
+    res.write.mockReturnValueOnce(false);
+    const writer = new CoalescingSSEWriter(res, keyOf);
+
+    writer.send(session('a', 'first'));
+    writer.send(session('a', 'second'));
+    writer.send(session('b', 'other'));
+    writer.send(session('a', 'latest'));
+    writer.comment('keep-alive');
+    expect(res.write).toHaveBeenCalledTimes(1);
+
+    res.emit('drain');
+
+    expect(res.write).toHaveBeenCalledTimes(2);
+    const frame = res.write.mock.calls[1][0] as string;
+    expect(frame).not.toContain('second');
+    expect(frame.indexOf('"other"')).toBeLessThan(frame.indexOf('"latest"'));
+  });
+
+  it('drops pending events when the client disconnects', () => {
+    const res = createStreamingResponse();
+    res.write.mockReturnValueOnce(false);
+    const writer = new CoalescingSSEWriter(res, keyOf);
+
+    writer.send(session('a', 'first'));
+    writer.send(session('b', 'pending'));
+    res.emit('close');
+    res.emit('drain');
+    writer.send(session('c', 'late'));
+
+    expect(res.write).toHaveBeenCalledTimes(1);
+  });
+});
@@ -2,8 +2,36 @@ import { describe, it, expect, beforeEach, vi } from 'vitest';
 
 vi.mock('fs/promises');
 
+// In-memory stand-in for the persistent index (its own disk I/O is tested separately)
+vi.mock('../../services/session-index', () => ({
+  SessionIndex: class {
+    private entries = new Map<string, unknown>();
+    load = async () => {};
+    save = async () => {};
+    get = (file: string) => this.entries.get(file);
+    set = (file: string, entry: unknown) => { this.entries.set(file, entry); };
+    prune = () => {};
+  },
+}));
+
 import fs from 'fs/promises';
 
+/**
+ * Fake FileHandle serving `content`, for code that streams files via fs.open().
+ */
+function fileHandle(content: string) {
+  const bytes = Buffer.from(content);
+  return {
+    read: vi.fn(async (buf: Buffer, offset: number, length: number, position: number) => {
+      const bytesRead = position >= bytes.length
+        ? 0
+        : bytes.copy(buf, offset, position, Math.min(position + length, bytes.length));
+      return { bytesRead, buffer: buf };
+    }),
+    close: vi.fn(),
+  };
+}
+
 describe('TranscriptReader', () => {
   let transcriptReader: typeof import('../../services/transcript-reader').transcriptReader;
 
@@ -33,7 +61,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 'session-123');
 
@@ -66,7 +94,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 'session-456');
 
@@ -95,7 +123,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 'session-789');
 
@@ -115,7 +143,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 's1');
 
@@ -135,7 +163,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 's1');
 
@@ -143,7 +171,7 @@ describe('TranscriptReader', () => {
     });
 
     it('returns empty array when file does not exist', async () => {
-      (fs.readFile as ReturnType<typeof vi.fn>).mockRejectedValue(
+      (fs.open as ReturnType<typeof vi.fn>).mockRejectedValue(
         new Error('ENOENT')
       );
 
@@ -167,7 +195,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 's1');
 
@@ -187,7 +215,7 @@ describe('TranscriptReader', () => {
         }),
       ].join('\n');
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(lines);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
 
       const messages = await transcriptReader.readTranscript('/vault', 's1');
 
@@ -195,6 +223,73 @@ describe('TranscriptReader', () => {
     });
   });
 
+  describe('readTranscriptPage()', () => {
+    const lines = ['first', 'second', 'third', 'fourth', 'fifth']
+      .map((text, i) => JSON.stringify({
+        type: 'user',
+        uuid: `u${i + 1}`,
+        message: { role: 'user', content: text },
+      }))
+      .join('\n') + '\n';
+
+    beforeEach(() => {
+      (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue({
+        size: Buffer.byteLength(lines),
+        mtimeMs: 1000,
+      });
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(lines));
+    });
+
+    it('returns the newest page first', async () => {
+      const page = await transcriptReader.readTranscriptPage('/vault', 's1', { limit: 2 });
+
+      expect(page.messages.map(m => m.content)).toEqual(['fourth', 'fifth']);
+      expect(page.nextCursor).not.toBeNull();
+    });
+
+    it('pages backwards with the before cursor', async () => {
+      const first = await transcriptReader.readTranscriptPage('/vault', 's1', { limit: 2 });
+      const second = await transcriptReader.readTranscriptPage('/vault', 's1', {
+        limit: 2,
+        before: first.nextCursor!,
+      });
+      const third = await transcriptReader.readTranscriptPage('/vault', 's1', {
+        limit: 2,
+        before: second.nextCursor!,
+      });
+
+      expect(second.messages.map(m => m.content)).toEqual(['second', 'third']);
+      expect(third.messages.map(m => m.content)).toEqual(['first']);
+      expect(third.nextCursor).toBeNull();
+    });
+
+    it('skips non-message lines when counting the page', async () => {
+      const mixed = [
+        JSON.stringify({ type: 'progress', uuid: 'p1' }),
+        JSON.stringify({ type: 'user', uuid: 'u1', message: { role: 'user', content: 'Hi' } }),
+        JSON.stringify({ type: 'summary', uuid: 's1' }),
+      ].join('\n');
+      (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue({
+        size: Buffer.byteLength(mixed),
+        mtimeMs: 1000,
+      });
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(mixed));
+
+      const page = await transcriptReader.readTranscriptPage('/vault', 's1', { limit: 10 });
+
+      expect(page.messages).toEqual([{ id: 'u1', role: 'user', content: 'Hi' }]);
+      expect(page.nextCursor).toBeNull();
+    });
+
+    it('returns an empty page when the file does not exist', async () => {
+      (fs.stat as ReturnType<typeof vi.fn>).mockRejectedValue(new Error('ENOENT'));
+
+      const page = await transcriptReader.readTranscriptPage('/vault', 'missing', { limit: 10 });
+
+      expect(page).toEqual({ messages: [], nextCursor: null });
+    });
+  });
+
   describe('listSessions()', () => {
     it('returns session metadata from JSONL files', async () => {
       (fs.readdir as ReturnType<typeof vi.fn>).mockResolvedValue([
@@ -209,8 +304,8 @@ describe('TranscriptReader', () => {
       (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue(statResult);
 
       // First file: has user message
-      (fs.readFile as ReturnType<typeof vi.fn>)
-        .mockResolvedValueOnce(
+      (fs.open as ReturnType<typeof vi.fn>)
+        .mockResolvedValueOnce(fileHandle(
           [
             JSON.stringify({
               type: 'system',
@@ -225,16 +320,16 @@ describe('TranscriptReader', () => {
               timestamp: '2024-01-01T00:00:01Z',
             }),
           ].join('\n')
-        )
+        ))
         // Second file: no user message
-        .mockResolvedValueOnce(
+        .mockResolvedValueOnce(fileHandle(
           JSON.stringify({
             type: 'system',
             subtype: 'init',
             permissionMode: 'bypassPermissions',
             timestamp: '2024-01-01T10:00:00Z',
           })
-        );
+        ));
 
       const sessions = await transcriptReader.listSessions('/vault');
 
@@ -274,13 +369,13 @@ describe('TranscriptReader', () => {
         mtime: new Date('2024-01-02'),
       };
       (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue(statResult);
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(
         JSON.stringify({
           type: 'system',
           subtype: 'init',
           timestamp: '2024-01-01T00:00:00Z',
         })
-      );
+      ));
 
       const sessions = await transcriptReader.listSessions('/vault');
 
@@ -304,13 +399,13 @@ describe('TranscriptReader', () => {
         .mockResolvedValueOnce(statResult)
         .mockRejectedValueOnce(new Error('EACCES'));
 
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValueOnce(
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValueOnce(fileHandle(
         JSON.stringify({
           type: 'user',
           uuid: 'u1',
           message: { role: 'user', content: 'Hello' },
         })
-      );
+      ));
 
       const sessions = await transcriptReader.listSessions('/vault');
 
@@ -328,13 +423,13 @@ describe('TranscriptReader', () => {
       (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue(statResult);
 
       const longMessage = 'A'.repeat(100);
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(
         JSON.stringify({
           type: 'user',
           uuid: 'u1',
           message: { role: 'user', content: longMessage },
         })
-      );
+      ));
 
       const sessions = await transcriptReader.listSessions('/vault');
 
@@ -343,6 +438,103 @@ describe('TranscriptReader', () => {
     });
   });
 
+  describe('listSessions() indexing', () => {
+    const userLine = (content: string) =>
+      JSON.stringify({ type: 'user', message: { role: 'user', content } }) + '\n';
+
+    function makeStat(content: string, mtimeMs: number) {
+      return {
+        size: Buffer.byteLength(content),
+        mtimeMs,
+        birthtime: new Date('2024-01-01'),
+        mtime: new Date(mtimeMs),
+      };
+    }
+
+    it('does not re-read unchanged files', async () => {
+      const content = userLine('First');
+      (fs.readdir as ReturnType<typeof vi.fn>).mockResolvedValue(['abc.jsonl']);
+      (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue(makeStat(content, 1000));
+      const handle = fileHandle(content);
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(handle);
+
+      await transcriptReader.listSessions('/vault');
+      const readsAfterFirstList = handle.read.mock.calls.length;
+      const sessions = await transcriptReader.listSessions('/vault');
+
+      expect(sessions[0].title).toBe('First');
+      expect(handle.read).toHaveBeenCalledTimes(readsAfterFirstList);
+    });
+
+    it('parses only appended bytes when a file grows', async () => {
+      const initial = userLine('First');
+      const appended = userLine('Second');
+      (fs.readdir as ReturnType<typeof vi.fn>).mockResolvedValue(['abc.jsonl']);
+      (fs.stat as ReturnType<typeof vi.fn>)
+        .mockResolvedValueOnce(makeStat(initial, 1000))
+        .mockResolvedValueOnce(makeStat(initial + appended, 2000));
+      const grown = fileHandle(initial + appended);
+      (fs.open as ReturnType<typeof vi.fn>)
+        .mockResolvedValueOnce(fileHandle(initial))
+        .mockResolvedValueOnce(grown);
+
+      await transcriptReader.listSessions('/vault');
+      const sessions = await transcriptReader.listSessions('/vault');
+
+      expect(grown.read.mock.calls[0][3]).toBe(Buffer.byteLength(initial));
+      expect(sessions[0].title).toBe('First');
+      expect(sessions[0].lastMessagePreview).toBe('Second');
+    });
+
+    it('re-parses a file in full when it shrinks', async () => {
+      const initial = userLine('First') + userLine('Second');
+      const rewritten = userLine('Other');
+      (fs.readdir as ReturnType<typeof vi.fn>).mockResolvedValue(['abc.jsonl']);
+      (fs.stat as ReturnType<typeof vi.fn>)
+        .mockResolvedValueOnce(makeStat(initial, 1000))
+        .mockResolvedValueOnce(makeStat(rewritten, 2000));
+      const shrunk = fileHandle(rewritten);
+      (fs.open as ReturnType<typeof vi.fn>)
+        .mockResolvedValueOnce(fileHandle(initial))
+        .mockResolvedValueOnce(shrunk);
+
+      await transcriptReader.listSessions('/vault');
+      const sessions = await transcriptReader.listSessions('/vault');
+
+      expect(shrunk.read.mock.calls[0][3]).toBe(0);
+      expect(sessions[0].title).toBe('Other');
+    });
+  });
+
+  describe('listSessionsPage()', () => {
+    it('pages through sessions with a cursor', async () => {
+      (fs.readdir as ReturnType<typeof vi.fn>).mockResolvedValue([
+        'a.jsonl',
+        'b.jsonl',
+        'c.jsonl',
+      ]);
+      (fs.stat as ReturnType<typeof vi.fn>)
+        .mockResolvedValueOnce({ birthtime: new Date('2024-01-01'), mtime: new Date('2024-01-01') })
+        .mockResolvedValueOnce({ birthtime: new Date('2024-01-01'), mtime: new Date('2024-01-03') })
+        .mockResolvedValueOnce({ birthtime: new Date('2024-01-01'), mtime: new Date('2024-01-02') })
+        .mockResolvedValueOnce({ birthtime: new Date('2024-01-01'), mtime: new Date('2024-01-01') })
+        .mockResolvedValueOnce({ birthtime: new Date('2024-01-01'), mtime: new Date('2024-01-03') })
+        .mockResolvedValueOnce({ birthtime: new Date('2024-01-01'), mtime: new Date('2024-01-02') });
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(''));
+
+      const first = await transcriptReader.listSessionsPage('/vault', { limit: 2 });
+      expect(first.sessions.map(s => s.id)).toEqual(['b', 'c']);
+      expect(first.nextCursor).not.toBeNull();
+
+      const second = await transcriptReader.listSessionsPage('/vault', {
+        limit: 2,
+        cursor: first.nextCursor!,
+      });
+      expect(second.sessions.map(s => s.id)).toEqual(['a']);
+      expect(second.nextCursor).toBeNull();
+    });
+  });
+
   describe('getSession()', () => {
     it('returns session metadata when file exists', async () => {
       const statResult = {
@@ -350,14 +542,14 @@ describe('TranscriptReader', () => {
         mtime: new Date('2024-01-02'),
       };
       (fs.stat as ReturnType<typeof vi.fn>).mockResolvedValue(statResult);
-      (fs.readFile as ReturnType<typeof vi.fn>).mockResolvedValue(
+      (fs.open as ReturnType<typeof vi.fn>).mockResolvedValue(fileHandle(
         JSON.stringify({
           type: 'user',
           uuid: 'u1',
           message: { role: 'user', content: 'Hello world' },
           timestamp: '2024-01-01T00:00:00Z',
         })
-      );
+      ));
 
       const session = await transcriptReader.getSession('/vault', 'abc-123');
 
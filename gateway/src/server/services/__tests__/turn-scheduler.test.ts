@@ -0,0 +1,56 @@
+import { describe, it, expect } from 'vitest';
+import { TurnScheduler } from '../../services/turn-scheduler';
+
+describe('TurnScheduler', () => {
+  it('runs up to the limit at once and queues the rest in order', async () => {
+    const scheduler = new TurnScheduler(2);
+    const started: string[] = [];
+
+    const a = scheduler.acquire('a').then(release => { started.push('a'); return release; });
+    const b = scheduler.acquire('b').then(release => { started.push('b'); return release; });
+    const c = scheduler.acquire('c').then(release => { started.push('c'); return release; });
+    const d = scheduler.acquire('d').then(release => { started.push('d'); return release; });
+
+    const releaseA = await a;
+    await b;
+    expect(started).toEqual(['a', 'b']);
+    expect(scheduler.activeCount).toBe(2);
+    expect(scheduler.queuedCount).toBe(2);
+
+    releaseA();
+    await c;
+    expect(started).toEqual(['a', 'b', 'c']);
+    expect(scheduler.queuedCount).toBe(1);
+    void d;
+  });
+
+  it('runs turns for the same key one at a time without blocking other keys', async () => {
+    const scheduler = new TurnScheduler(2);
+    const started: string[] = [];
+
+    const releaseFirst = await scheduler.acquire('s1');
+    const second = scheduler.acquire('s1').then(release => { started.push('s1'); return release; });
+    const other = scheduler.acquire('s2').then(release => { started.push('s2'); return release; });
+
+    await other;
+    expect(started).toEqual(['s2']);
+
+    releaseFirst();
+    await second;
+    expect(started).toEqual(['s2', 's1']);
+  });
+
+  it('ignores repeated release calls', async () => {
+    const scheduler = new TurnScheduler(1);
+    const release = await scheduler.acquire('a');
+    const next = scheduler.acquire('b');
+
+    release();
+    const releaseB = await next;
+    release();
+    expect(scheduler.activeCount).toBe(1);
+
+    releaseB();
+    expect(scheduler.activeCount).toBe(0);
+  });
+});
@@ -1,22 +1,94 @@
 import path from 'path';
 import { fileURLToPath } from 'url';
-import { query, type Options, type SDKMessage } from '@anthropic-ai/claude-agent-sdk';
+import {
+  query,
+  type Options,
+  type Query,
+  type SDKMessage,
+  type SDKUserMessage,
+} from '@anthropic-ai/claude-agent-sdk';
 import type { StreamEvent } from '../../shared/types';
+import { TurnScheduler } from './turn-scheduler';
+import { metrics } from './metrics';
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
+/** Live SDK queries kept around between turns, least recently used evicted first. */
+const MAX_WARM_QUERIES = 4;
+/** Agent turns allowed to run at once across all sessions. */
+const MAX_CONCURRENT_TURNS = 4;
+/** Close a warm query's agent process after this long without a turn. */
+const WARM_IDLE_MS = 10 * 60 * 1000; // 10 minutes
+
 interface AgentSession {
   sdkSessionId: string;
   lastActivity: number;
   permissionMode: 'default' | 'dangerously-skip';
+  expiryTimer?: ReturnType<typeof setTimeout>;
   pendingApproval?: {
     toolCallId: string;
     resolve: (approved: boolean) => void;
   };
 }
 
+/**
+ * Streaming-input prompt for a long-lived query: each turn pushes one user
+ * message, and closing the queue lets the agent process exit.
+ */
+class PromptQueue implements AsyncIterable<SDKUserMessage> {
+  private items: SDKUserMessage[] = [];
+  private waiting: ((result: IteratorResult<SDKUserMessage>) => void) | null = null;
+  private closed = false;
+
+  push(item: SDKUserMessage): void {
+    if (this.closed) return;
+    if (this.waiting) {
+      const resolve = this.waiting;
+      this.waiting = null;
+      resolve({ value: item, done: false });
+    } else {
+      this.items.push(item);
+    }
+  }
+
+  close(): void {
+    this.closed = true;
+    this.waiting?.({ value: undefined, done: true });
+    this.waiting = null;
+  }
+
+  [Symbol.asyncIterator](): AsyncIterator<SDKUserMessage> {
+    return {
+      next: () => {
+        if (this.items.length > 0) {
+          return Promise.resolve({ value: this.items.shift()!, done: false });
+        }
+        if (this.closed) {
+          return Promise.resolve({ value: undefined, done: true });
+        }
+        return new Promise(resolve => {
+          this.waiting = resolve;
+        });
+      },
+    };
+  }
+}
+
+interface WarmQuery {
+  query: Query;
+  input: PromptQueue;
+  /** Stops the agent process mid-turn; closing the input only ends it between turns. */
+  abort: AbortController;
+  busy: boolean;
+  turns: number;
+  idleTimer: ReturnType<typeof setTimeout> | null;
+}
+
 class AgentManager {
   private sessions = new Map<string, AgentSession>();
+  /** Warm queries by session ID, in least-recently-used order. */
+  private warmQueries = new Map<string, WarmQuery>();
+  private scheduler = new TurnScheduler(MAX_CONCURRENT_TURNS);
   private readonly SESSION_TIMEOUT_MS = 30 * 60 * 1000; // 30 minutes
 
   /**
@@ -28,18 +100,27 @@ class AgentManager {
     permissionMode: 'default' | 'dangerously-skip';
   }): void {
     if (!this.sessions.has(sessionId)) {
-      this.sessions.set(sessionId, {
+      const session: AgentSession = {
         sdkSessionId: sessionId,
         lastActivity: Date.now(),
         permissionMode: opts.permissionMode,
-      });
+      };
+      this.sessions.set(sessionId, session);
+      this.touch(sessionId, session);
     }
   }
 
+  /**
+   * Run one turn. Follow-up turns reuse the session's warm query, so only
+   * the first turn pays for agent startup, settings loading and resume.
+   * Turns wait for a slot in the global scheduler before starting.
+   * Aborting `opts.signal` (e.g. the client disconnected) stops the agent
+   * mid-turn and frees the turn's scheduler slot.
+   */
   async *sendMessage(
     sessionId: string,
     content: string,
-    opts?: { permissionMode?: 'default' | 'dangerously-skip' }
+    opts?: { permissionMode?: 'default' | 'dangerously-skip'; signal?: AbortSignal }
   ): AsyncGenerator<StreamEvent> {
     // Auto-create session if it doesn't exist (for resuming SDK sessions)
     if (!this.sessions.has(sessionId)) {
@@ -49,33 +130,46 @@ class AgentManager {
     }
 
     const session = this.sessions.get(sessionId)!;
-    session.lastActivity = Date.now();
-
-    const vaultRoot = path.resolve(__dirname, '../../../../');
+    this.touch(sessionId, session);
 
-    const sdkOptions: Options = {
-      cwd: vaultRoot,
-      includePartialMessages: true,
-      settingSources: ['project', 'user'],
-      resume: sessionId,
-    };
+    // Timings include queueing for a scheduler slot, which the user also waits on
+    const started = performance.now();
+    let firstTokenAt: number | null = null;
 
-    if (session.permissionMode === 'dangerously-skip') {
-      sdkOptions.permissionMode = 'bypassPermissions';
-      sdkOptions.allowDangerouslySkipPermissions = true;
-    } else {
-      sdkOptions.permissionMode = 'acceptEdits';
+    const release = await this.scheduler.acquire(sessionId);
+    if (opts?.signal?.aborted) {
+      release();
+      return;
     }
 
-    const agentQuery = query({ prompt: content, options: sdkOptions });
-
+    let warm: WarmQuery | undefined;
+    let turnComplete = false;
     let inTool = false;
     let currentToolName = '';
     let currentToolId = '';
     let emittedDone = false;
+    const onAbort = () => {
+      if (warm) this.closeQuery(sessionId, warm);
+    };
+    opts?.signal?.addEventListener('abort', onAbort, { once: true });
 
     try {
-      for await (const message of agentQuery) {
+      warm = this.startTurn(sessionId, session, content);
+      let receivedMessage = false;
+
+      while (!opts?.signal?.aborted) {
+        const { value: message, done } = await warm.query.next();
+        if (done) {
+          // A reused query whose agent process exited while idle - retry once on a fresh one
+          if (!receivedMessage && warm.turns > 1) {
+            this.closeQuery(sessionId, warm);
+            warm = this.startTurn(sessionId, session, content);
+            continue;
+          }
+          break;
+        }
+        receivedMessage = true;
+
         for await (const event of this.mapSdkMessage(message, session, sessionId, {
           inTool,
           currentToolName,
@@ -87,19 +181,41 @@ class AgentManager {
           },
         })) {
           if (event.type === 'done') emittedDone = true;
+          if (firstTokenAt === null && (event.type === 'text_delta' || event.type === 'tool_call_start')) {
+            firstTokenAt = performance.now();
+            metrics.observe('agent_ttft_ms', firstTokenAt - started);
+          }
           yield event;
         }
+
+        if (message.type === 'result') {
+          turnComplete = true;
+          this.recordTurn(message, started, firstTokenAt);
+          break;
+        }
       }
     } catch (err) {
-      yield {
-        type: 'error',
-        data: {
-          message: err instanceof Error ? err.message : 'SDK error',
-        },
-      };
+      // After an abort the query rejects on purpose and nobody is listening
+      if (!opts?.signal?.aborted) {
+        yield {
+          type: 'error',
+          data: {
+            message: err instanceof Error ? err.message : 'SDK error',
+          },
+        };
+      }
+    } finally {
+      opts?.signal?.removeEventListener('abort', onAbort);
+      // Only a query that finished its turn cleanly can take the next one
+      if (warm) {
+        if (turnComplete) this.checkinQuery(sessionId, warm);
+        else this.closeQuery(sessionId, warm);
+      }
+      this.touch(sessionId, session);
+      release();
     }
 
-    if (!emittedDone) {
+    if (!emittedDone && !opts?.signal?.aborted) {
       yield {
         type: 'done',
         data: { sessionId },
@@ -107,6 +223,156 @@ class AgentManager {
     }
   }
 
+  /**
+   * Close every warm query so agent processes exit with the server.
+   */
+  shutdown(): void {
+    for (const [sessionId, warm] of this.warmQueries) {
+      this.closeQuery(sessionId, warm);
+    }
+    for (const session of this.sessions.values()) {
+      if (session.expiryTimer) clearTimeout(session.expiryTimer);
+    }
+    this.sessions.clear();
+  }
+
+  getPoolStats(): { warm: number; busy: number; activeTurns: number; queuedTurns: number } {
+    let busy = 0;
+    for (const warm of this.warmQueries.values()) {
+      if (warm.busy) busy++;
+    }
+    return {
+      warm: this.warmQueries.size,
+      busy,
+      activeTurns: this.scheduler.activeCount,
+      queuedTurns: this.scheduler.queuedCount,
+    };
+  }
+
+  /**
+   * Record turn duration and output token rate once the SDK reports the result.
+   */
+  private recordTurn(result: SDKMessage, started: number, firstTokenAt: number | null): void {
+    const now = performance.now();
+    metrics.observe('agent_turn_duration_ms', now - started);
+
+    const outputTokens = (result as { usage?: { output_tokens?: number } }).usage?.output_tokens;
+    const streamingSeconds = firstTokenAt !== null ? (now - firstTokenAt) / 1000 : 0;
+    if (outputTokens && streamingSeconds > 0) {
+      metrics.observe('agent_output_tokens_per_second', outputTokens / streamingSeconds);
+    }
+  }
+
+  private buildOptions(session: AgentSession, abortController: AbortController): Options {
+    const vaultRoot = path.resolve(__dirname, '../../../../');
+
+    const sdkOptions: Options = {
+      cwd: vaultRoot,
+      includePartialMessages: true,
+      settingSources: ['project', 'user'],
+      resume: session.sdkSessionId,
+      abortController,
+    };
+
+    if (session.permissionMode === 'dangerously-skip') {
+      sdkOptions.permissionMode = 'bypassPermissions';
+      sdkOptions.allowDangerouslySkipPermissions = true;
+    } else {
+      sdkOptions.permissionMode = 'acceptEdits';
+    }
+
+    return sdkOptions;
+  }
+
+  private startTurn(sessionId: string, session: AgentSession, content: string): WarmQuery {
+    const warm = this.checkoutQuery(sessionId, session);
+    warm.turns++;
+    warm.input.push({
+      type: 'user',
+      message: { role: 'user', content },
+      parent_tool_use_id: null,
+      session_id: session.sdkSessionId,
+    });
+    return warm;
+  }
+
+  /**
+   * Take the session's warm query, or start one, evicting least recently
+   * used idle queries to stay within MAX_WARM_QUERIES.
+   */
+  private checkoutQuery(sessionId: string, session: AgentSession): WarmQuery {
+    const existing = this.warmQueries.get(sessionId);
+    if (existing) {
+      if (existing.idleTimer) clearTimeout(existing.idleTimer);
+      existing.idleTimer = null;
+      existing.busy = true;
+      this.warmQueries.delete(sessionId);
+      this.warmQueries.set(sessionId, existing);
+      return existing;
+    }
+
+    for (const [id, warm] of this.warmQueries) {
+      if (this.warmQueries.size < MAX_WARM_QUERIES) break;
+      if (!warm.busy) this.closeQuery(id, warm);
+    }
+
+    const input = new PromptQueue();
+    const abort = new AbortController();
+    const warm: WarmQuery = {
+      query: query({ prompt: input, options: this.buildOptions(session, abort) }),
+      input,
+      abort,
+      busy: true,
+      turns: 0,
+      idleTimer: null,
+    };
+    this.warmQueries.set(sessionId, warm);
+    return warm;
+  }
+
+  private checkinQuery(sessionId: string, warm: WarmQuery): void {
+    warm.busy = false;
+    warm.idleTimer = setTimeout(() => this.closeQuery(sessionId, warm), WARM_IDLE_MS);
+    warm.idleTimer.unref?.();
+  }
+
+  private closeQuery(sessionId: string, warm: WarmQuery): void {
+    if (this.warmQueries.get(sessionId) === warm) {
+      this.warmQueries.delete(sessionId);
+    }
+    if (warm.idleTimer) clearTimeout(warm.idleTimer);
+    warm.idleTimer = null;
+    // A query closed mid-turn would otherwise keep running tools until the turn ends
+    if (warm.busy) warm.abort.abort();
+    warm.input.close();
+    warm.query.return(undefined).catch(() => {
+      // Already finished or failed - nothing left to clean up
+    });
+  }
+
+  /**
+   * Record activity and push back the session's expiry.
+   */
+  private touch(sessionId: string, session: AgentSession): void {
+    session.lastActivity = Date.now();
+    if (session.expiryTimer) clearTimeout(session.expiryTimer);
+    session.expiryTimer = setTimeout(() => this.expireSession(sessionId), this.SESSION_TIMEOUT_MS);
+    session.expiryTimer.unref?.();
+  }
+
+  private expireSession(sessionId: string): void {
+    const session = this.sessions.get(sessionId);
+    if (!session) return;
+
+    const warm = this.warmQueries.get(sessionId);
+    if (warm?.busy) {
+      this.touch(sessionId, session);
+      return;
+    }
+    if (warm) this.closeQuery(sessionId, warm);
+    this.sessions.delete(sessionId);
+  }
+
   private async *mapSdkMessage(
     message: SDKMessage,
     session: AgentSession,
@@ -204,15 +470,6 @@ class AgentManager {
     return true;
   }
 
-  checkSessionHealth(): void {
-    const now = Date.now();
-    for (const [id, session] of this.sessions) {
-      if (now - session.lastActivity > this.SESSION_TIMEOUT_MS) {
-        this.sessions.delete(id);
-      }
-    }
-  }
-
   hasSession(sessionId: string): boolean {
     return this.sessions.has(sessionId);
   }
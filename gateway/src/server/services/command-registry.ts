@@ -1,70 +1,214 @@
+import { watch, type FSWatcher } from 'fs';
 import fs from 'fs/promises';
 import path from 'path';
+import crypto from 'crypto';
 import matter from 'gray-matter';
 import type { CommandEntry, CommandRegistry } from '../../shared/types.js';
 
+/** Parsed command file, reused while the file is unchanged. */
+interface CachedCommand {
+  mtimeMs: number;
+  size: number;
+  hash: string;
+  entry: CommandEntry;
+}
+
+/** Delay before re-checking a commands directory that is missing or unwatchable. */
+const RETRY_MS = 30_000;
+
+function hashContent(content: string): string {
+  return crypto.createHash('sha1').update(content).digest('hex');
+}
+
 class CommandRegistryService {
   private cache: CommandRegistry | null = null;
+  private stale = true;
+  /** Bumped on every invalidation so a scan racing a change isn't trusted. */
+  private version = 0;
+  private etag = '';
+  private files = new Map<string, CachedCommand>();
+  private scanning: Promise<CommandRegistry> | null = null;
+  private watcher: FSWatcher | null = null;
+  private retryTimer: ReturnType<typeof setTimeout> | null = null;
+  /** Whether the last scan couldn't read the directory, so the warning is logged once. */
+  private readFailed = false;
   private readonly commandsDir: string;
 
   constructor(vaultRoot: string) {
     this.commandsDir = path.join(vaultRoot, '.claude', 'commands');
   }
 
+  /**
+   * Return the registry, rescanning only if a watched file changed since
+   * the last scan (or when forced). Rescans re-parse only files whose
+   * mtime/size and content hash changed.
+   */
   async getCommands(forceRefresh = false): Promise<CommandRegistry> {
-    if (this.cache && !forceRefresh) return this.cache;
+    if (this.cache && !this.stale && !forceRefresh) return this.cache;
+    if (!this.scanning) {
+      this.scanning = this.scan().finally(() => {
+        this.scanning = null;
+      });
+    }
+    return this.scanning;
+  }
+
+  /**
+   * Strong validator for the current registry; stable across rescans that
+   * find no changes.
+   */
+  getEtag(): string {
+    return this.etag;
+  }
 
+  invalidateCache(): void {
+    this.stale = true;
+    this.version++;
+  }
+
+  close(): void {
+    this.watcher?.close();
+    this.watcher = null;
+    if (this.retryTimer) clearTimeout(this.retryTimer);
+    this.retryTimer = null;
+  }
+
+  private async scan(): Promise<CommandRegistry> {
+    this.ensureWatcher();
+    const version = this.version;
     const commands: CommandEntry[] = [];
+    const seen = new Set<string>();
+    let complete = true;
 
     try {
       const entries = await fs.readdir(this.commandsDir, {
         withFileTypes: true,
       });
 
-      for (const entry of entries) {
-        if (!entry.isDirectory()) continue;
+      const namespaces = await Promise.all(
+        entries
+          .filter(entry => entry.isDirectory())
+          .map(entry => this.scanNamespace(entry.name, seen))
+      );
+      for (const nsCommands of namespaces) commands.push(...nsCommands);
+    } catch (err) {
+      // Commands directory might not exist
+      complete = false;
+      if (!this.readFailed) {
+        console.warn('[CommandRegistry] Could not read commands directory:', (err as Error).message);
+      }
+    }
+    this.readFailed = !complete;
 
-        const nsPath = path.join(this.commandsDir, entry.name);
-        const files = await fs.readdir(nsPath);
+    for (const key of this.files.keys()) {
+      if (!seen.has(key)) this.files.delete(key);
+    }
 
-        for (const file of files) {
-          if (!file.endsWith('.md')) continue;
+    commands.sort((a, b) => a.fullCommand.localeCompare(b.fullCommand));
 
-          const filePath = path.join(nsPath, file);
+    const etag = `"${hashContent(JSON.stringify(commands))}"`;
+    // Keep the previous registry object when nothing changed
+    if (!this.cache || etag !== this.etag) {
+      this.cache = { commands, lastScanned: new Date().toISOString() };
+      this.etag = etag;
+    }
+    if (version === this.version) {
+      this.stale = false;
+      // Without a watcher nothing would ever invalidate the cache, so check again later
+      if (!complete || !this.watcher) this.scheduleRetry();
+    }
+    return this.cache;
+  }
+
+  private async scanNamespace(namespace: string, seen: Set<string>): Promise<CommandEntry[]> {
+    const nsPath = path.join(this.commandsDir, namespace);
+    let files: string[];
+    try {
+      files = await fs.readdir(nsPath);
+    } catch (err) {
+      console.warn(`[CommandRegistry] Skipping ${namespace}: ${(err as Error).message}`);
+      return [];
+    }
+
+    const results = await Promise.all(
+      files
+        .filter(file => file.endsWith('.md'))
+        .map(async file => {
+          const key = `${namespace}/${file}`;
+          seen.add(key);
           try {
-            const content = await fs.readFile(filePath, 'utf-8');
-            const { data: frontmatter } = matter(content);
-
-            const commandName = file.replace('.md', '');
-            commands.push({
-              namespace: entry.name,
-              command: commandName,
-              fullCommand: `/${entry.name}:${commandName}`,
-              description: frontmatter.description || '',
-              argumentHint: frontmatter['argument-hint'],
-              allowedTools: frontmatter['allowed-tools']
-                ?.split(',')
-                .map((t: string) => t.trim()),
-              filePath: path.relative(process.cwd(), filePath),
-            });
+            return await this.loadCommand(namespace, file, key);
           } catch (fileErr) {
-            console.warn(`[CommandRegistry] Skipping ${entry.name}/${file}: ${(fileErr as Error).message}`);
+            console.warn(`[CommandRegistry] Skipping ${key}: ${(fileErr as Error).message}`);
+            return null;
           }
-        }
-      }
-    } catch (err) {
-      // Commands directory might not exist
-      console.warn('[CommandRegistry] Could not read commands directory:', (err as Error).message);
+        })
+    );
+    return results.filter((entry): entry is CommandEntry => entry !== null);
+  }
+
+  private async loadCommand(namespace: string, file: string, key: string): Promise<CommandEntry> {
+    const filePath = path.join(this.commandsDir, namespace, file);
+    const stat = await fs.stat(filePath);
+    const cached = this.files.get(key);
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      return cached.entry;
     }
 
-    commands.sort((a, b) => a.fullCommand.localeCompare(b.fullCommand));
+    const content = await fs.readFile(filePath, 'utf-8');
+    const hash = hashContent(content);
+    if (cached && cached.hash === hash) {
+      // Touched but not edited - skip re-parsing
+      this.files.set(key, { ...cached, mtimeMs: stat.mtimeMs, size: stat.size });
+      return cached.entry;
+    }
 
-    this.cache = { commands, lastScanned: new Date().toISOString() };
-    return this.cache;
+    const { data: frontmatter } = matter(content);
+    const commandName = file.replace('.md', '');
+    const entry: CommandEntry = {
+      namespace,
+      command: commandName,
+      fullCommand: `/${namespace}:${commandName}`,
+      description: frontmatter.description || '',
+      argumentHint: frontmatter['argument-hint'],
+      allowedTools: frontmatter['allowed-tools']
+        ?.split(',')
+        .map((t: string) => t.trim()),
+      filePath: path.relative(process.cwd(), filePath),
+    };
+    this.files.set(key, { mtimeMs: stat.mtimeMs, size: stat.size, hash, entry });
+    return entry;
   }
 
-  invalidateCache(): void {
-    this.cache = null;
+  /**
+   * Watch the commands tree so edits invalidate the registry without a
+   * manual refresh. While watching fails, the cache expires every RETRY_MS
+   * so the next request rescans and retries the watch.
+   */
+  private ensureWatcher(): void {
+    if (this.watcher) return;
+    try {
+      this.watcher = watch(this.commandsDir, { recursive: true }, () => {
+        this.invalidateCache();
+      });
+      this.watcher.on('error', () => {
+        this.close();
+        this.invalidateCache();
+      });
+      this.watcher.unref?.();
+    } catch {
+      // Directory missing or recursive watch unsupported - scan() schedules a retry
+      this.watcher = null;
+    }
+  }
+
+  private scheduleRetry(): void {
+    if (this.retryTimer) return;
+    this.retryTimer = setTimeout(() => {
+      this.retryTimer = null;
+      this.invalidateCache();
+    }, RETRY_MS);
+    this.retryTimer.unref?.();
   }
 }
 
@@ -0,0 +1,251 @@
+import { monitorEventLoopDelay, type IntervalHistogram } from 'perf_hooks';
+
+/** Upper bounds for latency-style histograms, in milliseconds. */
+const LATENCY_BUCKETS_MS = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000];
+const RATE_BUCKETS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000];
+const HEAP_BUCKETS_MB = [32, 64, 128, 256, 512, 1024, 2048, 4096];
+/** How often event-loop lag and heap use are sampled into their histograms. */
+const RUNTIME_SAMPLE_MS = 10_000;
+/** Timer interval used to measure event-loop delay. */
+const LOOP_DELAY_RESOLUTION_MS = 20;
+const MB = 1024 * 1024;
+
+export interface HistogramSummary {
+  count: number;
+  sum: number;
+  min: number;
+  max: number;
+  mean: number;
+  p50: number;
+  p90: number;
+  p99: number;
+  /** Cumulative counts keyed by bucket upper bound, Prometheus-style. */
+  buckets: Record<string, number>;
+}
+
+export interface MetricSnapshot {
+  help: string;
+  unit: string;
+  /** One summary per label value; unlabelled observations are under "all". */
+  series: Record<string, HistogramSummary>;
+}
+
+export interface MetricsSnapshot {
+  uptime: number;
+  histograms: Record<string, MetricSnapshot>;
+  memory: {
+    heapUsedMb: number;
+    heapTotalMb: number;
+    rssMb: number;
+  };
+}
+
+interface MetricDefinition {
+  help: string;
+  unit: string;
+  buckets: number[];
+}
+
+function round(value: number): number {
+  return Math.round(value * 100) / 100;
+}
+
+/**
+ * Fixed-bucket histogram. Memory stays constant no matter how many values are
+ * observed; quantiles are interpolated within the bucket they fall in.
+ */
+class Histogram {
+  private counts: number[];
+  private count = 0;
+  private sum = 0;
+  private min = Infinity;
+  private max = -Infinity;
+
+  constructor(private bounds: number[]) {
+    // One extra bucket for values above the last bound
+    this.counts = new Array(bounds.length + 1).fill(0);
+  }
+
+  observe(value: number): void {
+    if (!Number.isFinite(value)) return;
+    let i = 0;
+    while (i < this.bounds.length && value > this.bounds[i]) i++;
+    this.counts[i]++;
+    this.count++;
+    this.sum += value;
+    if (value < this.min) this.min = value;
+    if (value > this.max) this.max = value;
+  }
+
+  quantile(q: number): number {
+    if (this.count === 0) return 0;
+    const rank = q * this.count;
+    let seen = 0;
+    for (let i = 0; i < this.counts.length; i++) {
+      if (this.counts[i] === 0) continue;
+      if (seen + this.counts[i] >= rank) {
+        const lower = Math.max(i === 0 ? this.min : this.bounds[i - 1], this.min);
+        const upper = Math.min(i < this.bounds.length ? this.bounds[i] : this.max, this.max);
+        const fraction = (rank - seen) / this.counts[i];
+        return lower + (upper - lower) * fraction;
+      }
+      seen += this.counts[i];
+    }
+    return this.max;
+  }
+
+  summary(): HistogramSummary {
+    const buckets: Record<string, number> = {};
+    let cumulative = 0;
+    this.bounds.forEach((bound, i) => {
+      cumulative += this.counts[i];
+      buckets[String(bound)] = cumulative;
+    });
+    buckets['+Inf'] = this.count;
+
+    const empty = this.count === 0;
+    return {
+      count: this.count,
+      sum: round(this.sum),
+      min: empty ? 0 : round(this.min),
+      max: empty ? 0 : round(this.max),
+      mean: empty ? 0 : round(this.sum / this.count),
+      p50: round(this.quantile(0.5)),
+      p90: round(this.quantile(0.9)),
+      p99: round(this.quantile(0.99)),
+      buckets,
+    };
+  }
+}
+
+/**
+ * In-process registry of named histograms, optionally split by one label
+ * (e.g. the route). Served as JSON by GET /api/metrics.
+ */
+class MetricsRegistry {
+  private definitions = new Map<string, MetricDefinition>();
+  private histograms = new Map<string, Map<string, Histogram>>();
+  private sampler: ReturnType<typeof setInterval> | null = null;
+  private loopDelay: IntervalHistogram | null = null;
+
+  define(name: string, definition: MetricDefinition): void {
+    this.definitions.set(name, definition);
+    if (!this.histograms.has(name)) this.histograms.set(name, new Map());
+  }
+
+  /**
+   * Record one value. Unknown metric names get latency buckets.
+   */
+  observe(name: string, value: number, label = 'all'): void {
+    if (!this.definitions.has(name)) {
+      this.define(name, { help: '', unit: 'ms', buckets: LATENCY_BUCKETS_MS });
+    }
+    const series = this.histograms.get(name)!;
+    let histogram = series.get(label);
+    if (!histogram) {
+      histogram = new Histogram(this.definitions.get(name)!.buckets);
+      series.set(label, histogram);
+    }
+    histogram.observe(value);
+  }
+
+  /**
+   * Sample event-loop lag (p99 over each interval) and heap use in the
+   * background until stopRuntimeSampling() is called.
+   */
+  startRuntimeSampling(intervalMs = RUNTIME_SAMPLE_MS): void {
+    if (this.sampler) return;
+
+    const loopDelay = monitorEventLoopDelay({ resolution: LOOP_DELAY_RESOLUTION_MS });
+    loopDelay.enable();
+    this.loopDelay = loopDelay;
+
+    this.sampler = setInterval(() => {
+      // Reported in nanoseconds and including the timer interval itself
+      const lagMs = loopDelay.percentile(99) / 1e6 - LOOP_DELAY_RESOLUTION_MS;
+      this.observe('event_loop_lag_ms', Math.max(0, lagMs));
+      this.observe('heap_used_mb', process.memoryUsage().heapUsed / MB);
+      loopDelay.reset();
+    }, intervalMs);
+    this.sampler.unref();
+  }
+
+  stopRuntimeSampling(): void {
+    if (this.sampler) clearInterval(this.sampler);
+    this.loopDelay?.disable();
+    this.sampler = null;
+    this.loopDelay = null;
+  }
+
+  snapshot(): MetricsSnapshot {
+    const histograms: Record<string, MetricSnapshot> = {};
+    for (const [name, series] of this.histograms) {
+      const { help, unit } = this.definitions.get(name)!;
+      const summaries: Record<string, HistogramSummary> = {};
+      for (const [label, histogram] of series) {
+        summaries[label] = histogram.summary();
+      }
+      histograms[name] = { help, unit, series: summaries };
+    }
+
+    const memory = process.memoryUsage();
+    return {
+      uptime: process.uptime(),
+      histograms,
+      memory: {
+        heapUsedMb: round(memory.heapUsed / MB),
+        heapTotalMb: round(memory.heapTotal / MB),
+        rssMb: round(memory.rss / MB),
+      },
+    };
+  }
+
+  reset(): void {
+    for (const series of this.histograms.values()) series.clear();
+  }
+}
+
+export const metrics = new MetricsRegistry();
+
+metrics.define('http_request_duration_ms', {
+  help: 'Time from request to response finish, by route',
+  unit: 'ms',
+  buckets: LATENCY_BUCKETS_MS,
+});
+metrics.define('transcript_parse_ms_per_mb', {
+  help: 'Transcript JSONL parse time normalised by file size',
+  unit: 'ms/MB',
+  buckets: [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000],
+});
+metrics.define('sse_events_per_second', {
+  help: 'Agent events per second from the first SSE frame to the end of each message stream',
+  unit: 'events/s',
+  buckets: RATE_BUCKETS,
+});
+metrics.define('agent_ttft_ms', {
+  help: 'Time from sending a message to the first streamed text, including queueing',
+  unit: 'ms',
+  buckets: LATENCY_BUCKETS_MS,
+});
+metrics.define('agent_output_tokens_per_second', {
+  help: 'Output tokens per second from first token to turn result',
+  unit: 'tokens/s',
+  buckets: RATE_BUCKETS,
+});
+metrics.define('agent_turn_duration_ms', {
+  help: 'Total agent turn time, including queueing',
+  unit: 'ms',
+  buckets: LATENCY_BUCKETS_MS,
+});
+metrics.define('event_loop_lag_ms', {
+  help: 'p99 event-loop delay per sampling interval',
+  unit: 'ms',
+  buckets: LATENCY_BUCKETS_MS,
+});
+metrics.define('heap_used_mb', {
+  help: 'V8 heap in use, sampled per interval',
+  unit: 'MB',
+  buckets: HEAP_BUCKETS_MB,
+});
+
+export { MetricsRegistry, Histogram };
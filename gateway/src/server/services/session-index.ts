@@ -0,0 +1,129 @@
+import fs from 'fs/promises';
+import path from 'path';
+
+const INDEX_VERSION = 1;
+
+/**
+ * Metadata accumulated while scanning a transcript, line by line.
+ * Messages are stored pre-truncated (one char past the display limit)
+ * so the index stays small while callers can still tell if text was cut.
+ */
+export interface SessionMetaState {
+  firstUserMessage: string;
+  lastUserMessage: string;
+  firstTimestamp: string;
+  permissionMode: 'default' | 'dangerously-skip';
+}
+
+export interface SessionIndexEntry extends SessionMetaState {
+  size: number;
+  mtimeMs: number;
+  birthtime: string;
+  /** Byte offset up to which the transcript has been parsed. */
+  offset: number;
+}
+
+interface SessionIndexFile {
+  version: number;
+  entries: Record<string, SessionIndexEntry>;
+}
+
+/**
+ * Persistent on-disk index of transcript metadata, keyed by file name.
+ * Entries are validated against (size, mtime) by the caller; this class
+ * only handles loading, storing and atomically saving them.
+ */
+class SessionIndex {
+  private entries = new Map<string, SessionIndexEntry>();
+  private loaded: Promise<void> | null = null;
+  private dirty = false;
+  private saving: Promise<void> | null = null;
+
+  constructor(private readonly indexPath: string) {}
+
+  async load(): Promise<void> {
+    if (!this.loaded) {
+      this.loaded = this.readFromDisk();
+    }
+    return this.loaded;
+  }
+
+  get(file: string): SessionIndexEntry | undefined {
+    return this.entries.get(file);
+  }
+
+  set(file: string, entry: SessionIndexEntry): void {
+    this.entries.set(file, entry);
+    this.dirty = true;
+  }
+
+  /**
+   * Drop entries for transcripts that no longer exist.
+   */
+  prune(liveFiles: Iterable<string>): void {
+    const live = new Set(liveFiles);
+    for (const file of this.entries.keys()) {
+      if (!live.has(file)) {
+        this.entries.delete(file);
+        this.dirty = true;
+      }
+    }
+  }
+
+  /**
+   * Write the index if anything changed since the last save.
+   * Only one write runs at a time: a save requested mid-write is folded into
+   * one follow-up write, and callers wait for the write that covers their changes.
+   */
+  save(): Promise<void> {
+    if (!this.saving) {
+      this.saving = this.writePending().finally(() => {
+        this.saving = null;
+      });
+    }
+    return this.saving;
+  }
+
+  private async writePending(): Promise<void> {
+    while (this.dirty) {
+      this.dirty = false;
+      if (!(await this.writeToDisk())) return;
+    }
+  }
+
+  /**
+   * Write to a temp file and rename so readers never see a partial index.
+   */
+  private async writeToDisk(): Promise<boolean> {
+    const data: SessionIndexFile = {
+      version: INDEX_VERSION,
+      entries: Object.fromEntries(this.entries),
+    };
+    const tmpPath = `${this.indexPath}.${process.pid}.tmp`;
+    try {
+      await fs.mkdir(path.dirname(this.indexPath), { recursive: true });
+      await fs.writeFile(tmpPath, JSON.stringify(data));
+      await fs.rename(tmpPath, this.indexPath);
+      return true;
+    } catch (err) {
+      this.dirty = true;
+      console.warn('[SessionIndex] Could not save index:', (err as Error).message);
+      return false;
+    }
+  }
+
+  private async readFromDisk(): Promise<void> {
+    try {
+      const content = await fs.readFile(this.indexPath, 'utf-8');
+      const data = JSON.parse(content) as SessionIndexFile;
+      if (data.version !== INDEX_VERSION || !data.entries) return;
+      for (const [file, entry] of Object.entries(data.entries)) {
+        this.entries.set(file, entry);
+      }
+    } catch {
+      // Missing or corrupt index - start empty and rebuild on demand
+    }
+  }
+}
+
+export { SessionIndex };
@@ -0,0 +1,196 @@
+import { watch, type FSWatcher } from 'fs';
+import fs from 'fs/promises';
+import path from 'path';
+import type { SessionEvent } from '../../shared/types';
+import { transcriptReader } from './transcript-reader';
+
+type SessionEventListener = (event: SessionEvent) => void;
+
+/** Window over which file changes are coalesced into one batch of events. */
+const COALESCE_MS = 300;
+/** Delay before re-trying to watch a transcripts directory that is missing. */
+const RETRY_MS = 30_000;
+
+/**
+ * Watches the SDK transcripts directory and broadcasts session deltas.
+ * Changes are coalesced per file and session metadata is computed once per
+ * change, so the cost is independent of the number of subscribers.
+ * The watcher only runs while at least one subscriber is connected.
+ */
+class SessionWatcher {
+  private listeners = new Set<SessionEventListener>();
+  private watcher: FSWatcher | null = null;
+  private retryTimer: ReturnType<typeof setTimeout> | null = null;
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private flushQueue: Promise<void> = Promise.resolve();
+  private pending = new Set<string>();
+  private rescanPending = false;
+  private sizes = new Map<string, number>();
+  private generation = 0;
+
+  constructor(private readonly vaultRoot: string) {}
+
+  subscribe(listener: SessionEventListener): () => void {
+    this.listeners.add(listener);
+    if (this.listeners.size === 1) void this.start();
+
+    return () => {
+      if (!this.listeners.delete(listener)) return;
+      if (this.listeners.size === 0) this.stop();
+    };
+  }
+
+  get subscriberCount(): number {
+    return this.listeners.size;
+  }
+
+  private get transcriptsDir(): string {
+    return transcriptReader.getTranscriptsDir(this.vaultRoot);
+  }
+
+  private async start(): Promise<void> {
+    const generation = this.generation;
+
+    // Record current sizes so existing transcripts aren't reported as new
+    try {
+      const files = (await fs.readdir(this.transcriptsDir)).filter(f => f.endsWith('.jsonl'));
+      await Promise.all(files.map(async file => {
+        try {
+          const stat = await fs.stat(path.join(this.transcriptsDir, file));
+          this.sizes.set(file, stat.size);
+        } catch {
+          // Removed while scanning
+        }
+      }));
+    } catch {
+      // Directory doesn't exist yet - attachWatcher() will retry
+    }
+
+    if (generation !== this.generation) return;
+    this.attachWatcher();
+  }
+
+  private attachWatcher(): void {
+    this.retryTimer = null;
+    try {
+      this.watcher = watch(this.transcriptsDir, (_eventType, filename) => {
+        this.handleChange(filename ? filename.toString() : null);
+      });
+      this.watcher.on('error', () => {
+        this.closeWatcher();
+        this.scheduleRetry();
+      });
+    } catch {
+      this.scheduleRetry();
+    }
+  }
+
+  private scheduleRetry(): void {
+    if (this.retryTimer || this.listeners.size === 0) return;
+    this.retryTimer = setTimeout(() => {
+      this.attachWatcher();
+      // Pick up anything created while we weren't watching
+      if (this.watcher) this.handleChange(null);
+    }, RETRY_MS);
+  }
+
+  /**
+   * Queue a changed file (or a full rescan when the platform doesn't report
+   * a filename) and flush once per coalescing window.
+   */
+  private handleChange(filename: string | null): void {
+    if (filename === null) {
+      this.rescanPending = true;
+    } else if (filename.endsWith('.jsonl')) {
+      this.pending.add(filename);
+    } else {
+      return;
+    }
+
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => {
+        this.flushTimer = null;
+        // Serialize flushes so per-file size tracking never races
+        this.flushQueue = this.flushQueue.then(() => this.flush());
+      }, COALESCE_MS);
+    }
+  }
+
+  private async flush(): Promise<void> {
+    let files = [...this.pending];
+    this.pending.clear();
+
+    if (this.rescanPending) {
+      this.rescanPending = false;
+      try {
+        files = (await fs.readdir(this.transcriptsDir)).filter(f => f.endsWith('.jsonl'));
+      } catch {
+        files = [];
+      }
+    }
+
+    for (const file of files) {
+      try {
+        await this.checkFile(file);
+      } catch (err) {
+        console.warn(`[SessionWatcher] Could not check ${file}:`, (err as Error).message);
+      }
+    }
+  }
+
+  private async checkFile(file: string): Promise<void> {
+    const sessionId = file.replace('.jsonl', '');
+
+    let size: number;
+    try {
+      size = (await fs.stat(path.join(this.transcriptsDir, file))).size;
+    } catch {
+      this.sizes.delete(file);
+      return;
+    }
+
+    const previous = this.sizes.get(file);
+    if (previous === size) return;
+    this.sizes.set(file, size);
+
+    // Runs every few hundred ms while a transcript streams, so skip the index write
+    const session = await transcriptReader.getSession(this.vaultRoot, sessionId, { persist: false });
+    if (!session) return;
+
+    if (previous === undefined) {
+      this.emit({ type: 'session_created', data: session });
+    } else {
+      this.emit({ type: 'session_updated', data: session });
+      this.emit({ type: 'transcript_appended', data: { sessionId, size } });
+    }
+  }
+
+  private emit(event: SessionEvent): void {
+    for (const listener of this.listeners) {
+      try {
+        listener(event);
+      } catch (err) {
+        console.warn('[SessionWatcher] Listener failed:', (err as Error).message);
+      }
+    }
+  }
+
+  private closeWatcher(): void {
+    this.watcher?.close();
+    this.watcher = null;
+  }
+
+  private stop(): void {
+    this.generation++;
+    this.closeWatcher();
+    if (this.retryTimer) clearTimeout(this.retryTimer);
+    if (this.flushTimer) clearTimeout(this.flushTimer);
+    this.retryTimer = null;
+    this.flushTimer = null;
+    this.pending.clear();
+    this.rescanPending = false;
+    this.sizes.clear();
+  }
+}
+
+export { SessionWatcher };
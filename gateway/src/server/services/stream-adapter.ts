@@ -1,5 +1,30 @@
 import type { Response } from 'express';
-import type { StreamEvent } from '../../shared/types';
+import type { StreamEvent, SessionEvent, TextDelta, ToolCallEvent } from '../../shared/types';
+
+/** Window over which adjacent delta events are merged into one write. */
+const BATCH_WINDOW_MS = 16;
+/** Write early once roughly this many bytes are pending. */
+const BATCH_MAX_BYTES = 16 * 1024;
+
+export interface SSEStreamMetrics {
+  /** Events handed to the writer. */
+  eventsIn: number;
+  /** Events on the wire after adjacent deltas were merged. */
+  eventsOut: number;
+  /** res.write() calls. */
+  framesOut: number;
+  bytesOut: number;
+  /** Peak bytes queued in the response's writable buffer. */
+  maxBufferedBytes: number;
+  /** Times the writer had to wait for 'drain'. */
+  drainWaits: number;
+  /** performance.now() of the first frame written, or null if none was. */
+  firstFrameAt: number | null;
+  /** performance.now() when the stream was ended or the client disconnected. */
+  endedAt: number | null;
+}
+
+type SSEEvent = StreamEvent | SessionEvent;
 
 export function initSSEStream(res: Response): void {
   res.writeHead(200, {
@@ -10,11 +35,255 @@ export function initSSEStream(res: Response): void {
   });
 }
 
-export function sendSSEEvent(res: Response, event: StreamEvent): void {
-  res.write(`event: ${event.type}\n`);
-  res.write(`data: ${JSON.stringify(event.data)}\n\n`);
+function formatSSEEvent(event: SSEEvent): string {
+  return `event: ${event.type}\ndata: ${JSON.stringify(event.data)}\n\n`;
+}
+
+export function sendSSEEvent(res: Response, event: SSEEvent): void {
+  res.write(formatSSEEvent(event));
 }
 
 export function endSSEStream(res: Response): void {
   res.end();
 }
+
+/**
+ * Events per second from the first frame to the end of the stream, so
+ * queueing and time to first token don't count against throughput. Null for
+ * streams that wrote nothing or ended within the same millisecond.
+ */
+export function sseEventsPerSecond(metrics: SSEStreamMetrics): number | null {
+  if (metrics.firstFrameAt === null || metrics.endedAt === null) return null;
+  const seconds = (metrics.endedAt - metrics.firstFrameAt) / 1000;
+  return seconds > 0 ? metrics.eventsIn / seconds : null;
+}
+
+function isDelta(event: SSEEvent): boolean {
+  return event.type === 'text_delta' || event.type === 'tool_call_delta';
+}
+
+/**
+ * Per-response SSE writer for high-rate streams.
+ *
+ * Adjacent text_delta events (and tool_call_delta events for the same tool
+ * call) are merged into one event and written at most once per batch window,
+ * so a burst of SDK tokens costs a few writes instead of thousands. Any other
+ * event flushes immediately, preserving order. When res.write() reports a
+ * full buffer, send() resolves only after 'drain', letting the caller stop
+ * pulling from its source until the client catches up.
+ */
+class SSEEventWriter {
+  private buffer = '';
+  private bufferBytes = 0;
+  private openDelta: StreamEvent | null = null;
+  private openDeltaBytes = 0;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private drained: Promise<void> | null = null;
+  private closed = false;
+  private readonly windowMs: number;
+  private readonly maxBytes: number;
+
+  readonly metrics: SSEStreamMetrics = {
+    eventsIn: 0,
+    eventsOut: 0,
+    framesOut: 0,
+    bytesOut: 0,
+    maxBufferedBytes: 0,
+    drainWaits: 0,
+    firstFrameAt: null,
+    endedAt: null,
+  };
+
+  constructor(
+    private readonly res: Response,
+    opts: { windowMs?: number; maxBytes?: number } = {}
+  ) {
+    this.windowMs = opts.windowMs ?? BATCH_WINDOW_MS;
+    this.maxBytes = opts.maxBytes ?? BATCH_MAX_BYTES;
+    res.on('close', () => {
+      this.closed = true;
+      this.metrics.endedAt ??= performance.now();
+      this.clearTimer();
+    });
+  }
+
+  send(event: SSEEvent): Promise<void> {
+    if (this.closed) return Promise.resolve();
+    this.metrics.eventsIn++;
+
+    if (!this.mergeIntoOpenDelta(event)) {
+      this.closeOpenDelta();
+      if (isDelta(event)) {
+        this.openDelta = { type: event.type, data: { ...event.data } } as StreamEvent;
+        this.openDeltaBytes = 0;
+        this.trackDeltaBytes(event);
+      } else {
+        this.appendToBuffer(formatSSEEvent(event));
+        this.metrics.eventsOut++;
+      }
+    }
+
+    if (!isDelta(event) || this.bufferBytes + this.openDeltaBytes >= this.maxBytes) {
+      this.flush();
+    } else {
+      this.scheduleFlush();
+    }
+
+    return this.drained ?? Promise.resolve();
+  }
+
+  /**
+   * Write everything pending as a single frame.
+   */
+  flush(): void {
+    this.clearTimer();
+    this.closeOpenDelta();
+    if (!this.buffer || this.closed) return;
+
+    const frame = this.buffer;
+    const frameBytes = this.bufferBytes;
+    this.buffer = '';
+    this.bufferBytes = 0;
+    const ok = this.res.write(frame);
+
+    this.metrics.firstFrameAt ??= performance.now();
+    this.metrics.framesOut++;
+    this.metrics.bytesOut += frameBytes;
+    this.metrics.maxBufferedBytes = Math.max(
+      this.metrics.maxBufferedBytes,
+      this.res.writableLength ?? 0
+    );
+
+    if (!ok && !this.drained) {
+      this.metrics.drainWaits++;
+      this.drained = new Promise(resolve => {
+        const done = () => {
+          this.res.off('drain', done);
+          this.res.off('close', done);
+          this.drained = null;
+          resolve();
+          if (this.buffer || this.openDelta) this.scheduleFlush();
+        };
+        this.res.on('drain', done);
+        this.res.on('close', done);
+      });
+    }
+  }
+
+  /**
+   * Flush pending events, end the response and return the stream's metrics.
+   */
+  end(): SSEStreamMetrics {
+    this.flush();
+    this.metrics.endedAt ??= performance.now();
+    this.res.end();
+    return this.metrics;
+  }
+
+  private mergeIntoOpenDelta(event: SSEEvent): boolean {
+    const open = this.openDelta;
+    if (!open || open.type !== event.type) return false;
+
+    if (event.type === 'text_delta') {
+      (open.data as TextDelta).text += (event.data as TextDelta).text;
+    } else if (event.type === 'tool_call_delta') {
+      const target = open.data as ToolCallEvent;
+      const data = event.data as ToolCallEvent;
+      if (target.toolCallId !== data.toolCallId) return false;
+      target.input = (target.input ?? '') + (data.input ?? '');
+    } else {
+      return false;
+    }
+
+    this.trackDeltaBytes(event);
+    return true;
+  }
+
+  private trackDeltaBytes(event: SSEEvent): void {
+    const data = event.data as Partial<TextDelta & ToolCallEvent>;
+    this.openDeltaBytes += Buffer.byteLength(data.text ?? data.input ?? '');
+  }
+
+  // Sizes are counted in UTF-8 bytes, not UTF-16 code units, to match the wire
+  private appendToBuffer(chunk: string): void {
+    this.buffer += chunk;
+    this.bufferBytes += Buffer.byteLength(chunk);
+  }
+
+  private closeOpenDelta(): void {
+    if (!this.openDelta) return;
+    this.appendToBuffer(formatSSEEvent(this.openDelta));
+    this.metrics.eventsOut++;
+    this.openDelta = null;
+    this.openDeltaBytes = 0;
+  }
+
+  private scheduleFlush(): void {
+    // While waiting for 'drain' keep merging; the drain handler reschedules
+    if (this.timer || this.drained) return;
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.flush();
+    }, this.windowMs);
+  }
+
+  private clearTimer(): void {
+    if (this.timer) clearTimeout(this.timer);
+    this.timer = null;
+  }
+}
+
+/**
+ * SSE writer for long-lived notification streams whose source can't be
+ * paused (e.g. file watcher events). While the client's socket buffer is
+ * full, events are held and coalesced by key - a newer event replaces any
+ * pending one with the same key - and written as one frame on 'drain', so a
+ * slow client costs at most one pending event per key.
+ */
+class CoalescingSSEWriter {
+  private pending = new Map<string, SSEEvent>();
+  private waiting = false;
+  private closed = false;
+
+  constructor(
+    private readonly res: Response,
+    private readonly keyOf: (event: SSEEvent) => string
+  ) {
+    res.on('close', () => {
+      this.closed = true;
+      this.pending.clear();
+    });
+  }
+
+  send(event: SSEEvent): void {
+    if (this.closed) return;
+    if (this.waiting) {
+      // Re-insert so pending events stay in order of their latest update
+      const key = this.keyOf(event);
+      this.pending.delete(key);
+      this.pending.set(key, event);
+      return;
+    }
+    this.write(formatSSEEvent(event));
+  }
+
+  /** Write an SSE comment line (e.g. a keep-alive), skipped while backed up. */
+  comment(text: string): void {
+    if (this.closed || this.waiting) return;
+    this.write(`: ${text}\n\n`);
+  }
+
+  private write(frame: string): void {
+    if (this.res.write(frame)) return;
+    this.waiting = true;
+    this.res.once('drain', () => {
+      this.waiting = false;
+      if (this.closed || this.pending.size === 0) return;
+      const events = [...this.pending.values()];
+      this.pending.clear();
+      this.write(events.map(formatSSEEvent).join(''));
+    });
+  }
+}
+
+export { SSEEventWriter, CoalescingSSEWriter };
@@ -1,7 +1,20 @@
 import fs from 'fs/promises';
 import path from 'path';
 import os from 'os';
-import type { Session } from '../../shared/types';
+import type { Stats } from 'fs';
+import type { Session, HistoryPage, SessionPage } from '../../shared/types';
+import { SessionIndex, type SessionIndexEntry, type SessionMetaState } from './session-index';
+import { metrics } from './metrics';
+
+const TITLE_LENGTH = 80;
+const PREVIEW_LENGTH = 100;
+/** Max transcripts parsed at once when the index is cold. */
+const PARSE_CONCURRENCY = 8;
+const READ_CHUNK_SIZE = 64 * 1024;
+/** Number of per-transcript message indexes kept in memory. */
+const MESSAGE_INDEX_CACHE_SIZE = 50;
+/** Reads smaller than this are dominated by open/stat overhead, not parsing. */
+const MIN_TIMED_PARSE_BYTES = READ_CHUNK_SIZE;
 
 export interface HistoryMessage {
   id: string;
@@ -38,8 +51,143 @@ interface ContentBlock {
   input?: Record<string, unknown>;
 }
 
+interface FileLine {
+  text: string;
+  /** Byte offset of the first byte of the line. */
+  start: number;
+  /** Byte offset just past the line, including its newline. */
+  end: number;
+  /** False for a final line with no trailing newline. */
+  terminated: boolean;
+}
+
+/** Byte ranges of the transcript lines that produce history messages. */
+interface MessageIndex {
+  size: number;
+  mtimeMs: number;
+  /** Byte offset just past the last line scanned. */
+  offset: number;
+  starts: number[];
+  ends: number[];
+}
+
+/**
+ * Order sessions by updatedAt descending, then by id for a stable order.
+ */
+function compareSessions(a: Pick<Session, 'id' | 'updatedAt'>, b: Pick<Session, 'id' | 'updatedAt'>): number {
+  return b.updatedAt.localeCompare(a.updatedAt) || a.id.localeCompare(b.id);
+}
+
+function encodeCursor(session: Session): string {
+  return Buffer.from(JSON.stringify([session.updatedAt, session.id])).toString('base64url');
+}
+
+function decodeCursor(cursor: string): Pick<Session, 'id' | 'updatedAt'> | null {
+  try {
+    const [updatedAt, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf-8'));
+    if (typeof updatedAt !== 'string' || typeof id !== 'string') return null;
+    return { updatedAt, id };
+  } catch {
+    return null;
+  }
+}
+
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i]);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+/**
+ * Stream newline-delimited lines from a file between two byte offsets,
+ * reading fixed-size chunks so large transcripts are never held in memory.
+ */
+async function* readLines(filePath: string, start = 0, end = Infinity): AsyncGenerator<FileLine> {
+  const handle = await fs.open(filePath, 'r');
+  try {
+    const chunk = Buffer.alloc(READ_CHUNK_SIZE);
+    let pending: Buffer[] = [];
+    let lineStart = start;
+    let position = start;
+
+    while (position < end) {
+      const length = Math.min(READ_CHUNK_SIZE, end - position);
+      const { bytesRead } = await handle.read(chunk, 0, length, position);
+      if (bytesRead === 0) break;
+
+      const data = chunk.subarray(0, bytesRead);
+      let from = 0;
+      let newline: number;
+      while ((newline = data.indexOf(0x0a, from)) !== -1) {
+        const piece = data.subarray(from, newline);
+        const text = pending.length
+          ? Buffer.concat([...pending, piece]).toString('utf-8')
+          : piece.toString('utf-8');
+        const lineEnd = position + newline + 1;
+        yield { text, start: lineStart, end: lineEnd, terminated: true };
+        pending = [];
+        lineStart = lineEnd;
+        from = newline + 1;
+      }
+      if (from < bytesRead) {
+        // Copy: the chunk buffer is reused for the next read
+        pending.push(Buffer.from(data.subarray(from)));
+      }
+      position += bytesRead;
+    }
+
+    if (pending.length) {
+      const rest = Buffer.concat(pending);
+      yield {
+        text: rest.toString('utf-8'),
+        start: lineStart,
+        end: lineStart + rest.length,
+        terminated: false,
+      };
+    }
+  } finally {
+    await handle.close();
+  }
+}
+
+/**
+ * Record parse throughput for a read of `bytes` that started at `startMs`.
+ */
+function recordParse(bytes: number, startMs: number): void {
+  if (bytes < MIN_TIMED_PARSE_BYTES) return;
+  const elapsedMs = performance.now() - startMs;
+  metrics.observe('transcript_parse_ms_per_mb', elapsedMs / (bytes / (1024 * 1024)));
+}
+
+/**
+ * Index of the first element in a sorted array that is >= value.
+ */
+function lowerBound(sorted: number[], value: number): number {
+  let lo = 0;
+  let hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (sorted[mid] < value) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
 class TranscriptReader {
   private projectSlug: string | null = null;
+  private index: SessionIndex | null = null;
+  private messageIndexes = new Map<string, MessageIndex>();
 
   getProjectSlug(vaultRoot: string): string {
     if (this.projectSlug) return this.projectSlug;
@@ -52,9 +200,21 @@ class TranscriptReader {
     return path.join(os.homedir(), '.claude', 'projects', slug);
   }
 
+  getIndexPath(vaultRoot: string): string {
+    return path.join(vaultRoot, 'state', 'gateway', 'session-index.json');
+  }
+
+  private getIndex(vaultRoot: string): SessionIndex {
+    if (!this.index) {
+      this.index = new SessionIndex(this.getIndexPath(vaultRoot));
+    }
+    return this.index;
+  }
+
   /**
-   * List all sessions by scanning SDK JSONL transcript files.
-   * Extracts metadata (title, timestamps, preview) from file content and stats.
+   * List all sessions from SDK JSONL transcript files, most recent first.
+   * Metadata comes from the persistent session index; only transcripts whose
+   * size or mtime changed since the last listing are (re-)parsed.
    */
   async listSessions(vaultRoot: string): Promise<Session[]> {
     const transcriptsDir = this.getTranscriptsDir(vaultRoot);
@@ -66,178 +226,383 @@ class TranscriptReader {
       return [];
     }
 
-    const sessions: Session[] = [];
-
-    for (const file of files) {
-      const sessionId = file.replace('.jsonl', '');
-      const filePath = path.join(transcriptsDir, file);
+    const index = this.getIndex(vaultRoot);
+    await index.load();
 
+    const results = await mapWithConcurrency(files, PARSE_CONCURRENCY, async file => {
       try {
-        const meta = await this.extractSessionMeta(filePath, sessionId);
-        sessions.push(meta);
+        return await this.getIndexedMeta(index, transcriptsDir, file);
       } catch {
         // Skip unreadable files
+        return null;
       }
-    }
+    });
 
-    // Sort by updatedAt descending (most recent first)
-    sessions.sort((a, b) => b.updatedAt.localeCompare(a.updatedAt));
+    index.prune(files);
+    await index.save();
+
+    const sessions = results.filter((s): s is Session => s !== null);
+    sessions.sort(compareSessions);
     return sessions;
   }
 
+  /**
+   * List one page of sessions, most recent first.
+   * The cursor is opaque to callers; pass back `nextCursor` to get the next page.
+   */
+  async listSessionsPage(
+    vaultRoot: string,
+    opts: { limit: number; cursor?: string }
+  ): Promise<SessionPage> {
+    const sessions = await this.listSessions(vaultRoot);
+
+    let start = 0;
+    const after = opts.cursor ? decodeCursor(opts.cursor) : null;
+    if (after) {
+      start = sessions.findIndex(s => compareSessions(s, after) > 0);
+      if (start === -1) start = sessions.length;
+    }
+
+    const page = sessions.slice(start, start + opts.limit);
+    const last = page[page.length - 1];
+    const hasMore = start + opts.limit < sessions.length;
+
+    return {
+      sessions: page,
+      nextCursor: hasMore && last ? encodeCursor(last) : null,
+    };
+  }
+
   /**
    * Get metadata for a single session.
+   * With `persist: false` the index is only updated in memory and written by
+   * the next listing, for callers that look sessions up on every change.
    */
-  async getSession(vaultRoot: string, sessionId: string): Promise<Session | null> {
-    const filePath = path.join(this.getTranscriptsDir(vaultRoot), `${sessionId}.jsonl`);
+  async getSession(
+    vaultRoot: string,
+    sessionId: string,
+    opts: { persist?: boolean } = {}
+  ): Promise<Session | null> {
+    const index = this.getIndex(vaultRoot);
+    await index.load();
     try {
-      return await this.extractSessionMeta(filePath, sessionId);
+      const session = await this.getIndexedMeta(
+        index,
+        this.getTranscriptsDir(vaultRoot),
+        `${sessionId}.jsonl`
+      );
+      if (opts.persist !== false) await index.save();
+      return session;
     } catch {
       return null;
     }
   }
 
   /**
-   * Extract session metadata from a JSONL file.
-   * Reads first ~20 lines for title/permissionMode, and uses file stat for timestamps.
+   * Resolve session metadata through the index.
+   * Unchanged files are served from the index, files that only grew are
+   * parsed from the last indexed offset, anything else is parsed in full.
    */
-  private async extractSessionMeta(filePath: string, sessionId: string): Promise<Session> {
+  private async getIndexedMeta(
+    index: SessionIndex,
+    transcriptsDir: string,
+    file: string
+  ): Promise<Session> {
+    const sessionId = file.replace('.jsonl', '');
+    const filePath = path.join(transcriptsDir, file);
     const stat = await fs.stat(filePath);
-    const content = await fs.readFile(filePath, 'utf-8');
-    const lines = content.split('\n').filter(l => l.trim());
+    const cached = index.get(file);
+
+    let entry: SessionIndexEntry;
+    if (cached && cached.size === stat.size && cached.mtimeMs === stat.mtimeMs) {
+      entry = cached;
+    } else if (cached && stat.size > cached.size && cached.offset <= stat.size) {
+      // Transcripts are append-only, so growth means new lines at the end
+      entry = await this.scanEntry(filePath, stat, cached);
+      index.set(file, entry);
+    } else {
+      entry = await this.scanEntry(filePath, stat);
+      index.set(file, entry);
+    }
 
-    let firstUserMessage = '';
-    let lastUserMessage = '';
-    let permissionMode: 'default' | 'dangerously-skip' = 'default';
-    let firstTimestamp = '';
+    return this.toSession(sessionId, entry, stat.mtime);
+  }
 
-    for (const line of lines) {
-      let parsed: TranscriptLine;
-      try {
-        parsed = JSON.parse(line);
-      } catch {
-        continue;
+  /**
+   * Parse transcript lines from `base.offset` (or the start of the file) up to
+   * the stat'd size and fold them into the metadata state.
+   * A trailing line without a newline is only consumed if it is valid JSON,
+   * so a line the SDK is still writing gets re-read on the next pass.
+   */
+  private async scanEntry(
+    filePath: string,
+    stat: Stats,
+    base?: SessionIndexEntry
+  ): Promise<SessionIndexEntry> {
+    const state: SessionMetaState = {
+      firstUserMessage: base?.firstUserMessage ?? '',
+      lastUserMessage: base?.lastUserMessage ?? '',
+      firstTimestamp: base?.firstTimestamp ?? '',
+      permissionMode: base?.permissionMode ?? 'default',
+    };
+    let offset = base?.offset ?? 0;
+    const startOffset = offset;
+    const started = performance.now();
+
+    for await (const line of readLines(filePath, offset, stat.size)) {
+      if (line.terminated) {
+        if (line.text.trim()) this.applyMetaLine(state, line.text);
+        offset = line.end;
+      } else if (line.text.trim() && this.applyMetaLine(state, line.text)) {
+        offset = line.end;
       }
+    }
+    recordParse(stat.size - startOffset, started);
 
-      // Extract permission mode from init message
-      if (parsed.type === 'system' && parsed.subtype === 'init' && parsed.permissionMode) {
-        if (parsed.permissionMode === 'bypassPermissions') {
-          permissionMode = 'dangerously-skip';
-        }
-      }
+    return {
+      ...state,
+      size: stat.size,
+      mtimeMs: stat.mtimeMs,
+      birthtime: base?.birthtime ?? stat.birthtime.toISOString(),
+      offset,
+    };
+  }
+
+  /**
+   * Fold one JSONL line into the metadata state. Returns false if the line
+   * is not valid JSON.
+   */
+  private applyMetaLine(state: SessionMetaState, line: string): boolean {
+    let parsed: TranscriptLine;
+    try {
+      parsed = JSON.parse(line);
+    } catch {
+      return false;
+    }
 
-      // Extract timestamps
-      if (parsed.timestamp && !firstTimestamp) {
-        firstTimestamp = parsed.timestamp;
+    // Extract permission mode from init message
+    if (parsed.type === 'system' && parsed.subtype === 'init' && parsed.permissionMode) {
+      if (parsed.permissionMode === 'bypassPermissions') {
+        state.permissionMode = 'dangerously-skip';
       }
+    }
 
-      // Extract user messages for title and preview
-      if (parsed.type === 'user' && parsed.message) {
-        const text = this.extractTextContent(parsed.message.content);
-        if (text.startsWith('<local-command') || text.startsWith('<command-name>')) {
-          continue;
-        }
-        const cleanText = this.stripSystemTags(text);
-        if (!cleanText.trim()) continue;
+    // Extract timestamps
+    if (parsed.timestamp && !state.firstTimestamp) {
+      state.firstTimestamp = parsed.timestamp;
+    }
 
-        if (!firstUserMessage) {
-          firstUserMessage = cleanText.trim();
-        }
-        lastUserMessage = cleanText.trim();
+    // Extract user messages for title and preview
+    if (parsed.type === 'user' && parsed.message) {
+      const text = this.extractTextContent(parsed.message.content);
+      if (text.startsWith('<local-command') || text.startsWith('<command-name>')) {
+        return true;
+      }
+      const cleanText = this.stripSystemTags(text).trim();
+      if (!cleanText) return true;
+
+      // Keep one char past the display limit so truncation can be detected
+      if (!state.firstUserMessage) {
+        state.firstUserMessage = cleanText.slice(0, TITLE_LENGTH + 1);
       }
+      state.lastUserMessage = cleanText.slice(0, PREVIEW_LENGTH + 1);
     }
 
+    return true;
+  }
+
+  private toSession(sessionId: string, entry: SessionIndexEntry, mtime: Date): Session {
+    const { firstUserMessage, lastUserMessage } = entry;
+
     const title = firstUserMessage
-      ? firstUserMessage.slice(0, 80) + (firstUserMessage.length > 80 ? '...' : '')
+      ? firstUserMessage.slice(0, TITLE_LENGTH) + (firstUserMessage.length > TITLE_LENGTH ? '...' : '')
       : `Session ${sessionId.slice(0, 8)}`;
 
     const preview = lastUserMessage
-      ? lastUserMessage.slice(0, 100) + (lastUserMessage.length > 100 ? '...' : '')
+      ? lastUserMessage.slice(0, PREVIEW_LENGTH) + (lastUserMessage.length > PREVIEW_LENGTH ? '...' : '')
       : undefined;
 
     return {
       id: sessionId,
       title,
-      createdAt: firstTimestamp || stat.birthtime.toISOString(),
-      updatedAt: stat.mtime.toISOString(),
+      createdAt: entry.firstTimestamp || entry.birthtime,
+      updatedAt: mtime.toISOString(),
       lastMessagePreview: preview,
-      permissionMode,
+      permissionMode: entry.permissionMode,
     };
   }
 
   /**
-   * Read messages from an SDK session transcript.
+   * Read all messages from an SDK session transcript.
+   * The file is streamed line by line rather than loaded whole.
    */
   async readTranscript(
     vaultRoot: string,
     sessionId: string
   ): Promise<HistoryMessage[]> {
-    const transcriptsDir = this.getTranscriptsDir(vaultRoot);
-    const filePath = path.join(transcriptsDir, `${sessionId}.jsonl`);
+    const filePath = this.getTranscriptPath(vaultRoot, sessionId);
 
-    let content: string;
+    const messages: HistoryMessage[] = [];
+    const started = performance.now();
+    let bytes = 0;
     try {
-      content = await fs.readFile(filePath, 'utf-8');
+      for await (const line of readLines(filePath)) {
+        const message = this.parseMessageLine(line.text);
+        if (message) messages.push(message);
+        bytes = line.end;
+      }
     } catch {
       return [];
     }
+    recordParse(bytes, started);
+
+    return messages;
+  }
+
+  /**
+   * Read up to `limit` messages ending just before the `before` cursor, or at
+   * the newest message when no cursor is given. Messages are in chronological
+   * order; pass back `nextCursor` as `before` to fetch the preceding page.
+   */
+  async readTranscriptPage(
+    vaultRoot: string,
+    sessionId: string,
+    opts: { limit: number; before?: string }
+  ): Promise<HistoryPage> {
+    const filePath = this.getTranscriptPath(vaultRoot, sessionId);
+
+    let index: MessageIndex;
+    try {
+      index = await this.getMessageIndex(filePath);
+    } catch {
+      return { messages: [], nextCursor: null };
+    }
+
+    let end = index.starts.length;
+    const before = opts.before !== undefined ? parseInt(opts.before, 10) : NaN;
+    if (!Number.isNaN(before)) {
+      end = lowerBound(index.starts, before);
+    }
+    const begin = Math.max(0, end - opts.limit);
+    if (begin >= end) return { messages: [], nextCursor: null };
 
     const messages: HistoryMessage[] = [];
-    const lines = content.split('\n').filter(l => l.trim());
+    for await (const line of readLines(filePath, index.starts[begin], index.ends[end - 1])) {
+      const message = this.parseMessageLine(line.text);
+      if (message) messages.push(message);
+    }
 
-    for (const line of lines) {
-      let parsed: TranscriptLine;
-      try {
-        parsed = JSON.parse(line);
-      } catch {
-        continue;
-      }
+    return {
+      messages,
+      nextCursor: begin > 0 ? String(index.starts[begin]) : null,
+    };
+  }
 
-      if (parsed.type === 'user' && parsed.message) {
-        const text = this.extractTextContent(parsed.message.content);
-        if (text.startsWith('<local-command') || text.startsWith('<command-name>')) {
-          continue;
-        }
-        const cleanText = this.stripSystemTags(text);
-        if (!cleanText.trim()) continue;
-
-        messages.push({
-          id: parsed.uuid || crypto.randomUUID(),
-          role: 'user',
-          content: cleanText,
-        });
-      } else if (parsed.type === 'assistant' && parsed.message) {
-        const contentBlocks = parsed.message.content;
-        if (!Array.isArray(contentBlocks)) continue;
-
-        const textParts: string[] = [];
-        const toolCalls: HistoryToolCall[] = [];
-
-        for (const block of contentBlocks) {
-          if (block.type === 'text' && block.text) {
-            textParts.push(block.text);
-          } else if (block.type === 'tool_use' && block.name && block.id) {
-            toolCalls.push({
-              toolCallId: block.id,
-              toolName: block.name,
-              status: 'complete',
-            });
-          }
+  private getTranscriptPath(vaultRoot: string, sessionId: string): string {
+    return path.join(this.getTranscriptsDir(vaultRoot), `${sessionId}.jsonl`);
+  }
+
+  /**
+   * Get the byte ranges of message lines in a transcript, scanning only
+   * the bytes appended since the index was last built.
+   */
+  private async getMessageIndex(filePath: string): Promise<MessageIndex> {
+    const stat = await fs.stat(filePath);
+    const cached = this.messageIndexes.get(filePath);
+
+    let index: MessageIndex;
+    if (cached && cached.size === stat.size && cached.mtimeMs === stat.mtimeMs) {
+      index = cached;
+    } else {
+      const extend = cached && stat.size > cached.size && cached.offset <= stat.size;
+      index = {
+        size: stat.size,
+        mtimeMs: stat.mtimeMs,
+        offset: extend ? cached.offset : 0,
+        starts: extend ? [...cached.starts] : [],
+        ends: extend ? [...cached.ends] : [],
+      };
+      for await (const line of readLines(filePath, index.offset, stat.size)) {
+        const message = this.parseMessageLine(line.text);
+        // A partial trailing line is re-scanned once the SDK finishes it
+        if (!line.terminated && !message) break;
+        if (message) {
+          index.starts.push(line.start);
+          index.ends.push(line.end);
         }
+        index.offset = line.end;
+      }
+    }
+
+    // Keep most recently used indexes at the end of the map
+    this.messageIndexes.delete(filePath);
+    this.messageIndexes.set(filePath, index);
+    if (this.messageIndexes.size > MESSAGE_INDEX_CACHE_SIZE) {
+      const oldest = this.messageIndexes.keys().next().value as string;
+      this.messageIndexes.delete(oldest);
+    }
+
+    return index;
+  }
 
-        const text = textParts.join('\n').trim();
-        if (!text && toolCalls.length === 0) continue;
+  /**
+   * Convert one JSONL transcript line to a history message, or null if the
+   * line is not a displayable user/assistant message.
+   */
+  private parseMessageLine(line: string): HistoryMessage | null {
+    if (!line.trim()) return null;
 
-        messages.push({
-          id: parsed.uuid || crypto.randomUUID(),
-          role: 'assistant',
-          content: text,
-          toolCalls: toolCalls.length > 0 ? toolCalls : undefined,
-        });
+    let parsed: TranscriptLine;
+    try {
+      parsed = JSON.parse(line);
+    } catch {
+      return null;
+    }
+
+    if (parsed.type === 'user' && parsed.message) {
+      const text = this.extractTextContent(parsed.message.content);
+      if (text.startsWith('<local-command') || text.startsWith('<command-name>')) {
+        return null;
+      }
+      const cleanText = this.stripSystemTags(text);
+      if (!cleanText.trim()) return null;
+
+      return {
+        id: parsed.uuid || crypto.randomUUID(),
+        role: 'user',
+        content: cleanText,
+      };
+    } else if (parsed.type === 'assistant' && parsed.message) {
+      const contentBlocks = parsed.message.content;
+      if (!Array.isArray(contentBlocks)) return null;
+
+      const textParts: string[] = [];
+      const toolCalls: HistoryToolCall[] = [];
+
+      for (const block of contentBlocks) {
+        if (block.type === 'text' && block.text) {
+          textParts.push(block.text);
+        } else if (block.type === 'tool_use' && block.name && block.id) {
+          toolCalls.push({
+            toolCallId: block.id,
+            toolName: block.name,
+            status: 'complete',
+          });
+        }
       }
+
+      const text = textParts.join('\n').trim();
+      if (!text && toolCalls.length === 0) return null;
+
+      return {
+        id: parsed.uuid || crypto.randomUUID(),
+        role: 'assistant',
+        content: text,
+        toolCalls: toolCalls.length > 0 ? toolCalls : undefined,
+      };
     }
 
-    return messages;
+    return null;
   }
 
   /**
@@ -270,3 +635,4 @@ class TranscriptReader {
 }
 
 export const transcriptReader = new TranscriptReader();
+export { TranscriptReader };
@@ -0,0 +1,62 @@
+interface Waiter {
+  key: string;
+  start: () => void;
+}
+
+/**
+ * Fair scheduler for agent turns.
+ * At most `limit` turns run at once across all sessions, and turns for the
+ * same session key run one at a time. Waiters are started in arrival order;
+ * a waiter blocked only by its own session doesn't hold up others behind it.
+ */
+class TurnScheduler {
+  private running = new Set<string>();
+  private waiters: Waiter[] = [];
+
+  constructor(private readonly limit: number) {}
+
+  /**
+   * Wait for a slot. Resolves with a release function that must be called
+   * exactly once when the turn finishes.
+   */
+  acquire(key: string): Promise<() => void> {
+    return new Promise(resolve => {
+      this.waiters.push({
+        key,
+        start: () => {
+          let released = false;
+          resolve(() => {
+            if (released) return;
+            released = true;
+            this.running.delete(key);
+            this.pump();
+          });
+        },
+      });
+      this.pump();
+    });
+  }
+
+  get activeCount(): number {
+    return this.running.size;
+  }
+
+  get queuedCount(): number {
+    return this.waiters.length;
+  }
+
+  private pump(): void {
+    for (let i = 0; i < this.waiters.length && this.running.size < this.limit;) {
+      const waiter = this.waiters[i];
+      if (this.running.has(waiter.key)) {
+        i++;
+        continue;
+      }
+      this.waiters.splice(i, 1);
+      this.running.add(waiter.key);
+      waiter.start();
+    }
+  }
+}
+
+export { TurnScheduler };
@@ -61,6 +61,23 @@ export interface DoneEvent {
   sessionId: string;
 }
 
+// === Session Event Types (live SSE channel) ===
+
+export type SessionEventType =
+  | 'session_created'
+  | 'session_updated'
+  | 'transcript_appended';
+
+export interface SessionEvent {
+  type: SessionEventType;
+  data: Session | TranscriptAppendedEvent;
+}
+
+export interface TranscriptAppendedEvent {
+  sessionId: string;
+  size: number; // Transcript size in bytes after the append
+}
+
 // === Chat History Types ===
 
 export interface HistoryMessage {
@@ -77,6 +94,16 @@ export interface HistoryToolCall {
   status: 'complete';
 }
 
+export interface HistoryPage {
+  messages: HistoryMessage[];
+  nextCursor: string | null; // Pass as `before` to load older messages
+}
+
+export interface SessionPage {
+  sessions: Session[];
+  nextCursor: string | null; // Pass as `cursor` to load the next (older) page
+}
+
 // === Command Types ===
 
 export interface CommandEntry {
@@ -0,0 +1,77 @@
+/**
+ * Helpers for replaying SSE streams in tests and benchmarks.
+ * A recording is the raw text/event-stream body as captured on the wire,
+ * e.g. `curl -N -X POST .../api/sessions/<id>/messages -d '{"content":"..."}' > stream.sse`.
+ */
+
+function formatEvent(type: string, data: unknown): string {
+  return `event: ${type}\ndata: ${JSON.stringify(data)}\n\n`;
+}
+
+/**
+ * Build a synthetic recording shaped like a real agent turn: a run of text
+ * deltas, then tool calls whose JSON input streams in small pieces.
+ */
+export function synthesizeSSERecording(opts: {
+  textDeltas?: number;
+  toolCalls?: number;
+  toolInputDeltas?: number;
+} = {}): string {
+  const { textDeltas = 1000, toolCalls = 5, toolInputDeltas = 200 } = opts;
+  let out = '';
+
+  for (let i = 0; i < textDeltas; i++) {
+    out += formatEvent('text_delta', { text: `token${i} ` });
+  }
+
+  for (let t = 0; t < toolCalls; t++) {
+    const toolCallId = `toolu_${t}`;
+    out += formatEvent('tool_call_start', { toolCallId, toolName: 'Write', status: 'running' });
+    for (let i = 0; i < toolInputDeltas; i++) {
+      out += formatEvent('tool_call_delta', {
+        toolCallId,
+        toolName: 'Write',
+        input: i === 0 ? '{"content":"' : `chunk ${i} `,
+        status: 'running',
+      });
+    }
+    out += formatEvent('tool_call_delta', { toolCallId, toolName: 'Write', input: '"}', status: 'running' });
+    out += formatEvent('tool_call_end', { toolCallId, toolName: 'Write', status: 'complete' });
+    out += formatEvent('tool_result', { toolCallId, toolName: '', result: 'ok', status: 'complete' });
+  }
+
+  out += formatEvent('done', { sessionId: 'bench-session' });
+  return out;
+}
+
+/**
+ * Split a recording into network-sized chunks, cutting across event
+ * boundaries the way TCP reads do.
+ */
+export function chunkSSERecording(text: string, chunkSize = 512): string[] {
+  const chunks: string[] = [];
+  for (let i = 0; i < text.length; i += chunkSize) {
+    chunks.push(text.slice(i, i + chunkSize));
+  }
+  return chunks;
+}
+
+/**
+ * ReadableStream that delivers one chunk per macrotask, so the consumer
+ * sees a paced stream rather than everything in a single tick.
+ */
+export function createPacedStream(chunks: string[]): ReadableStream<Uint8Array> {
+  const encoder = new TextEncoder();
+  let index = 0;
+
+  return new ReadableStream({
+    async pull(controller) {
+      await new Promise(resolve => setTimeout(resolve, 0));
+      if (index < chunks.length) {
+        controller.enqueue(encoder.encode(chunks[index++]));
+      } else {
+        controller.close();
+      }
+    },
+  });
+}
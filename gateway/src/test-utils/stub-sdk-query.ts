@@ -0,0 +1,70 @@
+/**
+ * Stand-in for the Agent SDK's streaming-input query(), for benchmarks that
+ * measure the gateway's own streaming overhead without a model behind it.
+ */
+
+export interface StubTurnOptions {
+  /** Text delta stream events per turn. */
+  textDeltas?: number;
+  /** Tool calls per turn, after the text. */
+  toolCalls?: number;
+  /** input_json_delta events per tool call. */
+  toolInputDeltas?: number;
+}
+
+interface StubPromptMessage {
+  session_id?: string;
+}
+
+function streamEvent(sessionId: string, event: Record<string, unknown>) {
+  return { type: 'stream_event', event, parent_tool_use_id: null, session_id: sessionId };
+}
+
+/**
+ * Build a query() replacement. Each user message pushed into the prompt is
+ * answered with an init message, the configured text and tool call events,
+ * and a result, until the prompt closes.
+ */
+export function createStubQuery(opts: StubTurnOptions = {}) {
+  const { textDeltas = 2000, toolCalls = 5, toolInputDeltas = 100 } = opts;
+  const outputTokens = textDeltas + toolCalls * toolInputDeltas;
+
+  return ({ prompt }: { prompt: AsyncIterable<StubPromptMessage> }) =>
+    (async function* () {
+      for await (const message of prompt) {
+        const sessionId = message.session_id || 'stub-session';
+        yield { type: 'system', subtype: 'init', session_id: sessionId };
+
+        for (let i = 0; i < textDeltas; i++) {
+          yield streamEvent(sessionId, {
+            type: 'content_block_delta',
+            index: 0,
+            delta: { type: 'text_delta', text: `token${i} ` },
+          });
+        }
+
+        for (let t = 0; t < toolCalls; t++) {
+          yield streamEvent(sessionId, {
+            type: 'content_block_start',
+            index: t + 1,
+            content_block: { type: 'tool_use', id: `toolu_${t}`, name: 'Write' },
+          });
+          for (let i = 0; i < toolInputDeltas; i++) {
+            yield streamEvent(sessionId, {
+              type: 'content_block_delta',
+              index: t + 1,
+              delta: { type: 'input_json_delta', partial_json: i === 0 ? '{"content":"' : `chunk ${i} ` },
+            });
+          }
+          yield streamEvent(sessionId, { type: 'content_block_stop', index: t + 1 });
+        }
+
+        yield {
+          type: 'result',
+          subtype: 'success',
+          session_id: sessionId,
+          usage: { input_tokens: 10, output_tokens: outputTokens },
+        };
+      }
+    })();
+}
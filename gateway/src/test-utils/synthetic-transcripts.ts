@@ -0,0 +1,107 @@
+/**
+ * Generators for synthetic SDK transcript directories, for benchmarks that
+ * need realistic file counts and sizes without real session data.
+ */
+import fs from 'fs/promises';
+import path from 'path';
+
+const PARAGRAPH =
+  'The quarterly review covered pipeline health, hiring plans and the migration ' +
+  'timeline. Action items were assigned to each owner with follow-ups scheduled ' +
+  'for next week, and open questions were parked in the project note. ';
+
+export interface SyntheticTranscriptOptions {
+  /** Number of ordinary session transcripts. */
+  sessions?: number;
+  /** User/assistant exchanges per ordinary session. */
+  exchangesPerSession?: number;
+  /** Size of one extra large transcript, in bytes (0 to skip it). */
+  largeSessionBytes?: number;
+}
+
+export interface SyntheticTranscripts {
+  sessionIds: string[];
+  /** Id of the large transcript, if one was written. */
+  largeSessionId: string | null;
+  totalBytes: number;
+}
+
+function sessionId(n: number): string {
+  return `00000000-0000-4000-8000-${String(n).padStart(12, '0')}`;
+}
+
+/**
+ * One user/assistant exchange as transcript JSONL lines, shaped like the
+ * SDK's: a user message, then an assistant message with text and a tool call.
+ */
+function exchangeLines(id: string, turn: number, paragraphs: number): string {
+  const timestamp = new Date(Date.UTC(2025, 0, 1, 0, 0, turn)).toISOString();
+  const user = {
+    type: 'user',
+    uuid: `${id}-u${turn}`,
+    sessionId: id,
+    timestamp,
+    message: { role: 'user', content: `Question ${turn}: summarise the notes for session ${id}` },
+  };
+  const assistant = {
+    type: 'assistant',
+    uuid: `${id}-a${turn}`,
+    sessionId: id,
+    timestamp,
+    message: {
+      role: 'assistant',
+      content: [
+        { type: 'text', text: PARAGRAPH.repeat(paragraphs) },
+        { type: 'tool_use', id: `toolu_${turn}`, name: 'Read', input: { file_path: `Notes/${turn}.md` } },
+      ],
+    },
+  };
+  return `${JSON.stringify(user)}\n${JSON.stringify(assistant)}\n`;
+}
+
+function headerLines(id: string): string {
+  const init = { type: 'system', subtype: 'init', sessionId: id, permissionMode: 'default' };
+  return `${JSON.stringify({ type: 'file-history-snapshot' })}\n${JSON.stringify(init)}\n`;
+}
+
+/**
+ * Write `sessions` small transcripts plus one large one into `dir`.
+ */
+export async function writeSyntheticTranscripts(
+  dir: string,
+  opts: SyntheticTranscriptOptions = {}
+): Promise<SyntheticTranscripts> {
+  const { sessions = 1000, exchangesPerSession = 10, largeSessionBytes = 5 * 1024 * 1024 } = opts;
+  await fs.mkdir(dir, { recursive: true });
+
+  const sessionIds: string[] = [];
+  let totalBytes = 0;
+
+  for (let n = 0; n < sessions; n++) {
+    const id = sessionId(n);
+    let content = headerLines(id);
+    for (let turn = 0; turn < exchangesPerSession; turn++) {
+      content += exchangeLines(id, turn, 2);
+    }
+    await fs.writeFile(path.join(dir, `${id}.jsonl`), content);
+    sessionIds.push(id);
+    totalBytes += Buffer.byteLength(content);
+  }
+
+  let largeSessionId: string | null = null;
+  if (largeSessionBytes > 0) {
+    largeSessionId = sessionId(sessions);
+    const parts = [headerLines(largeSessionId)];
+    let bytes = Buffer.byteLength(parts[0]);
+    for (let turn = 0; bytes < largeSessionBytes; turn++) {
+      const lines = exchangeLines(largeSessionId, turn, 8);
+      parts.push(lines);
+      bytes += Buffer.byteLength(lines);
+    }
+    await fs.writeFile(path.join(dir, `${largeSessionId}.jsonl`), parts.join(''));
+    sessionIds.push(largeSessionId);
+    totalBytes += bytes;
+  }
+
+  return { sessionIds, largeSessionId, totalBytes };
+}
@@ -9,6 +9,9 @@
  *   node sync-meetings.js              # Interactive mode - syncs new meetings
  *   node sync-meetings.js --all        # Re-sync all meetings (overwrite existing)
  *   node sync-meetings.js --dry-run    # Show what would be downloaded without downloading
+ *   node sync-meetings.js --concurrency 4  # Download with 4 browser pages in parallel
+ *
+ * Progress is saved after every meeting, so an interrupted run resumes where it stopped.
  *
  * Requirements:
  *   - Playwright installed: npm install playwright
@@ -38,6 +41,8 @@ const CONFIG = {
 
   // Sync settings
   maxMeetingsPerRun: 50,  // Limit meetings per sync run
+  concurrency: 3,         // Browser pages downloading in parallel (--concurrency N)
+  copyTimeout: 10000,     // Max wait for a clipboard copy to land
 };
 
 // State management
@@ -52,9 +57,47 @@ function loadState() {
   return { downloadedMeetings: {}, lastSync: null };
 }
 
+// Write to a temp file and rename so a crash mid-write never corrupts the state
 function saveState(state) {
   state.lastSync = new Date().toISOString();
-  fs.writeFileSync(CONFIG.stateFile, JSON.stringify(state, null, 2));
+  const tmpFile = `${CONFIG.stateFile}.${process.pid}.tmp`;
+  fs.writeFileSync(tmpFile, JSON.stringify(state, null, 2));
+  fs.renameSync(tmpFile, CONFIG.stateFile);
+}
+
+/**
+ * Serialize access to a shared resource. The system clipboard is shared by
+ * every page in the browser, so copy-then-read must not interleave between workers.
+ */
+function createMutex() {
+  let tail = Promise.resolve();
+  return async function withLock(fn) {
+    const run = tail.then(fn, fn);
+    tail = run.catch(() => {});
+    return run;
+  };
+}
+
+const withClipboard = createMutex();
+
+function formatDuration(ms) {
+  return `${(ms / 1000).toFixed(1)}s`;
+}
+
+function parseConcurrency(args) {
+  const index = args.findIndex(a => a === '--concurrency' || a.startsWith('--concurrency='));
+  if (index === -1) return CONFIG.concurrency;
+  const raw = args[index].includes('=') ? args[index].split('=')[1] : args[index + 1];
+  const value = parseInt(raw, 10);
+  return Number.isFinite(value) && value > 0 ? value : CONFIG.concurrency;
+}
+
+/**
+ * Wait for the network to go quiet, without failing on pages that keep
+ * long-lived connections open.
+ */
+async function waitForSettled(page, timeout = 10000) {
+  await page.waitForLoadState('networkidle', { timeout }).catch(() => {});
 }
 
 // Utility functions
@@ -168,7 +211,7 @@ async function handleCloudflareChallenge(page) {
     console.log('✅ Cloudflare challenge completed!');
     // Wait for the new page to fully load
     await page.waitForLoadState('domcontentloaded').catch(() => {});
-    await page.waitForTimeout(3000);  // Give page time to fully load
+    await waitForSettled(page);
   }
 }
 
@@ -177,10 +220,12 @@ async function main() {
   const args = process.argv.slice(2);
   const syncAll = args.includes('--all');
   const dryRun = args.includes('--dry-run');
+  const concurrency = parseConcurrency(args);
 
   console.log('🚀 SuperNormal Meeting Sync');
   console.log(`   Mode: ${syncAll ? 'Full sync (all meetings)' : 'Incremental sync (new only)'}`);
   console.log(`   Dry run: ${dryRun ? 'Yes' : 'No'}`);
+  console.log(`   Concurrency: ${concurrency} pages`);
   console.log('');
 
   const state = loadState();
@@ -216,8 +261,8 @@ async function main() {
     // Check for Cloudflare challenge
     await handleCloudflareChallenge(page);
 
-    // Give extra time for JavaScript to execute
-    await page.waitForTimeout(2000);
+    // Let the app finish its initial requests before checking login state
+    await waitForSettled(page);
 
     // Check if we're on the login page - use multiple indicators
     const currentUrl = page.url();
@@ -237,22 +282,12 @@ async function main() {
       console.log('');
 
       // Wait for login page elements to disappear (user completed login)
-      const startTime = Date.now();
       const maxWait = 300000;  // 5 minutes
-      while (Date.now() - startTime < maxWait) {
-        await page.waitForTimeout(2000);  // Check every 2 seconds
+      await page.locator('text="Sign in to Supernormal"').waitFor({ state: 'hidden', timeout: maxWait }).catch(() => {});
+      await page.locator('text="Continue with Google"').waitFor({ state: 'hidden', timeout: maxWait }).catch(() => {});
 
-        // Check if login elements are still visible
-        const stillOnLogin = await page.locator('text="Sign in to Supernormal"').isVisible().catch(() => false) ||
-                             await page.locator('text="Continue with Google"').isVisible().catch(() => false);
-
-        if (!stillOnLogin) {
-          break;
-        }
-      }
-
-      // Give the app time to load after login
-      await page.waitForTimeout(3000);
+      // Let the app load after login
+      await waitForSettled(page);
 
       // Persistent context automatically saves login state
       console.log('✅ Login successful! State saved in chrome-profile/.');
@@ -264,7 +299,6 @@ async function main() {
     console.log('📋 Loading meetings list...');
     await page.goto(CONFIG.meetingsUrl);
     await page.waitForLoadState('domcontentloaded');
-    await page.waitForTimeout(2000);
 
     // Wait for meetings to load - try multiple selectors
     console.log('   Waiting for meetings content...');
@@ -305,33 +339,13 @@ async function main() {
           console.log(`   ... and ${meetingsToSync.length - 10} more`);
         }
       } else {
-        // Step 5: Download each meeting
-        let successCount = 0;
-        let errorCount = 0;
-
-        for (let i = 0; i < Math.min(meetingsToSync.length, CONFIG.maxMeetingsPerRun); i++) {
-          const meeting = meetingsToSync[i];
-          console.log(`\n[${i + 1}/${meetingsToSync.length}] ${meeting.title}`);
-
-          try {
-            const result = await downloadMeeting(page, context, meeting);
-            state.downloadedMeetings[meeting.id] = {
-              downloadedAt: new Date().toISOString(),
-              outputPath: result.outputPath,
-            };
-            successCount++;
-            console.log(`   ✅ Saved to ${result.outputPath}`);
-          } catch (error) {
-            errorCount++;
-            console.error(`   ❌ Error: ${error.message}`);
-          }
-        }
-
-        // Save state
-        saveState(state);
+        // Step 5: Download meetings with a pool of pages
+        const batch = meetingsToSync.slice(0, CONFIG.maxMeetingsPerRun);
+        const { successCount, errorCount, timings } = await downloadAll(context, page, batch, state, concurrency);
 
         console.log('');
         console.log(`📊 Summary: ${successCount} downloaded, ${errorCount} errors`);
+        printTimingSummary(timings);
       }
     }
 
@@ -393,42 +407,133 @@ async function extractMeetings(page) {
   return meetings;
 }
 
-async function downloadMeeting(page, context, meeting) {
+/**
+ * Download meetings using up to `concurrency` pages that pull from a shared queue.
+ * State is saved after each meeting so a rerun skips everything already done.
+ */
+async function downloadAll(context, firstPage, meetings, state, concurrency) {
+  const total = meetings.length;
+  const timings = [];
+  let next = 0;
+  let successCount = 0;
+  let errorCount = 0;
+
+  const pageCount = Math.min(concurrency, total);
+  const pages = [firstPage];
+  for (let i = 1; i < pageCount; i++) {
+    const page = await context.newPage();
+    page.setDefaultTimeout(CONFIG.timeout);
+    pages.push(page);
+  }
+
+  // Grant once up front rather than per copy
+  await context.grantPermissions(['clipboard-read', 'clipboard-write']);
+
+  async function worker(page) {
+    while (next < total) {
+      const index = next++;
+      const meeting = meetings[index];
+      const prefix = `[${index + 1}/${total}]`;
+      const log = (message) => console.log(`${prefix} ${message}`);
+
+      log(meeting.title);
+      try {
+        const result = await downloadMeeting(page, context, meeting, log);
+        state.downloadedMeetings[meeting.id] = {
+          downloadedAt: new Date().toISOString(),
+          outputPath: result.outputPath,
+        };
+        saveState(state);
+        successCount++;
+        timings.push({ title: meeting.title, ...result.timing });
+        log(`✅ Saved to ${result.outputPath}`);
+        log(`⏱  ${formatTiming(result.timing)}`);
+      } catch (error) {
+        errorCount++;
+        console.error(`${prefix} ❌ Error: ${error.message}`);
+      }
+    }
+  }
+
+  try {
+    await Promise.all(pages.map(worker));
+  } finally {
+    await Promise.all(pages.slice(1).map(p => p.close().catch(() => {})));
+  }
+
+  return { successCount, errorCount, timings };
+}
+
+function formatTiming(timing) {
+  return [
+    `load ${formatDuration(timing.load)}`,
+    `notes ${formatDuration(timing.notes)}`,
+    `transcript ${formatDuration(timing.transcript)}`,
+    `write ${formatDuration(timing.write)}`,
+    `total ${formatDuration(timing.total)}`,
+  ].join(' · ');
+}
+
+function printTimingSummary(timings) {
+  if (timings.length === 0) return;
+  const phases = ['load', 'notes', 'transcript', 'write', 'total'];
+  const averages = phases.map(phase => {
+    const avg = timings.reduce((sum, t) => sum + t[phase], 0) / timings.length;
+    return `${phase} ${formatDuration(avg)}`;
+  });
+  const slowest = timings.reduce((a, b) => (b.total > a.total ? b : a));
+  console.log(`⏱  Average per meeting: ${averages.join(' · ')}`);
+  console.log(`   Slowest: ${slowest.title} (${formatDuration(slowest.total)})`);
+}
+
+async function downloadMeeting(page, context, meeting, log = console.log) {
+  const started = Date.now();
+  const timing = {};
+  let phaseStart = started;
+  const endPhase = (name) => {
+    const now = Date.now();
+    timing[name] = now - phaseStart;
+    phaseStart = now;
+  };
+
   // Navigate to meeting page
   await page.goto(meeting.url);
   await page.waitForLoadState('domcontentloaded');
-  await page.waitForTimeout(2000);
-
-  // Wait for meeting content to load - use multiple indicators
-  // The page takes a few seconds to fully render after navigation
-  await page.waitForTimeout(3000);  // Initial wait for React to render
 
-  // Try multiple selectors for meeting content
+  // Wait for meeting content to render
   try {
     await page.waitForSelector('button:has-text("Notes"), [role="banner"], input[placeholder*="title" i], textbox[placeholder*="title" i]', { timeout: 30000 });
   } catch (e) {
-    // If standard selectors fail, just wait a bit more and proceed
-    console.log('   Waiting for page to fully load...');
-    await page.waitForTimeout(5000);
+    // If standard selectors fail, wait for the network to settle and proceed
+    log('   Waiting for page to fully load...');
+    await waitForSettled(page);
   }
+  endPhase('load');
 
   // Extract notes using clipboard (more reliable than DOM scraping)
-  console.log('   📝 Extracting notes via clipboard...');
-  const notesText = await copyContentViaMenu(page, context, 'Copy notes');
+  log('   📝 Extracting notes via clipboard...');
+  const notesText = await copyContentViaMenu(page, context, 'Copy notes', log);
+  endPhase('notes');
+
+  if (!notesText) {
+    // Fail the meeting rather than save empty notes and mark it downloaded
+    throw new Error('Could not copy notes');
+  }
 
   // Extract transcript using clipboard
-  console.log('   📜 Extracting transcript via clipboard...');
-  const transcriptText = await copyContentViaMenu(page, context, 'Copy transcript');
+  log('   📜 Extracting transcript via clipboard...');
+  const transcriptText = await copyContentViaMenu(page, context, 'Copy transcript', log);
+  endPhase('transcript');
 
   // Extract attendees from both sources
   const attendeesFromNotes = extractAttendeesFromNotes(notesText);
   const attendeesFromTranscript = extractAttendeesFromTranscript(transcriptText);
   const allAttendees = [...new Set([...attendeesFromNotes, ...attendeesFromTranscript])];
-  console.log(`   👥 Detected attendees: ${allAttendees.join(', ') || 'none'}`);
+  log(`   👥 Detected attendees: ${allAttendees.join(', ') || 'none'}`);
 
   // Detect company from content and attendees
   const company = detectCompany(allAttendees, notesText, transcriptText);
-  console.log(`   🏢 Detected company: ${company || 'unknown'}`);
+  log(`   🏢 Detected company: ${company || 'unknown'}`);
 
   // Extract meeting time from notes header (line 2 usually has "Wednesday, January 7th @ 11:15 AM")
   let meetingTime = '';
@@ -441,7 +546,7 @@ async function downloadMeeting(page, context, meeting) {
 
   // Extract clean meeting title
   const meetingTitle = extractMeetingTitle(notesText, meeting.title);
-  console.log(`   📋 Meeting title: ${meetingTitle}`);
+  log(`   📋 Meeting title: ${meetingTitle}`);
 
   // Get meeting metadata (enhanced)
   const metadata = await extractMetadata(page, meeting);
@@ -489,22 +594,21 @@ async function downloadMeeting(page, context, meeting) {
     const meetingContent = formatMeetingMarkdown(notesText, metadata);
     fs.writeFileSync(meetingFilePath, meetingContent);
   }
+  endPhase('write');
+  timing.total = Date.now() - started;
 
-  return { outputPath: outputDir };
+  return { outputPath: outputDir, timing };
 }
 
 /**
  * Click the menu button and copy content via "Copy notes" or "Copy transcript" button
  * Uses clipboard API for reliable content extraction
  */
-async function copyContentViaMenu(page, context, menuItemText) {
+async function copyContentViaMenu(page, context, menuItemText, log = console.log) {
   try {
-    // Grant clipboard permissions
-    await context.grantPermissions(['clipboard-read', 'clipboard-write']);
-
     // Strategy: Find all clickable buttons in the page header, try each until we find
     // one that opens a menu containing "Copy notes"
-    const menuOpened = await openMeetingMenu(page);
+    const menuOpened = await openMeetingMenu(page, log);
     if (!menuOpened) {
       throw new Error('Could not open meeting menu');
     }
@@ -515,34 +619,43 @@ async function copyContentViaMenu(page, context, menuItemText) {
 
     if (!menuItemVisible) {
       // Menu might have closed, try opening again
-      await openMeetingMenu(page);
+      await openMeetingMenu(page, log);
     }
 
-    await menuItem.click();
-    await page.waitForTimeout(500);  // Wait for copy to complete
+    // The clipboard is shared by every page, so hold it from clearing it through reading it back
+    const clipboard = createClipboardReader(page, context);
+    const clipboardContent = await withClipboard(async () => {
+      await page.bringToFront();
+      const cleared = await page.evaluate(() => navigator.clipboard.writeText('').then(() => true, () => false));
+
+      // If clearing failed, the clipboard still holds an earlier copy (possibly another
+      // meeting's), so only accept content that differs from what is there now
+      let before = await clipboard.read();
+      if (before === null) {
+        if (!cleared) throw new Error('clipboard can be neither cleared nor read');
+        before = '';
+      }
 
-    // Look for "Copied!" confirmation text that appears briefly
-    const copiedConfirmation = await page.locator('text=Copied').isVisible().catch(() => false);
-    if (copiedConfirmation) {
-      console.log(`   ✓ ${menuItemText} copied`);
-    }
+      await menuItem.click();
 
-    // Read from clipboard
-    const clipboardContent = await page.evaluate(async () => {
-      try {
-        return await navigator.clipboard.readText();
-      } catch (e) {
-        return null;
+      // Poll for the copy to land rather than sleeping a fixed time
+      const deadline = Date.now() + CONFIG.copyTimeout;
+      while (Date.now() < deadline) {
+        const current = await clipboard.read();
+        if (current && current !== before) {
+          log(`   ✓ ${menuItemText} copied`);
+          return current;
+        }
+        if (current === null && clipboard.unreadable) {
+          throw new Error('clipboard is unreadable (Clipboard API failed and CDP is unsupported)');
+        }
+        await page.waitForTimeout(100);
       }
-    });
 
-    if (clipboardContent) {
-      return clipboardContent;
-    }
+      throw new Error(`clipboard did not change after "${menuItemText}"`);
+    }).finally(() => clipboard.close());
 
-    // Fallback: try reading via CDP if direct clipboard access fails
-    console.log(`   ⚠️  Direct clipboard access failed, trying alternative method...`);
-    return await readClipboardViaCDP(context);
+    return clipboardContent;
 
   } catch (error) {
     console.warn(`   ⚠️  Could not copy via menu: ${error.message}`);
@@ -550,35 +663,64 @@ async function copyContentViaMenu(page, context, menuItemText) {
   }
 }
 
+const COPY_MENU_SELECTOR = '[role="menu"]:has-text("Copy notes"), [role="menuitem"]:has-text("Copy notes")';
+const OVERLAY_SELECTOR = '#menu-root div[role="presentation"]';
+
+/**
+ * Dismiss any open Radix popup by clicking its presentation overlay, and wait for it to go.
+ * SuperNormal uses Radix UI which creates this overlay when any popup is open, and it
+ * intercepts ALL pointer events until dismissed.
+ */
+async function dismissOverlay(page, { escape = false } = {}) {
+  const overlayClicked = await page.evaluate((selector) => {
+    const overlay = document.querySelector(selector);
+    if (overlay) {
+      overlay.click();
+      return true;
+    }
+    return false;
+  }, OVERLAY_SELECTOR);
+
+  if (escape) {
+    await page.keyboard.press('Escape');
+  }
+  if (overlayClicked || escape) {
+    await page.locator(OVERLAY_SELECTOR).waitFor({ state: 'detached', timeout: 1000 }).catch(() => {});
+  }
+}
+
+/**
+ * Click a candidate menu button and wait briefly for the meeting menu.
+ * Closes whatever opened if it was the wrong menu.
+ */
+async function tryMenuButton(page, btn) {
+  await dismissOverlay(page);
+  await btn.click();
+
+  const menuAppeared = await page.locator(COPY_MENU_SELECTOR).first()
+    .waitFor({ state: 'visible', timeout: 1500 })
+    .then(() => true)
+    .catch(() => false);
+
+  if (!menuAppeared) {
+    await dismissOverlay(page, { escape: true });
+  }
+  return menuAppeared;
+}
+
 /**
  * Find and open the meeting options menu (contains Copy notes, Copy transcript, etc.)
  * Returns true if menu was successfully opened
  */
-async function openMeetingMenu(page) {
+async function openMeetingMenu(page, log = console.log) {
   // First, check if menu is already open
   const menuAlreadyOpen = await page.locator('[role="menu"]:has-text("Copy notes")').isVisible().catch(() => false);
   if (menuAlreadyOpen) {
     return true;
   }
 
-  // CRITICAL: Dismiss any existing overlays by clicking on the #menu-root overlay
-  // SuperNormal uses Radix UI which creates a presentation overlay when any popup is open
-  // This overlay intercepts ALL pointer events until dismissed
-  const overlayDismissed = await page.evaluate(() => {
-    const overlay = document.querySelector('#menu-root div[role="presentation"]');
-    if (overlay) {
-      overlay.click();
-      return true;
-    }
-    return false;
-  });
-  if (overlayDismissed) {
-    await page.waitForTimeout(300);
-  }
-
-  // Also press Escape to close any menus
-  await page.keyboard.press('Escape');
-  await page.waitForTimeout(200);
+  // CRITICAL: Dismiss any existing overlays, and press Escape to close any menus
+  await dismissOverlay(page, { escape: true });
 
   // Strategy 1: Find the banner and click the SECOND button (menu button)
   // In SuperNormal's UI:
@@ -590,7 +732,7 @@ async function openMeetingMenu(page) {
   if (bannerExists) {
     // Get all buttons in the banner
     const buttons = await banner.locator('button').all();
-    console.log(`   Found ${buttons.length} buttons in banner`);
+    log(`   Found ${buttons.length} buttons in banner`);
 
     // The menu button is typically the SECOND button (index 1)
     // But we should also check by position - it's after the Integrations button
@@ -603,35 +745,15 @@ async function openMeetingMenu(page) {
       // Skip buttons with text (the menu button has no visible text)
       if (text.trim().length > 2) continue;
 
-      console.log(`   Trying banner button ${i}...`);
-
-      // Dismiss overlay again before clicking (in case one appeared)
-      await page.evaluate(() => {
-        const overlay = document.querySelector('#menu-root div[role="presentation"]');
-        if (overlay) overlay.click();
-      });
-      await page.waitForTimeout(100);
+      log(`   Trying banner button ${i}...`);
 
       try {
-        await btn.click();
-        await page.waitForTimeout(500);
-
-        // Check if the correct menu appeared
-        const menuAppeared = await page.locator('[role="menu"]:has-text("Copy notes"), [role="menuitem"]:has-text("Copy notes")').isVisible().catch(() => false);
-        if (menuAppeared) {
-          console.log(`   ✓ Menu opened via banner button ${i}`);
+        if (await tryMenuButton(page, btn)) {
+          log(`   ✓ Menu opened via banner button ${i}`);
           return true;
         }
-
-        // Close any wrong menu that opened
-        await page.evaluate(() => {
-          const overlay = document.querySelector('#menu-root div[role="presentation"]');
-          if (overlay) overlay.click();
-        });
-        await page.keyboard.press('Escape');
-        await page.waitForTimeout(200);
       } catch (e) {
-        console.log(`   Click failed: ${e.message.slice(0, 50)}`);
+        log(`   Click failed: ${e.message.slice(0, 50)}`);
       }
     }
   }
@@ -645,7 +767,7 @@ async function openMeetingMenu(page) {
     const container = meetingsLink.locator('xpath=ancestor::*[3]');
     const buttons = await container.locator('button').all();
 
-    console.log(`   Found ${buttons.length} buttons near breadcrumb`);
+    log(`   Found ${buttons.length} buttons near breadcrumb`);
 
     // Try buttons from the end (menu button is usually last or second-to-last)
     for (let i = buttons.length - 1; i >= 0; i--) {
@@ -656,29 +778,11 @@ async function openMeetingMenu(page) {
       const text = await btn.textContent().catch(() => '');
       if (text.trim().length > 5) continue;
 
-      // Dismiss overlay before clicking
-      await page.evaluate(() => {
-        const overlay = document.querySelector('#menu-root div[role="presentation"]');
-        if (overlay) overlay.click();
-      });
-      await page.waitForTimeout(100);
-
       try {
-        await btn.click();
-        await page.waitForTimeout(500);
-
-        const menuAppeared = await page.locator('[role="menu"]:has-text("Copy notes")').isVisible().catch(() => false);
-        if (menuAppeared) {
-          console.log(`   ✓ Menu opened via breadcrumb area button`);
+        if (await tryMenuButton(page, btn)) {
+          log(`   ✓ Menu opened via breadcrumb area button`);
           return true;
         }
-
-        await page.evaluate(() => {
-          const overlay = document.querySelector('#menu-root div[role="presentation"]');
-          if (overlay) overlay.click();
-        });
-        await page.keyboard.press('Escape');
-        await page.waitForTimeout(200);
       } catch (e) {
         // Try next button
       }
@@ -687,55 +791,73 @@ async function openMeetingMenu(page) {
 
   // Strategy 3: Direct selector for buttons with aria-haspopup="menu"
   const menuButtons = await page.locator('button[aria-haspopup="menu"]').all();
-  console.log(`   Found ${menuButtons.length} menu trigger buttons`);
+  log(`   Found ${menuButtons.length} menu trigger buttons`);
 
   for (const btn of menuButtons) {
     const isVisible = await btn.isVisible().catch(() => false);
     if (!isVisible) continue;
 
-    // Dismiss overlay before clicking
-    await page.evaluate(() => {
-      const overlay = document.querySelector('#menu-root div[role="presentation"]');
-      if (overlay) overlay.click();
-    });
-    await page.waitForTimeout(100);
-
     try {
-      await btn.click();
-      await page.waitForTimeout(500);
-
-      const menuAppeared = await page.locator('[role="menu"]:has-text("Copy notes")').isVisible().catch(() => false);
-      if (menuAppeared) {
-        console.log(`   ✓ Menu opened via aria-haspopup button`);
+      if (await tryMenuButton(page, btn)) {
+        log(`   ✓ Menu opened via aria-haspopup button`);
         return true;
       }
-
-      await page.evaluate(() => {
-        const overlay = document.querySelector('#menu-root div[role="presentation"]');
-        if (overlay) overlay.click();
-      });
-      await page.keyboard.press('Escape');
-      await page.waitForTimeout(200);
     } catch (e) {
       // Try next button
     }
   }
 
-  console.log(`   ⚠️ Could not find menu button`);
+  log(`   ⚠️ Could not find menu button`);
   return false;
 }
 
 /**
- * Fallback clipboard reading via Chrome DevTools Protocol
+ * Clipboard reader for one page: tries the Clipboard API, falling back to a
+ * single reused CDP session. `read()` returns null when neither works;
+ * `unreadable` is set once CDP has been found unsupported, so callers can
+ * stop polling. Call `close()` to detach the CDP session.
  */
-async function readClipboardViaCDP(context) {
-  try {
-    const cdpSession = await context.newCDPSession(await context.pages()[0]);
-    const { data } = await cdpSession.send('Browser.getClipboard', { mediaType: 'text/plain' });
-    return data;
-  } catch (e) {
-    return null;
-  }
+function createClipboardReader(page, context) {
+  let cdpSession = null;
+  let cdpUnsupported = false;
+
+  const reader = {
+    unreadable: false,
+
+    async read() {
+      const text = await page.evaluate(async () => {
+        try {
+          return await navigator.clipboard.readText();
+        } catch (e) {
+          return null;
+        }
+      });
+      if (text !== null) return text;
+      if (cdpUnsupported) {
+        reader.unreadable = true;
+        return null;
+      }
+
+      try {
+        cdpSession = cdpSession || await context.newCDPSession(page);
+        const { data } = await cdpSession.send('Browser.getClipboard', { mediaType: 'text/plain' });
+        return data;
+      } catch (e) {
+        // Missing methods and non-Chromium browsers won't start working mid-copy
+        if (!cdpSession || /wasn't found|not supported|only supported/i.test(e.message)) {
+          cdpUnsupported = true;
+          reader.unreadable = true;
+        }
+        return null;
+      }
+    },
+
+    async close() {
+      if (cdpSession) await cdpSession.detach().catch(() => {});
+      cdpSession = null;
+    },
+  };
+  return reader;
 }
 
 // NOTE: extractNotes() and extractTranscript() removed - now using clipboard-based extraction
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""LifeOS Heartbeat helper.
+
+Keeps an incremental index of vault frontmatter, tasks and links in
+state/heartbeat/vault-index.json, computes the heartbeat metrics from it,
+and owns all reads/writes of state/heartbeat/state.json for runner.sh.
+
+Only files whose mtime or size changed since the last run are re-parsed,
+so a run over an unchanged vault costs one directory walk.
+
+Usage:
+    heartbeat.py context                 Metrics + previous state, for the prompt
+    heartbeat.py metrics                 Metrics as JSON
+    heartbeat.py record STATUS           Save status and metrics to state.json
+    heartbeat.py cooldown MINUTES        Print "cooldown" if notified recently
+    heartbeat.py mark-notified           Record a notification timestamp
+
+Standard library only (runner.sh already depends on python3).
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+INDEX_VERSION = 2
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+VAULT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+WORKSPACE = os.path.join(VAULT_ROOT, "workspace")
+STATE_DIR = os.path.join(VAULT_ROOT, "state", "heartbeat")
+INDEX_FILE = os.path.join(STATE_DIR, "vault-index.json")
+STATE_FILE = os.path.join(STATE_DIR, "state.json")
+
+DAILY_DIR = "4-Daily"
+MEETINGS_DIR = "5-Meetings"
+INBOX_DIR = "0-Inbox"
+CURRENT_PROJECTS_DIR = os.path.join("1-Projects", "Current")
+
+# Open A-tasks in daily notes from this many previous days count as overdue
+OVERDUE_TASK_LOOKBACK_DAYS = 7
+# Projects without activity for this long count as stalled
+STALLED_PROJECT_DAYS = 14
+
+TASK_RE = re.compile(r"^\s*[-*]\s+\[([ xX])\]\s+(.*)$")
+LINK_RE = re.compile(r"\[\[([^\]|#]+)")
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+DUE_RE = re.compile(r"📅\s*(\d{4}-\d{2}-\d{2})")
+TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*([AaPp][Mm])?")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+PREP_HEADING_RE = re.compile(r"pre-meeting|prep", re.IGNORECASE)
+# End-of-day sections that list carried-over tasks, which stay unchecked by convention
+CARRYOVER_HEADING_RE = re.compile(
+    r"moved to tomorrow|planned for tomorrow|carr(?:y|ied)[ -]?(?:over|forward)|task review",
+    re.IGNORECASE,
+)
+# Synced meeting folders are named YYYY-MM-DD-HH-MM-{company}-{title}
+PATH_TIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}-(\d{2})-(\d{2})")
+# Files written alongside meeting.md by the SuperNormal sync
+MEETING_COMPANION_FILES = ("notes-supernormal.md", "transcript.md")
+PRIORITIES = {"🔴": "A", "🟡": "B", "🟢": "C", "🔵": "blocked"}
+
+
+# --- Parsing ---
+
+
+def parse_scalar(value):
+    value = value.strip()
+    if not value:
+        return None
+    if value[0] in "\"'":
+        end = value.find(value[0], 1)
+        return value[1:end] if end != -1 else value[1:]
+    value = value.split(" #", 1)[0].strip()
+    if value.startswith("[") and value.endswith("]"):
+        return [parse_scalar(v) for v in value[1:-1].split(",") if v.strip()]
+    if value in ("true", "false"):
+        return value == "true"
+    return value
+
+
+def parse_frontmatter(lines):
+    """Parse the flat YAML subset used by vault templates.
+
+    Handles scalars, quoted strings, inline lists and block lists. Nested
+    maps are skipped. Returns (frontmatter, index of first body line).
+    """
+    if not lines or lines[0].strip() != "---":
+        return {}, 0
+
+    data = {}
+    current_list = None
+    for i in range(1, len(lines)):
+        line = lines[i]
+        if line.strip() == "---":
+            return data, i + 1
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if line.startswith((" ", "\t", "-")):
+            item = line.strip()
+            if current_list is not None and item.startswith("- "):
+                current_list.append(parse_scalar(item[2:]))
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        parsed = parse_scalar(value)
+        if parsed is None:
+            current_list = []
+            data[key.strip()] = current_list
+        else:
+            current_list = None
+            data[key.strip()] = parsed
+
+    # Unterminated frontmatter - treat the whole file as body
+    return {}, 0
+
+
+def parse_task(match, carried_over=False):
+    text = match.group(2).strip()
+    priority = None
+    for marker, name in PRIORITIES.items():
+        if marker in text:
+            priority = name
+            break
+    due = DUE_RE.search(text)
+    return {
+        "done": match.group(1) != " ",
+        "priority": priority,
+        "due": due.group(1) if due else None,
+        "text": text[:200],
+        "carried_over": carried_over,
+    }
+
+
+def is_prep_content(line):
+    """True if a line in a prep section holds more than template scaffolding."""
+    text = line.strip()
+    text = re.sub(r"^[-*]\s+", "", text)
+    text = re.sub(r"^\[[ xX]\]\s*", "", text)
+    text = re.sub(r"^\*\*[^*]+\*\*:?", "", text).strip()
+    if not text or text in ("|", "---"):
+        return False
+    # Italic prompts like "*What do I need to know?*"
+    if text.startswith("*") and text.endswith("*"):
+        return False
+    return True
+
+
+def parse_note(path, is_meeting):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        lines = f.read().splitlines()
+
+    frontmatter, body_start = parse_frontmatter(lines)
+    tasks = []
+    links = set()
+    has_prep = False
+    prep_level = None
+    carryover_level = None
+
+    for line in lines[body_start:]:
+        heading = HEADING_RE.match(line)
+        if heading:
+            level = len(heading.group(1))
+            if carryover_level is not None and level <= carryover_level:
+                carryover_level = None
+            if carryover_level is None and CARRYOVER_HEADING_RE.search(heading.group(2)):
+                carryover_level = level
+
+        task = TASK_RE.match(line)
+        if task:
+            tasks.append(parse_task(task, carryover_level is not None))
+        links.update(m.strip() for m in LINK_RE.findall(line))
+
+        if is_meeting:
+            if heading:
+                level = len(heading.group(1))
+                if PREP_HEADING_RE.search(heading.group(2)):
+                    if prep_level is None or level <= prep_level:
+                        prep_level = level
+                elif prep_level is not None and level <= prep_level:
+                    prep_level = None
+            elif prep_level is not None and is_prep_content(line):
+                has_prep = True
+
+    note = {
+        "frontmatter": frontmatter,
+        "tasks": tasks,
+        "links": sorted(links),
+    }
+    if is_meeting:
+        note["has_prep"] = has_prep
+    return note
+
+
+# --- Index ---
+
+
+def load_index():
+    try:
+        with open(INDEX_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == INDEX_VERSION:
+            return data
+    except (OSError, ValueError):
+        pass  # Missing or corrupt - rebuild
+    return {"version": INDEX_VERSION, "files": {}, "other_files": {}}
+
+
+def write_json_atomic(path, data, indent=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def update_index():
+    """Walk the workspace and re-parse notes whose mtime or size changed."""
+    index = load_index()
+    old_files = index["files"]
+    files = {}
+    other_files = {}
+    changed = False
+
+    for root, dirs, names in os.walk(WORKSPACE):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in names:
+            if name.startswith("."):
+                continue
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, WORKSPACE)
+            if not name.endswith(".md"):
+                other_files[rel] = True
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # Removed while walking
+
+            entry = old_files.get(rel)
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                files[rel] = entry
+                continue
+
+            try:
+                note = parse_note(path, rel.startswith(MEETINGS_DIR + os.sep))
+            except OSError:
+                continue
+            note.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+            files[rel] = note
+            changed = True
+
+    if changed or files.keys() != old_files.keys() or other_files != index.get("other_files"):
+        index = {"version": INDEX_VERSION, "files": files, "other_files": other_files}
+        write_json_atomic(INDEX_FILE, index)
+    return index
+
+
+# --- Metrics ---
+
+
+def parse_date(value):
+    match = DATE_RE.search(value) if isinstance(value, str) else None
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+
+
+def parse_time(value):
+    match = TIME_RE.search(value) if isinstance(value, str) else None
+    if not match:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    if meridiem:
+        hour = hour % 12 + (12 if meridiem.lower() == "pm" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute
+
+
+def in_dir(rel, directory):
+    return rel.startswith(directory + os.sep)
+
+
+def task_key(text):
+    """Normalise task text so a task copied into another day's note matches."""
+    text = DUE_RE.sub("", text)
+    for marker in PRIORITIES:
+        text = text.replace(marker, "")
+    text = re.sub(r"^\s*\d+\.\s*", "", text)
+    return " ".join(text.lower().split())
+
+
+def is_project_note(rel, note):
+    """True for a current project's main note.
+
+    Simple projects are one note directly in Current/. A complex project is a
+    folder, and only its entry point (entry_point: true, or the note named
+    after the folder) stands for the project.
+    """
+    fm = note["frontmatter"]
+    if fm.get("type") != "project":
+        return False
+    parts = os.path.relpath(rel, CURRENT_PROJECTS_DIR).split(os.sep)
+    if len(parts) == 1:
+        return True
+    return fm.get("entry_point") is True or os.path.splitext(parts[-1])[0] == parts[-2]
+
+
+def meeting_title(rel, fm):
+    if fm.get("title"):
+        return fm["title"]
+    name = os.path.splitext(os.path.basename(rel))[0]
+    # Synced meetings are meeting.md inside a folder named after the meeting
+    return os.path.basename(os.path.dirname(rel)) if name == "meeting" else name
+
+
+def meeting_start(rel, fm):
+    """Start time from frontmatter, else from a YYYY-MM-DD-HH-MM file or folder name."""
+    start = parse_time(fm.get("time"))
+    if start:
+        return start
+    match = PATH_TIME_RE.search(rel)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2))
+        if hour <= 23 and minute <= 59:
+            return hour, minute
+    return None
+
+
+def compute_metrics(index, now=None):
+    now = now or datetime.now()
+    today = now.date()
+    files = index["files"]
+
+    daily_rel = os.path.join(DAILY_DIR, f"{today.isoformat()}.md")
+    daily = files.get(daily_rel)
+    a_tasks = sum(1 for t in daily["tasks"] if t["priority"] == "A" and not t["done"]) if daily else 0
+
+    # Open A-tasks left behind on earlier days. Carry-over sections are skipped,
+    # and so is anything already copied into today's note or counted for a later day.
+    seen = {task_key(t["text"]) for t in daily["tasks"]} if daily else set()
+    overdue_a_tasks = 0
+    for day in range(1, OVERDUE_TASK_LOOKBACK_DAYS + 1):
+        note = files.get(os.path.join(DAILY_DIR, f"{(today - timedelta(days=day)).isoformat()}.md"))
+        if not note:
+            continue
+        for t in note["tasks"]:
+            if t["priority"] != "A" or t["done"] or t.get("carried_over"):
+                continue
+            key = task_key(t["text"])
+            if key not in seen:
+                seen.add(key)
+                overdue_a_tasks += 1
+
+    inbox_count = sum(1 for rel in files if in_dir(rel, INBOX_DIR))
+    inbox_count += sum(1 for rel in index.get("other_files", {}) if in_dir(rel, INBOX_DIR))
+
+    overdue_projects = []
+    stalled_projects = []
+    for rel, note in files.items():
+        if not in_dir(rel, CURRENT_PROJECTS_DIR) or not is_project_note(rel, note):
+            continue
+        fm = note["frontmatter"]
+        if fm.get("status") in ("completed", "done"):
+            continue
+        title = fm.get("title") or os.path.splitext(os.path.basename(rel))[0]
+        deadline = parse_date(fm.get("deadline")) or parse_date(fm.get("target_date"))
+        if deadline and deadline < today:
+            overdue_projects.append(title)
+        last_activity = parse_date(fm.get("last_activity"))
+        modified = datetime.fromtimestamp(note["mtime_ns"] / 1e9).date()
+        latest = max(d for d in (last_activity, modified) if d)
+        if (today - latest).days >= STALLED_PROJECT_DAYS:
+            stalled_projects.append(title)
+
+    next_meeting = None
+    untimed_meetings = []
+    for rel, note in files.items():
+        if not in_dir(rel, MEETINGS_DIR) or os.path.basename(rel) in MEETING_COMPANION_FILES:
+            continue
+        fm = note["frontmatter"]
+        meeting_date = parse_date(fm.get("date")) or parse_date(rel)
+        if meeting_date != today:
+            continue
+        title = meeting_title(rel, fm)
+        has_prep = note.get("has_prep", False)
+        start = meeting_start(rel, fm)
+        if not start:
+            # Can't tell if it is still ahead, so report it rather than drop it
+            untimed_meetings.append({"title": title, "has_prep": has_prep})
+            continue
+        starts_at = datetime.combine(today, datetime.min.time()).replace(hour=start[0], minute=start[1])
+        if starts_at < now:
+            continue
+        if next_meeting is None or starts_at < next_meeting["starts_at"]:
+            next_meeting = {"title": title, "starts_at": starts_at, "has_prep": has_prep}
+
+    metrics = {
+        "daily_note_exists": daily is not None,
+        "a_tasks": a_tasks,
+        "overdue_a_tasks": overdue_a_tasks,
+        "inbox_count": inbox_count,
+        "overdue_projects": len(overdue_projects),
+        "overdue_project_names": sorted(overdue_projects),
+        "stalled_projects": len(stalled_projects),
+        "stalled_project_names": sorted(stalled_projects),
+        "next_meeting": None,
+        "next_meeting_in_minutes": None,
+        "next_meeting_has_prep": None,
+        "untimed_meetings_today": sorted(untimed_meetings, key=lambda m: m["title"]),
+    }
+    if next_meeting:
+        metrics["next_meeting"] = f"{next_meeting['title']} at {next_meeting['starts_at'].strftime('%H:%M')}"
+        metrics["next_meeting_in_minutes"] = int((next_meeting["starts_at"] - now).total_seconds() // 60)
+        metrics["next_meeting_has_prep"] = next_meeting["has_prep"]
+    return metrics
+
+
+# --- State ---
+
+
+def load_state():
+    try:
+        with open(STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def utc_now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def format_metrics(metrics):
+    lines = [
+        f"- Daily note exists: {metrics['daily_note_exists']}",
+        f"- Open A-tasks today: {metrics['a_tasks']}",
+        f"- Open A-tasks from the previous {OVERDUE_TASK_LOOKBACK_DAYS} days: {metrics['overdue_a_tasks']}",
+        f"- Inbox count: {metrics['inbox_count']}",
+        f"- Overdue projects: {metrics['overdue_projects']}"
+        + (f" ({', '.join(metrics['overdue_project_names'])})" if metrics["overdue_project_names"] else ""),
+        f"- Stalled projects ({STALLED_PROJECT_DAYS}+ days): {metrics['stalled_projects']}"
+        + (f" ({', '.join(metrics['stalled_project_names'])})" if metrics["stalled_project_names"] else ""),
+    ]
+    if metrics["next_meeting"]:
+        lines.append(
+            f"- Next meeting note: {metrics['next_meeting']} "
+            f"(in {metrics['next_meeting_in_minutes']} min, has prep: {metrics['next_meeting_has_prep']})"
+        )
+    else:
+        lines.append("- Next meeting note: none later today")
+    for meeting in metrics.get("untimed_meetings_today", []):
+        lines.append(f"- Meeting note today, time unknown: {meeting['title']} (has prep: {meeting['has_prep']})")
+    return "\n".join(lines)
+
+
+def format_state(data):
+    lines = [f"- Last check: {data.get('last_updated', 'unknown')}"]
+    lc = data.get("last_check") or {}
+    if lc:
+        lines.append(f"- Daily note exists: {lc.get('daily_note_exists', 'unknown')}")
+        lines.append(f"- A-tasks: {lc.get('a_tasks', 'unknown')}")
+        lines.append(f"- Inbox count: {lc.get('inbox_count', 'unknown')}")
+        lines.append(f"- Overdue projects: {lc.get('overdue_projects', 'unknown')}")
+        if lc.get("next_meeting"):
+            lines.append(
+                f"- Next meeting: {lc.get('next_meeting')} "
+                f"(has prep: {lc.get('next_meeting_has_prep', 'unknown')})"
+            )
+    if data.get("alerts"):
+        lines.append("- Recent alerts:")
+        for a in data["alerts"][:3]:
+            lines.append(f"  - {a.get('type')}: sent {a.get('count', 1)}x, last at {a.get('last_sent', 'unknown')}")
+    if data.get("suppressed"):
+        lines.append("- Suppressed:")
+        for s in data["suppressed"]:
+            lines.append(f"  - {s.get('type')} until {s.get('until')}")
+    return "\n".join(lines)
+
+
+# --- Commands ---
+
+
+def cmd_context(_args):
+    metrics = compute_metrics(update_index())
+    print("VAULT METRICS (precomputed from the vault index - do not re-check these by reading files):")
+    print(format_metrics(metrics))
+    print()
+    state = load_state()
+    if state is None:
+        print("PREVIOUS STATE: First run - no previous state available.")
+    else:
+        print("PREVIOUS STATE (from last heartbeat):")
+        print(format_state(state))
+
+
+def cmd_metrics(_args):
+    print(json.dumps(compute_metrics(update_index()), indent=2))
+
+
+def cmd_record(args):
+    state = load_state() or {"alerts": [], "suppressed": []}
+    state["last_updated"] = utc_now()
+    state["last_status"] = args.status
+    state["last_check"] = compute_metrics(update_index())
+    write_json_atomic(STATE_FILE, state, indent=2)
+
+
+def cmd_cooldown(args):
+    last = (load_state() or {}).get("last_notification")
+    if not last:
+        return
+    last_dt = datetime.fromisoformat(last.replace("Z", "+00:00"))
+    if datetime.now(last_dt.tzinfo) - last_dt < timedelta(minutes=args.minutes):
+        print("cooldown")
+
+
+def cmd_mark_notified(_args):
+    state = load_state() or {"alerts": [], "suppressed": []}
+    state["last_notification"] = utc_now()
+    write_json_atomic(STATE_FILE, state, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LifeOS heartbeat vault index and state helper")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("context").set_defaults(func=cmd_context)
+    sub.add_parser("metrics").set_defaults(func=cmd_metrics)
+    record = sub.add_parser("record")
+    record.add_argument("status")
+    record.set_defaults(func=cmd_record)
+    cooldown = sub.add_parser("cooldown")
+    cooldown.add_argument("minutes", type=int)
+    cooldown.set_defaults(func=cmd_cooldown)
+    sub.add_parser("mark-notified").set_defaults(func=cmd_mark_notified)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -82,39 +82,16 @@ if [[ "$TODAY_RUNS" -ge "$MAX_DAILY_RUNS" ]]; then
   exit 0
 fi
 
-# --- Read previous state ---
-
-PREVIOUS_STATE=""
-if [[ -f "$STATE_FILE" ]]; then
-  # Format state.json as readable text for Claude
-  PREVIOUS_STATE=$(cat <<EOF
-PREVIOUS STATE (from last heartbeat):
-$(cat "$STATE_FILE" | python3 -c "
-import json, sys
-data = json.load(sys.stdin)
-print(f\"- Last check: {data.get('last_updated', 'unknown')}\")
-if 'last_check' in data:
-  lc = data['last_check']
-  print(f\"- Daily note exists: {lc.get('daily_note_exists', 'unknown')}\")
-  print(f\"- A-tasks: {lc.get('a_tasks', 'unknown')}\")
-  print(f\"- Inbox count: {lc.get('inbox_count', 'unknown')}\")
-  print(f\"- Overdue projects: {lc.get('overdue_projects', 'unknown')}\")
-  if lc.get('next_meeting'):
-    print(f\"- Next meeting: {lc.get('next_meeting')} (has prep: {lc.get('next_meeting_has_prep', 'unknown')})\")
-if data.get('alerts'):
-  print('- Recent alerts:')
-  for a in data['alerts'][:3]:
-    print(f\"  - {a.get('type')}: sent {a.get('count', 1)}x, last at {a.get('last_sent', 'unknown')}\")
-if data.get('suppressed'):
-  print('- Suppressed:')
-  for s in data['suppressed']:
-    print(f\"  - {s.get('type')} until {s.get('until')}\")
-" 2>/dev/null || echo "- (Could not parse previous state)")
-EOF
-)
-else
-  PREVIOUS_STATE="PREVIOUS STATE: First run - no previous state available."
-fi
+# --- Vault metrics and previous state ---
+
+# heartbeat.py refreshes the vault index (re-parsing only changed notes) and
+# computes the checklist metrics, so Claude doesn't have to crawl the vault
+HEARTBEAT_PY="$SCRIPT_DIR/heartbeat.py"
+
+CONTEXT=$(python3 "$HEARTBEAT_PY" context 2>>"$LOG_FILE") || {
+  log "WARNING: Could not compute vault metrics"
+  CONTEXT="VAULT METRICS: unavailable - check the vault directly."
+}
 
 # --- Build prompt ---
 
@@ -123,7 +100,7 @@ PROMPT=$(cat <<EOF
 $CHECKLIST
 
 ---
-$PREVIOUS_STATE
+$CONTEXT
 ---
 
 Current date/time: $(date '+%Y-%m-%d %H:%M:%S')
@@ -177,26 +154,8 @@ done <<< "$CLAUDE_OUTPUT"
 
 # --- Update state.json ---
 
-# This is a simplified update - a more robust version would parse all fields
-NOW=$(date -u '+%Y-%m-%dT%H:%M:%SZ')
-if [[ ! -f "$STATE_FILE" ]]; then
-  echo '{"last_updated":"'"$NOW"'","alerts":[],"suppressed":[],"last_check":{}}' > "$STATE_FILE"
-fi
-
-# Update last_updated timestamp using Python for safe JSON manipulation
-python3 -c "
-import json
-from datetime import datetime
-
-with open('$STATE_FILE', 'r') as f:
-    data = json.load(f)
-
-data['last_updated'] = '$NOW'
-data['last_status'] = '$STATUS'
-
-with open('$STATE_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-" 2>/dev/null || log "WARNING: Could not update state.json"
+# Records status plus this run's metrics as last_check for the next comparison
+python3 "$HEARTBEAT_PY" record "$STATUS" 2>>"$LOG_FILE" || log "WARNING: Could not update state.json"
 
 # --- Append to runs.jsonl ---
 
@@ -206,23 +165,7 @@ echo "{\"date\":\"$TODAY\",\"time\":\"$(date '+%H:%M:%S')\",\"status\":\"$STATUS
 
 if [[ "$STATUS" == "ALERT" && "$MACOS_NOTIFY" == "true" ]]; then
   # Check cooldown - don't spam notifications
-  LAST_NOTIFIED=""
-  if [[ -f "$STATE_FILE" ]]; then
-    LAST_NOTIFIED=$(python3 -c "
-import json
-from datetime import datetime, timedelta
-
-with open('$STATE_FILE', 'r') as f:
-    data = json.load(f)
-
-last = data.get('last_notification')
-if last:
-    last_dt = datetime.fromisoformat(last.replace('Z', '+00:00'))
-    cooldown = timedelta(minutes=$COOLDOWN_MINUTES)
-    if datetime.now(last_dt.tzinfo) - last_dt < cooldown:
-        print('cooldown')
-" 2>/dev/null || echo "")
-  fi
+  LAST_NOTIFIED=$(python3 "$HEARTBEAT_PY" cooldown "$COOLDOWN_MINUTES" 2>/dev/null || echo "")
 
   if [[ "$LAST_NOTIFIED" != "cooldown" ]]; then
     # Format first alert for notification
@@ -232,18 +175,7 @@ if last:
       log "Sent macOS notification"
 
       # Update last_notification timestamp
-      python3 -c "
-import json
-from datetime import datetime
-
-with open('$STATE_FILE', 'r') as f:
-    data = json.load(f)
-
-data['last_notification'] = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
-
-with open('$STATE_FILE', 'w') as f:
-    json.dump(data, f, indent=2)
-" 2>/dev/null
+      python3 "$HEARTBEAT_PY" mark-notified 2>/dev/null || log "WARNING: Could not record notification"
     fi
   else
     log "Notification suppressed (cooldown active)"